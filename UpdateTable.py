@@ -1,9 +1,184 @@
-from modules.calc_tables.CalcTable import calc_table
-from modules.create_html.CreateHtml import make_html_from_json
+"""
+Command line entry point.
 
-def main():
-    calc_table()
-    make_html_from_json()
+    python UpdateTable.py [all]        fetch, calc and render (the daily job)
+    python UpdateTable.py fetch        print the current standings
+    python UpdateTable.py calc         fetch + write today's snapshot
+    python UpdateTable.py render       re-render table.html from the latest snapshot
+    python UpdateTable.py batch        one fetch, then calc + render for every players/*.json group
+    python UpdateTable.py live         long-running matchday mode (adaptive polling)
+    python UpdateTable.py serve        HTTP server for the latest snapshot (hot reload)
+    python UpdateTable.py site         build the static archive site
+    python UpdateTable.py history      list snapshots / a player's season
+
+Every subcommand imports only what it needs: render, site, serve and history run
+on the standard library alone and never load pandas, numpy or selenium.
+
+PLT_CASSETTE_MODE=record|replay|auto records API responses and page sources
+to cassettes/ or serves them from there, e.g. for offline runs, tests and
+benchmarks (see modules.get_data.Cassette).
+"""
+import argparse
+import os
+import sys
+
+from modules.common.BasePath import get_base_path
+from modules.common.RunLog import start_run, finish_run
+
+def run_log_path():
+    # PLT_RUN_LOG overrides the default logs/runs.jsonl
+    return os.environ.get("PLT_RUN_LOG") or os.path.join(get_base_path(), "logs", "runs.jsonl")
+
+def cmd_fetch(args):
+    from modules.get_data.FetchStandings import fetch_standings
+    table = fetch_standings(args.source, lean=not args.debug, parser=args.parser, budget_s=args.budget)
+    print(table.to_text())
+
+def cmd_calc(args):
+    from modules.calc_tables.CalcTable import calc_table
+    calc_table(force=args.force)
+
+def cmd_render(args):
+    if args.client:
+        from modules.create_html.ClientPage import make_client_page
+        print(make_client_page(out_dir=args.out))
+        return
+    from modules.create_html.CreateHtml import make_html_from_json
+    print(make_html_from_json())
+
+def cmd_all(args):
+    from modules.calc_tables.CalcTable import calc_table
+    # Only re-render when a new snapshot was written
+    if calc_table(force=args.force):
+        from modules.create_html.CreateHtml import make_html_from_json
+        make_html_from_json()
+
+def cmd_batch(args):
+    from modules.calc_tables.CalcBatch import calc_groups
+    calc_groups(args.groups or None, force=args.force, workers=args.workers)
+
+def cmd_live(args):
+    from modules.live.LiveDaemon import run_live
+    run_live(args.group, args.source, args.once)
+
+def cmd_serve(args):
+    from modules.serve.StandingsServer import run_server
+    run_server(args.host, args.port, args.group, args.history)
+
+def cmd_site(args):
+    from modules.create_html.BuildSite import build_site
+    build_site(args.out, args.workers, args.rebuild)
+
+def cmd_history(args):
+    from modules.archive.SnapshotCatalog import get_catalog
+    from modules.create_html.CreateHtml import load_series
+
+    base_path = get_base_path()
+    entries = get_catalog(os.path.join(base_path, "data")).between(args.start, args.end)
+    series = load_series(base_path) or {"dates": [], "players": {}}
+    day_index = {day: i for i, day in enumerate(series["dates"])}
+
+    if args.player:
+        player = series["players"].get(args.player)
+        if player is None:
+            print(f"No series for player '{args.player}'. Known: {', '.join(series['players'])}")
+            return 1
+        print(f"{'date':<12}{'pos':>5}{'points':>8}{'GD':>6}")
+        for entry in entries:
+            i = day_index.get(entry["date"])
+            if i is not None and player["Points"][i] is not None:
+                print(f"{entry['date']:<12}{player['position'][i]:>5}{player['Points'][i]:>8}{player['GD'][i]:>6}")
+        return 0
+
+    for entry in entries:
+        i = day_index.get(entry["date"])
+        leader = ""
+        if i is not None:
+            leader = next((f"{name} ({s['Points'][i]})" for name, s in series["players"].items()
+                           if s["position"][i] == 1), "")
+        print(f"{entry['date']:<12}{entry['size']:>8} B  {leader}")
+    print(f"{len(entries)} snapshots")
+    return 0
+
+# subcommands that write a run log
+LOGGED = {"all", "calc", "render", "batch"}
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Premier League tipping game tables.")
+    parser.add_argument("--profile", action="store_true", help="run under cProfile (also: PLT_PROFILE=1)")
+    sub = parser.add_subparsers(dest="command")
+
+    p = sub.add_parser("all", help="fetch, calc and render (default)")
+    p.add_argument("--force", action="store_true", help="write a snapshot even if nothing changed")
+    p.set_defaults(func=cmd_all)
+
+    p = sub.add_parser("fetch", help="print the current standings")
+    p.add_argument("--source", choices=["auto", "race", "api", "page", "static"], default="auto")
+    p.add_argument("--budget", type=float, help="total seconds for all sources and retries")
+    p.add_argument("--parser", choices=["lxml", "bs4"], default="lxml")
+    p.add_argument("--debug", action="store_true", help="use the slow debug browser profile")
+    p.set_defaults(func=cmd_fetch)
+
+    p = sub.add_parser("calc", help="fetch and write today's snapshot")
+    p.add_argument("--force", action="store_true", help="write a snapshot even if nothing changed")
+    p.set_defaults(func=cmd_calc)
+
+    p = sub.add_parser("render", help="re-render table.html from the latest snapshot")
+    p.add_argument("--client", action="store_true",
+                   help="write the client-rendered page (app/index.html + lazy JSON chunks) instead")
+    p.add_argument("--out", help="output directory for --client (default: app/)")
+    p.set_defaults(func=cmd_render)
+
+    p = sub.add_parser("batch", help="fetch once, then calc and render every group in players/")
+    p.add_argument("groups", nargs="*", help="group names (players/<name>.json; default: all)")
+    p.add_argument("--force", action="store_true", help="write snapshots even if nothing changed")
+    p.add_argument("--workers", type=int, help="worker processes (default: one per group, up to all cores)")
+    p.set_defaults(func=cmd_batch)
+
+    p = sub.add_parser("live", help="poll during matches and keep live.html up to date")
+    p.add_argument("--group", default="players", help="players/<group>.json (default: players)")
+    p.add_argument("--source", choices=["auto", "api", "page"], default="auto")
+    p.add_argument("--once", action="store_true", help="poll and render once, then exit")
+    p.set_defaults(func=cmd_live)
+
+    p = sub.add_parser("serve", help="serve the latest snapshot over HTTP (JSON + HTML)")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8080)
+    p.add_argument("--group", default="players", help="players/<group>.json (default: players)")
+    p.add_argument("--history", action="store_true", help="also serve the season series (/api/history)")
+    p.set_defaults(func=cmd_serve)
+
+    p = sub.add_parser("site", help="build the static archive site")
+    p.add_argument("--out", help="output directory (default: site/)")
+    p.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    p.add_argument("--rebuild", action="store_true", help="ignore the build cache")
+    p.set_defaults(func=cmd_site)
+
+    p = sub.add_parser("history", help="list snapshots or one player's season")
+    p.add_argument("--from", dest="start", help="first date (YYYY-MM-DD)")
+    p.add_argument("--to", dest="end", help="last date (YYYY-MM-DD)")
+    p.add_argument("--player", help="show this player's position and points per day")
+    p.set_defaults(func=cmd_history)
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        args = parser.parse_args((["--profile"] if args.profile else []) + ["all"])
+
+    if args.command not in LOGGED:
+        return args.func(args)
+
+    # profile=None: decided by the PLT_PROFILE environment variable
+    start_run(run_log_path(), args.command, True if args.profile else None)
+    status = "error"
+    try:
+        result = args.func(args)
+        status = "ok"
+        return result
+    finally:
+        finish_run(status)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
@@ -0,0 +1,21 @@
+# Usage: python -m benchmarks.bench_player_tables [n_players ...]
+import sys
+import time
+
+from modules.calc_tables.CalcPlayerTables import build_player_tables
+from benchmarks.synthetic import synthetic_players, synthetic_table
+
+def bench(n_players, repeat=3):
+    table = synthetic_table()
+    player_teams = synthetic_players(n_players, list(table["Team"]))
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build_player_tables(table, player_teams)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+if __name__ == "__main__":
+    sizes = [int(n) for n in sys.argv[1:]] or [2, 1_000, 100_000]
+    for n in sizes:
+        print(f"build_player_tables players={n:>7}: {bench(n, repeat=1 if n >= 100_000 else 3) * 1000:10.1f} ms")
@@ -0,0 +1,245 @@
+"""
+Offline benchmark suite for the daily pipeline.
+
+    python -m benchmarks.run_benchmarks [--quick] [--out FILE] [--baseline FILE]
+
+Stages: standings parsing (every *.html under benchmarks/fixtures/ and
+every page source recorded in tests/cassettes/update_all, or a synthetic
+page if there is none), the api and page standings fetches replayed from
+those cassettes (a replay miss fails the run), build_player_tables
+(DataFrame and compact Standings paths), the calc_table snapshot dump and
+load (schema v1 and v2), infer_table / render_table / full page rendering
+over the data/*.json snapshots, and synthetic leagues of N players x M
+teams x D days of history. Nothing touches the network or starts a browser.
+
+Results go to a JSON file; with --baseline, any stage slower than the
+baseline by more than --threshold (and --min-delta-ms) is reported and the exit code is 1.
+"""
+import argparse
+import glob
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+from datetime import datetime, timezone
+
+from benchmarks.synthetic import standings_html, synthetic_players, synthetic_rows, synthetic_table, write_history
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(REPO, "benchmarks", "fixtures")
+# recorded by tests/record_cassette.py; the same cassettes the tests replay
+CASSETTE_DIR = os.path.join(REPO, "tests", "cassettes", "update_all")
+
+def measure(fn, repeat=5):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {"best_s": min(times), "mean_s": sum(times) / len(times), "repeat": repeat}
+
+class Suite:
+    def __init__(self, repeat):
+        self.repeat = repeat
+        self.results = []
+
+    def run(self, name, fn, repeat=None, **params):
+        result = {"name": name, "params": params, **measure(fn, repeat or self.repeat)}
+        self.results.append(result)
+        label = " ".join(f"{k}={v}" for k, v in params.items())
+        print(f"{name:<28} {label:<36} best {result['best_s'] * 1000:10.2f} ms")
+        return result
+
+def recorded_pages(cassette_dir=CASSETTE_DIR):
+    """{label: html} of the page sources recorded in cassettes/ (see modules.get_data.Cassette)."""
+    from modules.get_data.Cassette import Cassettes
+
+    store = Cassettes(cassette_dir)
+    pages = {}
+    for key, entry in store.entries():
+        if entry.get("kind") == "page":
+            pages[f"cassette-{key[:12]}"] = store.load(key)[1].decode("utf-8")
+    return pages
+
+def bench_parsing(suite):
+    from modules.get_data.ParseStandings import PARSERS
+
+    pages = {os.path.basename(p): open(p, encoding="utf-8").read()
+             for p in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.html")))}
+    pages.update(recorded_pages())
+    if not pages:
+        pages = {"synthetic-20": standings_html(synthetic_rows(20)),
+                 "synthetic-1000": standings_html(synthetic_rows(1000))}
+    for page, html in pages.items():
+        for parser, parse in PARSERS.items():
+            suite.run("parse_standings", lambda: parse(html), page=page, parser=parser)
+
+def bench_player_tables(suite, sizes):
+    from modules.calc_tables.CalcPlayerTables import build_player_tables
+
+    table = synthetic_table()
+    for n in sizes:
+        player_teams = synthetic_players(n, list(table["Team"]))
+        suite.run("build_player_tables", lambda: build_player_tables(table, player_teams),
+                  repeat=1 if n >= 100_000 else None, players=n)
+
+def bench_player_standings(suite, sizes):
+    from modules.calc_tables.CalcPlayerStandings import build_player_standings
+    from modules.core.Standings import Standings
+
+    standings = Standings.from_records(synthetic_rows())
+    for n in sizes:
+        player_teams = synthetic_players(n, [row.Team for row in standings])
+        suite.run("build_player_standings", lambda: build_player_standings(standings, player_teams),
+                  repeat=1 if n >= 100_000 else None, players=n)
+
+def bench_snapshot_dump(suite, sizes, tmp):
+    from modules.calc_tables.CalcPlayerStandings import build_player_standings
+    from modules.archive.SnapshotFormat import build_compact_snapshot, load_snapshot
+    from modules.calc_tables.CalcTable import build_snapshot, write_snapshot
+    from modules.core.Standings import Standings
+
+    standings = Standings.from_records(synthetic_rows())
+    path = os.path.join(tmp, "dump.json")
+    for n in sizes:
+        player_teams = synthetic_players(n, [row.Team for row in standings])
+        player_tables, summary = build_player_standings(standings, player_teams)
+        builders = {1: lambda: build_snapshot(player_tables, summary),
+                    2: lambda: build_compact_snapshot(standings, player_teams, summary)}
+        for schema, build in builders.items():
+            suite.run("calc_table_json_dump", lambda: write_snapshot(build(), path), players=n, schema=schema)
+            suite.run("snapshot_load", lambda: load_snapshot(path), players=n, schema=schema,
+                      bytes=os.path.getsize(path))
+
+def bench_rendering(suite, data_dir, label):
+    from modules.archive.SnapshotFormat import load_snapshot
+    from modules.create_html.CreateHtml import infer_table, render_table, render_snapshot_html
+
+    snapshots = []
+    for path in sorted(glob.glob(os.path.join(data_dir, "*.json"))):
+        snapshots.append((os.path.basename(path)[:-5], load_snapshot(path)))
+    if not snapshots:
+        return
+    _, latest = snapshots[-1]
+
+    def infer_all():
+        for _, data in snapshots:
+            infer_table(data["summary"])
+            for rows in data["players"].values():
+                infer_table(rows)
+
+    suite.run("infer_table", infer_all, history=label, snapshots=len(snapshots))
+    cols, rows = infer_table(latest["summary"])
+    suite.run("render_table", lambda: render_table(cols, rows), history=label, rows=len(rows))
+    suite.run("render_snapshot_html", lambda: render_snapshot_html(latest), history=label)
+
+def recorded_sources(cassette_dir=CASSETTE_DIR):
+    """
+    {source: fetch} replaying what the cassettes hold: the API base and the
+    table page URL are read from the recorded requests, so the sources ask
+    for exactly what was recorded.
+    """
+    from modules.get_data.Cassette import Cassettes
+    from modules.get_data.FetchOrchestrator import api_source, page_source
+
+    sources = {}
+    for _, entry in Cassettes(cassette_dir).entries():
+        url = entry["url"]
+        if entry.get("kind") == "http" and "/standings?" in url:
+            sources["api"] = api_source(url[:url.rindex("/standings?")])
+        elif entry.get("kind") == "page":
+            sources["page"] = page_source(entry["url"])
+    missing = {"api", "page"} - set(sources)
+    if missing:
+        raise RuntimeError(f"No {' or '.join(sorted(missing))} recording in {cassette_dir} "
+                           "(re-record with python tests/record_cassette.py)")
+    return sources
+
+def bench_replay(suite, cassette_dir=CASSETTE_DIR):
+    """Standings fetch + parse served from the recorded cassettes; a replay miss fails the run."""
+    from modules.get_data.FetchOrchestrator import fetch_first_valid
+
+    saved = {k: os.environ.get(k) for k in ("PLT_CASSETTE_MODE", "PLT_CASSETTE_DIR")}
+    os.environ.update({"PLT_CASSETTE_MODE": "replay", "PLT_CASSETTE_DIR": cassette_dir})
+    try:
+        for source, fetch in recorded_sources(cassette_dir).items():
+            # one attempt: a CassetteMiss is an error here, not something to retry
+            suite.run("replay_fetch", lambda: fetch_first_valid({source: fetch}, 5, 0, attempts=1), source=source)
+    finally:
+        for k, v in saved.items():
+            if v is None:
+                os.environ.pop(k, None)
+            else:
+                os.environ[k] = v
+
+def bench_synthetic_leagues(suite, leagues, tmp):
+    from modules.archive.SeasonArchive import import_json_history, load_archive
+
+    for n_players, n_teams, n_days in leagues:
+        label = f"{n_players}x{n_teams}x{n_days}"
+        data_dir = os.path.join(tmp, f"data-{label}")
+        archive_dir = os.path.join(tmp, f"archive-{label}")
+        suite.run("write_history", lambda: write_history(data_dir, n_players, n_teams, n_days), repeat=1,
+                  players=n_players, teams=n_teams, days=n_days)
+        bench_rendering(suite, data_dir, label)
+        suite.run("import_json_history", lambda: import_json_history(data_dir, archive_dir), repeat=1,
+                  players=n_players, teams=n_teams, days=n_days)
+        suite.run("load_archive", lambda: load_archive(archive_dir).stats["Points"].sum(),
+                  players=n_players, teams=n_teams, days=n_days)
+
+def compare(results, baseline_path, threshold, min_delta):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["name"], json.dumps(r["params"], sort_keys=True)): r for r in json.load(f)["results"]}
+    regressions = []
+    for r in results:
+        base = baseline.get((r["name"], json.dumps(r["params"], sort_keys=True)))
+        # sub-millisecond stages jitter by more than any sane threshold
+        if base and r["best_s"] > base["best_s"] * (1 + threshold) and r["best_s"] - base["best_s"] > min_delta:
+            regressions.append((r, base))
+    for r, base in regressions:
+        print(f"REGRESSION {r['name']} {r['params']}: "
+              f"{base['best_s'] * 1000:.2f} ms -> {r['best_s'] * 1000:.2f} ms")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Offline benchmarks of the pipeline stages.")
+    parser.add_argument("--quick", action="store_true", help="small sizes only (for CI)")
+    parser.add_argument("--out", default=os.path.join(REPO, "benchmarks", "results.json"))
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)")
+    parser.add_argument("--min-delta-ms", type=float, default=1.0, help="ignore slowdowns smaller than this")
+    args = parser.parse_args(argv)
+
+    suite = Suite(repeat=3 if args.quick else 5)
+    player_sizes = [2, 1_000] if args.quick else [2, 1_000, 100_000]
+    leagues = [(2, 20, 30)] if args.quick else [(2, 20, 365), (100, 20, 365), (1_000, 60, 30)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bench_parsing(suite)
+        bench_replay(suite)
+        bench_player_tables(suite, player_sizes)
+        bench_player_standings(suite, player_sizes)
+        bench_snapshot_dump(suite, player_sizes[:2], tmp)
+        bench_rendering(suite, os.path.join(REPO, "data"), "data")
+        bench_synthetic_leagues(suite, leagues, tmp)
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": suite.results,
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(suite.results)} results to {args.out}")
+
+    if args.baseline and compare(suite.results, args.baseline, args.threshold, args.min_delta_ms / 1000):
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
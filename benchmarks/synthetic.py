@@ -0,0 +1,97 @@
+import os
+import random
+
+from datetime import date, timedelta
+from html import escape
+
+import pandas as pd
+
+STAT_TESTIDS = [
+    ("Played", "standingsRowStatPlayed"), ("Won", "standingsRowStatWon"),
+    ("Drawn", "standingsRowStatDrawn"), ("Lost", "standingsRowStatLost"),
+    ("GF", "standingsRowStatGoalFor"), ("GA", "standingsRowStatGoalAgainst"),
+    ("GD", "standingsRowStatGoalDifference"), ("Points", "standingsRowPoints"),
+]
+
+def synthetic_rows(n_teams=20, seed=0, games=None):
+    """Standings rows in get_premier_league_table's schema, sorted like the real table."""
+    rnd = random.Random(seed)
+    rows = []
+    for i in range(n_teams):
+        played = games if games is not None else rnd.randint(5, 38)
+        won = rnd.randint(0, played)
+        drawn = rnd.randint(0, played - won)
+        lost = played - won - drawn
+        gf, ga = rnd.randint(played, 3 * played), rnd.randint(played, 3 * played)
+        rows.append({
+            "Pos": 0, "Team": f"Team {i:03d}", "Played": played, "Won": won, "Drawn": drawn,
+            "Lost": lost, "GF": gf, "GA": ga, "GD": gf - ga, "Points": 3 * won + drawn,
+            "Next": f"Team {(i + 1) % n_teams:03d}",
+        })
+    rows.sort(key=lambda r: (-r["Points"], -r["GD"], -r["GF"]))
+    for pos, row in enumerate(rows, start=1):
+        row["Pos"] = pos
+    return rows
+
+def synthetic_table(n_teams=20, seed=0):
+    return pd.DataFrame(synthetic_rows(n_teams, seed))
+
+def synthetic_players(n_players, teams, per_player=5, seed=0):
+    rnd = random.Random(seed)
+    per_player = min(per_player, len(teams))
+    return {f"Player {p}": rnd.sample(teams, per_player) for p in range(n_players)}
+
+def standings_html(rows):
+    """
+    premierleague.com-like page around a standings table, using the
+    selectors and data-testids the parsers rely on. Stands in for a
+    recorded page when none is available.
+    """
+    trs = []
+    for r in rows:
+        stats = "".join(
+            f'<td class="standings-row__stat"><span data-testid="{tid}">{r[col]}</span></td>'
+            for col, tid in STAT_TESTIDS
+        )
+        team = escape(r["Team"])
+        trs.append(
+            '<tr data-testid="standingsRow" class="standings-row">'
+            f'<td><span data-testid="standingsRowPosition">{r["Pos"]}</span>'
+            f'<span class="standings-row__position">{r["Pos"]}</span></td>'
+            f'<td><img src="badge.png" alt="{team} club badge">'
+            f'<span data-testid="standingsTeamName">{team}</span>'
+            f'<span class="standings-row__team-name-short">{team[:3].upper()}</span></td>'
+            f'{stats}'
+            '<td data-testid="standingsRowForm"><span>W</span><span>D</span><span>L</span></td>'
+            f'<td data-testid="standingsRowNextTeam"><a href="#"><img src="next.png" alt="{escape(r["Next"])} club badge"></a></td>'
+            '</tr>'
+        )
+    return (
+        '<!doctype html><html><head><title>Tables</title><script>window.x = 1;</script></head><body>'
+        '<header><nav><a href="/">Home</a></nav></header>'
+        '<div class="standings__table-container"><table class="standings-table">'
+        '<thead><tr><th>Pos</th><th>Team</th></tr></thead>'
+        f'<tbody>{"".join(trs)}</tbody></table></div>'
+        '<footer>footer</footer></body></html>'
+    )
+
+def write_history(data_dir, n_players, n_teams, n_days, start=date(2025, 8, 15), seed=0):
+    """
+    D days of snapshots in calc_table's format (v2) for a league of N
+    players and M teams. Returns the list of written paths.
+    """
+    from modules.archive.SnapshotFormat import build_compact_snapshot
+    from modules.calc_tables.CalcPlayerStandings import build_player_standings
+    from modules.calc_tables.CalcTable import write_snapshot
+    from modules.core.Standings import Standings
+
+    os.makedirs(data_dir, exist_ok=True)
+    player_teams = synthetic_players(n_players, [f"Team {i:03d}" for i in range(n_teams)], seed=seed)
+    paths = []
+    for d in range(n_days):
+        standings = Standings.from_records(synthetic_rows(n_teams, seed=seed + d, games=min(38, d // 3 + 1)))
+        _, summary = build_player_standings(standings, player_teams)
+        path = os.path.join(data_dir, f"{(start + timedelta(days=d)).isoformat()}.json")
+        write_snapshot(build_compact_snapshot(standings, player_teams, summary), path)
+        paths.append(path)
+    return paths
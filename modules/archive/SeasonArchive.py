@@ -0,0 +1,241 @@
+import json
+import os
+import sys
+
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+
+from modules.common.BasePath import get_base_path
+from modules.archive.SnapshotFormat import load_snapshot
+
+ARCHIVE_VERSION = 1
+
+STAT_COLUMNS = ["Pos", "Played", "Won", "Drawn", "Lost", "GF", "GA", "GD", "Points"]
+
+# One fixed-width record per (date, team); dates are days since 1970-01-01
+STATS_DTYPE = np.dtype([("date", "<i4"), ("team", "<i2")] + [(c, "<i2") for c in STAT_COLUMNS])
+
+# One record per (date, player, team) the player had that day
+MEMBERS_DTYPE = np.dtype([("date", "<i4"), ("player", "<i4"), ("team", "<i2")])
+
+# stored for stats the source did not provide (None / NaN)
+MISSING = -32768
+
+EPOCH = date(1970, 1, 1).toordinal()
+
+def day_number(day):
+    return day.toordinal() - EPOCH
+
+def day_from_number(n):
+    return date.fromordinal(int(n) + EPOCH)
+
+def get_archive_dir():
+    return os.path.join(get_base_path(), "archive")
+
+def stat_value(v):
+    if v is None or v != v:  # None or NaN
+        return MISSING
+    return int(v)
+
+class SeasonArchive:
+    """
+    Append-only columnar archive of the season.
+
+    archive/stats.bin    STATS_DTYPE records, sorted by date
+    archive/members.bin  MEMBERS_DTYPE records, sorted by date
+    archive/meta.json    team and player name indexes
+
+    Both .bin files are raw record arrays and are memory-mapped on load, so
+    opening the full season history costs a couple of milliseconds. The
+    archive is derived from data/*.json and is not kept in git; see
+    ensure_archive.
+    """
+
+    def __init__(self, archive_dir=None):
+        self.archive_dir = archive_dir or get_archive_dir()
+        self.meta_path = os.path.join(self.archive_dir, "meta.json")
+        self.stats_path = os.path.join(self.archive_dir, "stats.bin")
+        self.members_path = os.path.join(self.archive_dir, "members.bin")
+
+        meta = {}
+        if os.path.exists(self.meta_path):
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("version") != ARCHIVE_VERSION:
+                raise ValueError(f"Unsupported archive version {meta.get('version')} in {self.meta_path}")
+        self.teams = meta.get("teams", [])
+        self.players = meta.get("players", [])
+        self.team_index = {name: i for i, name in enumerate(self.teams)}
+        self.player_index = {name: i for i, name in enumerate(self.players)}
+
+        self.stats = self.map_records(self.stats_path, STATS_DTYPE)
+        self.members = self.map_records(self.members_path, MEMBERS_DTYPE)
+
+    @staticmethod
+    def map_records(path, dtype):
+        # np.memmap refuses empty files
+        if not os.path.exists(path) or os.path.getsize(path) < dtype.itemsize:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r")
+
+    def dates(self):
+        return [day_from_number(n) for n in np.unique(self.stats["date"])]
+
+    def last_date(self):
+        if len(self.stats) == 0:
+            return None
+        return day_from_number(self.stats["date"][-1])
+
+    def day_range(self, records, day):
+        n = day_number(day)
+        dates = records["date"]
+        return int(np.searchsorted(dates, n, "left")), int(np.searchsorted(dates, n, "right"))
+
+    def stats_for(self, day):
+        start, end = self.day_range(self.stats, day)
+        return self.stats[start:end]
+
+    def members_for(self, day):
+        start, end = self.day_range(self.members, day)
+        return self.members[start:end]
+
+    def stats_since(self, day):
+        # records strictly after day (all records if day is None)
+        if day is None:
+            return self.stats
+        return self.stats[np.searchsorted(self.stats["date"], day_number(day), "right"):]
+
+    def members_since(self, day):
+        if day is None:
+            return self.members
+        return self.members[np.searchsorted(self.members["date"], day_number(day), "right"):]
+
+    def table_rows(self, day):
+        """Rows of that day as dicts with Team and STAT_COLUMNS keys (None for missing stats)."""
+        rows = []
+        for rec in self.stats_for(day):
+            row = {"Team": self.teams[rec["team"]]}
+            for c in STAT_COLUMNS:
+                v = int(rec[c])
+                row[c] = None if v == MISSING else v
+            rows.append(row)
+        return rows
+
+    def player_teams(self, day):
+        result = {}
+        for rec in self.members_for(day):
+            result.setdefault(self.players[rec["player"]], []).append(self.teams[rec["team"]])
+        return result
+
+    def intern(self, names, index, value):
+        if value not in index:
+            index[value] = len(names)
+            names.append(value)
+        return index[value]
+
+    def append(self, day, table_rows, player_teams):
+        """
+        Append one day: table_rows are standings dicts (Team + stat columns),
+        player_teams is {player: [team, ...]}. Re-appending the last archived
+        day replaces it; days before it are rejected.
+        """
+        last = self.last_date()
+        if last is not None and day < last:
+            raise ValueError(f"Archive is append-only: {day} is before the last archived day {last}.")
+
+        n = day_number(day)
+        stats = np.zeros(len(table_rows), dtype=STATS_DTYPE)
+        for i, row in enumerate(table_rows):
+            stats[i]["date"] = n
+            stats[i]["team"] = self.intern(self.teams, self.team_index, row["Team"])
+            for c in STAT_COLUMNS:
+                stats[i][c] = stat_value(row.get(c))
+
+        today_teams = {row["Team"] for row in table_rows}
+        members = [(n, self.intern(self.players, self.player_index, player), self.team_index[team])
+                   for player, team_names in player_teams.items()
+                   for team in team_names if team in today_teams]
+        members = np.array(members, dtype=MEMBERS_DTYPE)
+
+        os.makedirs(self.archive_dir, exist_ok=True)
+        # names first: an index that knows a few unused names is harmless
+        with open(self.meta_path, "w", encoding="utf-8") as f:
+            json.dump({"version": ARCHIVE_VERSION, "teams": self.teams, "players": self.players},
+                      f, indent=2, ensure_ascii=False)
+
+        if last == day:
+            # re-run on the same day: cut that day off the tail first
+            keep_stats = int(np.searchsorted(self.stats["date"], n, "left"))
+            keep_members = int(np.searchsorted(self.members["date"], n, "left"))
+            # drop the maps before shrinking the files under them
+            self.stats = self.members = None
+            os.truncate(self.stats_path, keep_stats * STATS_DTYPE.itemsize)
+            os.truncate(self.members_path, keep_members * MEMBERS_DTYPE.itemsize)
+        with open(self.stats_path, "ab") as f:
+            f.write(stats.tobytes())
+        with open(self.members_path, "ab") as f:
+            f.write(members.tobytes())
+
+        self.stats = self.map_records(self.stats_path, STATS_DTYPE)
+        self.members = self.map_records(self.members_path, MEMBERS_DTYPE)
+
+def append_snapshot(day, table_rows, player_teams, archive_dir=None):
+    archive = SeasonArchive(archive_dir)
+    archive.append(day, table_rows, player_teams)
+    return archive
+
+def load_archive(archive_dir=None):
+    return SeasonArchive(archive_dir)
+
+def import_json_history(data_dir=None, archive_dir=None):
+    """
+    One-shot import of the data/YYYY-MM-DD.json snapshots into a fresh archive.
+
+    v1 snapshots only hold the players' team rows, so those days archive
+    the union of the players' teams rather than the whole league.
+    """
+    data_dir = data_dir or os.path.join(get_base_path(), "data")
+    archive_dir = archive_dir or get_archive_dir()
+    for name in ("meta.json", "stats.bin", "members.bin"):
+        path = os.path.join(archive_dir, name)
+        if os.path.exists(path):
+            os.remove(path)
+
+    archive = SeasonArchive(archive_dir)
+    imported = 0
+    for path in sorted(Path(data_dir).glob("*.json")):
+        try:
+            day = date.fromisoformat(path.stem)
+        except ValueError:
+            continue
+        data = load_snapshot(str(path))
+
+        rows = {}
+        player_teams = {}
+        for player, team_rows in data.get("players", {}).items():
+            player_teams[player] = [r["Team"] for r in team_rows]
+            for r in team_rows:
+                rows.setdefault(r["Team"], r)
+        # v2 snapshots carry the whole league, v1 only the players' teams
+        table_rows = data.get("table") or sorted(rows.values(), key=lambda r: (r.get("Pos") is None, r.get("Pos")))
+        archive.append(day, table_rows, player_teams)
+        imported += 1
+    return imported
+
+def ensure_archive(data_dir=None, archive_dir=None):
+    """
+    Import the snapshot history if there is no archive yet (a fresh
+    checkout or CI run: archive/ is rebuilt, never committed). Returns the
+    number of imported snapshots, 0 if the archive already existed.
+    """
+    archive_dir = archive_dir or get_archive_dir()
+    if os.path.exists(os.path.join(archive_dir, "meta.json")):
+        return 0
+    return import_json_history(data_dir, archive_dir)
+
+if __name__ == "__main__":
+    # python -m modules.archive.SeasonArchive [data_dir] [archive_dir]
+    n = import_json_history(*sys.argv[1:3])
+    print(f"Imported {n} snapshots")
@@ -0,0 +1,131 @@
+import json
+import os
+import sys
+
+from datetime import date
+
+import numpy as np
+
+from modules.archive.SeasonArchive import MISSING, load_archive, day_from_number, get_archive_dir
+
+SERIES_VERSION = 1
+
+TEAM_FIELDS = ["Pos", "Points", "GD"]
+PLAYER_FIELDS = ["position", "Points", "GD", "GF"]
+
+def series_path(archive_dir=None):
+    return os.path.join(archive_dir or get_archive_dir(), "series.json")
+
+def empty_series():
+    return {"version": SERIES_VERSION, "dates": [], "teams": {}, "players": {}}
+
+def load_series(path):
+    """Cached series state, or an empty one if missing or from another version."""
+    if not os.path.exists(path):
+        return empty_series()
+    with open(path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    if state.get("version") != SERIES_VERSION:
+        return empty_series()
+    return state
+
+def drop_last_day(state):
+    state["dates"].pop()
+    for group in ("teams", "players"):
+        for series in state[group].values():
+            for values in series.values():
+                values.pop()
+
+def add_day(state, day, team_values, player_values):
+    """
+    Append one day to every series. team_values / player_values map a name
+    to {field: value}; entities without a value that day get None, so every
+    list stays aligned with state["dates"].
+    """
+    n_before = len(state["dates"])
+    state["dates"].append(day.isoformat())
+    for group, fields, values in (("teams", TEAM_FIELDS, team_values),
+                                  ("players", PLAYER_FIELDS, player_values)):
+        for name in values:
+            if name not in state[group]:
+                state[group][name] = {f: [None] * n_before for f in fields}
+        for name, series in state[group].items():
+            day_values = values.get(name, {})
+            for f in fields:
+                series[f].append(day_values.get(f))
+
+def day_values(archive, stats, members):
+    """Team and player values of one day from its archive records."""
+    team_values = {}
+    for rec in stats:
+        team_values[archive.teams[rec["team"]]] = {
+            f: (None if int(rec[f]) == MISSING else int(rec[f])) for f in TEAM_FIELDS
+        }
+
+    if len(members) == 0:
+        return team_values, {}
+
+    # row of each team id in this day's stats (-1 = not in the table)
+    row_of = np.full(len(archive.teams), -1, dtype=np.int64)
+    row_of[stats["team"]] = np.arange(len(stats))
+    rows = row_of[members["team"]]
+    present = rows >= 0
+    players = members["player"][present]
+    rows = rows[present]
+
+    totals = {}
+    for f in ("Points", "GD", "GF"):
+        col = stats[f].astype(np.int64)
+        col[col == MISSING] = 0
+        totals[f] = np.bincount(players, weights=col[rows], minlength=len(archive.players)).astype(np.int64)
+
+    ids = np.unique(players)
+    # rank by Points, GD, GF (descending), ties keep player order like build_player_tables
+    order = ids[np.lexsort((-totals["GF"][ids], -totals["GD"][ids], -totals["Points"][ids]))]
+    player_values = {}
+    for position, pid in enumerate(order.tolist(), start=1):
+        player_values[archive.players[pid]] = {
+            "position": position,
+            "Points": int(totals["Points"][pid]),
+            "GD": int(totals["GD"][pid]),
+            "GF": int(totals["GF"][pid]),
+        }
+    return team_values, player_values
+
+def update_series(archive_dir=None):
+    """
+    Bring archive/series.json up to date with the season archive.
+
+    Only archive records after the cached state's second-to-last day are
+    read: the last cached day is always recomputed (a same-day re-run may
+    have replaced it), everything before it is kept as is.
+    """
+    archive = load_archive(archive_dir)
+    path = series_path(archive.archive_dir)
+    state = load_series(path)
+
+    last_archived = archive.last_date()
+    if state["dates"] and (last_archived is None or date.fromisoformat(state["dates"][-1]) > last_archived):
+        # archive was rebuilt behind our back
+        state = empty_series()
+    if state["dates"]:
+        drop_last_day(state)
+    since = date.fromisoformat(state["dates"][-1]) if state["dates"] else None
+
+    stats = archive.stats_since(since)
+    members = archive.members_since(since)
+    days, stat_starts = np.unique(stats["date"], return_index=True)
+    stat_ends = list(stat_starts[1:]) + [len(stats)]
+    for n, start, end in zip(days.tolist(), stat_starts.tolist(), stat_ends):
+        m_start, m_end = np.searchsorted(members["date"], [n, n + 1])
+        team_values, player_values = day_values(archive, stats[start:end], members[m_start:m_end])
+        add_day(state, day_from_number(n), team_values, player_values)
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(state, f, separators=(",", ":"), ensure_ascii=False)
+    return state
+
+if __name__ == "__main__":
+    # python -m modules.archive.SeasonSeries [archive_dir]  (refresh archive/series.json)
+    state = update_series(*sys.argv[1:2])
+    print(f"Series cover {len(state['dates'])} days")
@@ -0,0 +1,198 @@
+import hashlib
+import json
+import os
+import sys
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+from functools import lru_cache
+from pathlib import Path
+
+from modules.archive.SnapshotFormat import load_snapshot
+
+CATALOG_VERSION = 1
+
+def catalog_path(data_dir):
+    # lives in a subfolder so the data/*.json snapshot glob never sees it
+    return os.path.join(data_dir, "_meta", "catalog.json")
+
+def snapshot_day(path):
+    """Date of a data/YYYY-MM-DD.json snapshot, or None for other files."""
+    try:
+        return date.fromisoformat(Path(path).stem).isoformat()
+    except ValueError:
+        return None
+
+def snapshot_stats(data_dir):
+    """{file name: (size, mtime_ns)} of the dated snapshots in data_dir (one directory listing, no reads)."""
+    if not os.path.isdir(data_dir):
+        return {}
+    stats = {}
+    with os.scandir(data_dir) as entries:
+        for e in entries:
+            if e.name.endswith(".json") and snapshot_day(e.name) is not None and e.is_file():
+                st = e.stat()
+                stats[e.name] = (st.st_size, st.st_mtime_ns)
+    return stats
+
+def file_entry(path):
+    st = os.stat(path)
+    with open(path, "rb") as f:
+        blob = f.read()
+    return {"file": os.path.basename(path), "sha256": hashlib.sha256(blob).hexdigest(), "size": len(blob),
+            "mtime_ns": st.st_mtime_ns}
+
+def path_stamp(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_size, st.st_mtime_ns
+
+@lru_cache(maxsize=64)
+def read_snapshot(path, sha256):
+    # sha256 is part of the cache key, so a rewritten file is never served stale
+    return load_snapshot(path)
+
+class SnapshotCatalog:
+    """
+    Index of the data/YYYY-MM-DD.json snapshots, keyed by date.
+
+    The catalog (data/_meta/catalog.json) stores each snapshot's file name,
+    sha256 and size. Dates come from file names, never from mtimes, so the
+    answer is the same after a fresh checkout. calc_table registers every
+    snapshot it writes; a missing catalog, or one whose files, sizes or
+    mtimes no longer match the directory listing (snapshots added, removed
+    or edited by hand), is rebuilt from a scan. The catalog is a local
+    cache (mtimes differ per checkout) and is not kept in git.
+
+    Later lookups through get_catalog only rescan when data/'s own mtime or
+    the latest snapshot's size/mtime moved, so they stay O(1).
+    """
+
+    def __init__(self, data_dir, read_only=False):
+        # read_only: never write catalog.json (e.g. a server watching data/)
+        self.data_dir = data_dir
+        self.read_only = read_only
+        self.path = catalog_path(data_dir)
+        self.snapshots = {}
+        self.checked = None
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                catalog = json.load(f)
+            if catalog.get("version") == CATALOG_VERSION:
+                self.snapshots = catalog.get("snapshots", {})
+        self.dates = sorted(self.snapshots)
+
+        self.refresh(full=True)
+
+    def stamp(self):
+        """
+        Cheap change marker: data_dir's mtime (files added, removed or
+        replaced) and the latest snapshot's size and mtime (rewritten in place).
+        """
+        latest = self.latest()
+        return path_stamp(self.data_dir), latest and path_stamp(latest["path"])
+
+    def stale(self, stats=None):
+        """True if data_dir's snapshot files, sizes or mtimes differ from the catalog."""
+        listed = {snap["file"]: (snap["size"], snap.get("mtime_ns")) for snap in self.snapshots.values()}
+        return listed != (snapshot_stats(self.data_dir) if stats is None else stats)
+
+    def refresh(self, full=False):
+        """
+        Rescan if stale, hashing only the files that are new or whose size
+        or mtime changed. Unless full, the directory listing is skipped
+        while stamp() is unchanged. Returns True if it rescanned.
+        """
+        stamp = self.stamp()
+        if not full and stamp == self.checked:
+            return False
+        stats = snapshot_stats(self.data_dir)
+        rescanned = self.stale(stats)
+        if rescanned:
+            self.rebuild(reuse=True, stats=stats)
+            stamp = self.stamp()
+        self.checked = stamp
+        return rescanned
+
+    def entry(self, day):
+        snap = self.snapshots.get(day)
+        if snap is None:
+            return None
+        return {"date": day, "path": os.path.join(self.data_dir, snap["file"]), **snap}
+
+    def latest(self):
+        return self.entry(self.dates[-1]) if self.dates else None
+
+    def get(self, day):
+        return self.entry(day if isinstance(day, str) else day.isoformat())
+
+    def between(self, start=None, end=None):
+        """Entries with start <= date <= end (ISO strings or dates; None = open)."""
+        lo = 0 if start is None else bisect_left(self.dates, str(start))
+        hi = len(self.dates) if end is None else bisect_right(self.dates, str(end))
+        return [self.entry(day) for day in self.dates[lo:hi]]
+
+    def load(self, day=None):
+        """
+        Parsed snapshot of day (latest if None), normalized to the v1 shape
+        (see SnapshotFormat). Shared via an LRU cache: do not mutate.
+        """
+        snap = self.latest() if day is None else self.get(day)
+        if snap is None:
+            raise FileNotFoundError(f"No snapshot for {day or 'latest'} in {self.data_dir}")
+        return read_snapshot(snap["path"], snap["sha256"])
+
+    def register(self, path):
+        day = snapshot_day(path)
+        if day is None:
+            raise ValueError(f"Not a YYYY-MM-DD.json snapshot: {path}")
+        self.snapshots[day] = file_entry(path)
+        self.dates = sorted(self.snapshots)
+        self.save()
+        self.checked = self.stamp()
+
+    def rebuild(self, reuse=False, stats=None):
+        """
+        Rescan data_dir (stats: a snapshot_stats listing already taken);
+        reuse keeps the entries whose file, size and mtime are unchanged.
+        """
+        known = {snap["file"]: snap for snap in self.snapshots.values()} if reuse else {}
+        stats = snapshot_stats(self.data_dir) if stats is None else stats
+        self.snapshots = {}
+        for name, (size, mtime_ns) in sorted(stats.items()):
+            snap = known.get(name)
+            if snap is None or (snap["size"], snap.get("mtime_ns")) != (size, mtime_ns):
+                snap = file_entry(os.path.join(self.data_dir, name))
+            self.snapshots[snapshot_day(name)] = snap
+        self.dates = sorted(self.snapshots)
+        self.save()
+
+    def save(self):
+        if self.read_only or not os.path.isdir(self.data_dir):
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        catalog = {"version": CATALOG_VERSION, "latest": self.dates[-1] if self.dates else None,
+                   "snapshots": {day: self.snapshots[day] for day in self.dates}}
+        # tmp file + replace: a reader (or a killed run) never sees half a catalog
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(catalog, f, indent=2)
+        os.replace(tmp, self.path)
+
+@lru_cache(maxsize=8)
+def catalog_for(data_dir):
+    return SnapshotCatalog(data_dir)
+
+def get_catalog(data_dir):
+    """Shared catalog instance per data directory, rescanned if data/ changed since the last lookup."""
+    catalog = catalog_for(os.path.abspath(data_dir))
+    catalog.refresh()
+    return catalog
+
+if __name__ == "__main__":
+    # python -m modules.archive.SnapshotCatalog data   (rebuild the catalog)
+    catalog = get_catalog(sys.argv[1] if len(sys.argv) > 1 else "data")
+    catalog.rebuild()
+    print(f"Catalogued {len(catalog.dates)} snapshots, latest {catalog.dates[-1] if catalog.dates else None}")
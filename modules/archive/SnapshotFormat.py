@@ -0,0 +1,91 @@
+"""
+Snapshot schema versions and the reader every consumer goes through.
+
+v1 (no "schema_version"): {"summary": [record, ...], "players": {name:
+[team record, ...]}, ...}, written with indent=2. Every row repeats every
+key and a team owned by several players is written once per owner.
+
+v2: the league table once, columnar, and players as indices into it:
+
+    {"schema_version": 2,
+     "table": {"Pos": [...], "Team": [...], ..., "Points": [...]},
+     "players": {name: [row index, ...]},
+     "summary": {"position": [...], "name": [...], ...},
+     "projection": {...}, "title_race": {...}}
+
+written without whitespace. normalize_snapshot turns either into the v1
+shape (plus "table" records for v2), so readers only know one layout.
+"""
+import json
+
+from modules.core.Standings import PLAYER_COLUMNS
+
+SNAPSHOT_VERSION = 2
+
+def columnar(records, columns):
+    return {c: [r.get(c) for r in records] for c in columns}
+
+def from_columnar(columns):
+    """{column: [values]} -> list of records."""
+    names = list(columns)
+    return [dict(zip(names, values)) for values in zip(*columns.values())]
+
+def build_compact_snapshot(table, player_teams, summary, projection=None, title_race=None):
+    """
+    v2 snapshot from the Standings table, {player: [team, ...]} and the
+    summary records of build_player_standings. Team names not in the table
+    are ignored, like build_player_standings does.
+    """
+    rows = table.records(PLAYER_COLUMNS)
+    index = {r["Team"]: i for i, r in enumerate(rows)}
+    players = {}
+    for player, teams in player_teams.items():
+        owned = {index[t] for t in teams if t in index}
+        # table order, like the player's Standings subset
+        players[player] = sorted(owned)
+
+    output = {
+        "schema_version": SNAPSHOT_VERSION,
+        "table": columnar(rows, PLAYER_COLUMNS),
+        "players": players,
+        "summary": columnar(summary, list(summary[0]) if summary else []),
+    }
+    if projection is not None:
+        output["projection"] = projection
+    if title_race is not None:
+        output["title_race"] = title_race
+    return output
+
+def dump_snapshot(output, f):
+    if output.get("schema_version", 1) >= 2:
+        json.dump(output, f, ensure_ascii=False, separators=(",", ":"))
+    else:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+
+def snapshot_version(data):
+    return data.get("schema_version", 1) if isinstance(data, dict) else 1
+
+def normalize_snapshot(data):
+    """
+    Snapshot of any version in the v1 shape: "summary" and "players" as
+    records, other keys kept. v2 also gets "table", the full league table
+    as records; a player's rows are the very same dicts as the table rows,
+    so treat the result as read-only.
+    """
+    version = snapshot_version(data)
+    if version == 1:
+        return data
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot schema_version {version}")
+
+    table = from_columnar(data.get("table", {}))
+    normalized = {k: v for k, v in data.items() if k not in ("table", "players", "summary")}
+    normalized["table"] = table
+    normalized["summary"] = from_columnar(data.get("summary", {}))
+    normalized["players"] = {name: [table[i] for i in rows] for name, rows in data.get("players", {}).items()}
+    return normalized
+
+def load_snapshot(path):
+    """Read a data/YYYY-MM-DD.json snapshot of any version, normalized."""
+    with open(path, "r", encoding="utf-8") as f:
+        return normalize_snapshot(json.load(f))
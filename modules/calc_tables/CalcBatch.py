@@ -0,0 +1,68 @@
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+
+from modules.common.BasePath import get_base_path
+from modules.common.Groups import group_names
+from modules.common.RunLog import span, record
+from modules.get_data.FetchStandings import fetch_standings
+from modules.calc_tables.CalcTable import calc_table, remaining_fixtures
+from modules.simulate.MonteCarlo import cached_team_seasons
+
+def calc_group(task):
+    """Worker: snapshot and page of one group. Errors are returned, not raised, so one bad file does not stop the batch."""
+    group, force, table, fixtures = task
+    from modules.create_html.CreateHtml import make_html_from_json
+    try:
+        written = calc_table(force=force, group=group, table=table, fixtures=fixtures)
+        if written:
+            make_html_from_json(group)
+        return group, written, None
+    except Exception as e:
+        return group, False, repr(e)
+
+def calc_groups(groups=None, force=False, workers=None):
+    """
+    Batch mode: fetch the standings (and the fixture list) and simulate the
+    season once, then write the snapshot and table.html of every group in
+    parallel processes.
+
+    groups defaults to every players/*.json file (see modules.common.Groups).
+    Returns {group: True (new snapshot) | False (unchanged)}; raises
+    RuntimeError after all groups ran if any of them failed.
+    """
+    groups = groups or group_names()
+    if not groups:
+        raise FileNotFoundError("No player files found under players/.")
+
+    # Fast path: pulselive JSON API; only start Chrome if that fails
+    table = fetch_standings()
+    record("standings", rows=len(table))
+    table_rows = table.records()
+    fixtures = remaining_fixtures(table_rows)
+    # simulate the season once; each group only adds up its players' teams
+    with span("team_seasons", fixtures=len(fixtures)):
+        cached_team_seasons(os.path.join(get_base_path(), "cache"), table_rows, fixtures)
+
+    tasks = [(group, force, table, fixtures) for group in groups]
+    workers = workers or min(len(tasks), os.cpu_count() or 1)
+    with span("batch", groups=len(tasks), workers=workers):
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(calc_group, tasks))
+        else:
+            results = [calc_group(task) for task in tasks]
+
+    written, failed = {}, {}
+    for group, was_written, error in results:
+        if error is None:
+            written[group] = was_written
+        else:
+            failed[group] = error
+            print(f"[{group}] failed: {error}")
+    record("batch_result", written=sum(written.values()), unchanged=len(written) - sum(written.values()),
+           failed=len(failed))
+    print(f"{sum(written.values())} of {len(groups)} groups updated, {len(failed)} failed")
+    if failed:
+        raise RuntimeError(f"{len(failed)} group(s) failed: {', '.join(failed)}")
+    return written
@@ -0,0 +1,51 @@
+from typing import Dict, List, Tuple
+
+from modules.core.Standings import Standings, STAT_COLUMNS
+
+SORT_COLUMNS = ("Points", "GD", "GF")
+
+def build_player_standings(
+    standings: Standings,
+    player_teams: Dict[str, List[str]],
+) -> Tuple[Dict[str, Standings], List[dict]]:
+    """
+    Pandas-free counterpart of build_player_tables.
+
+    Parameters
+    ----------
+    standings : Standings
+        League table with all teams of all players.
+    player_teams : dict
+        {player_name: [team_name, ...]}.
+
+    Returns
+    -------
+    player_tables : dict[str, Standings]
+        For each player, the rows of that player's teams in table order.
+        Write them out with records(PLAYER_COLUMNS) to drop the Next column.
+    summary : list[dict]
+        One record per player: position, name and the sums of the stat
+        columns (Played .. Points), sorted by Points, GD, GF descending.
+        Missing stats count as 0. Team names not in the table are ignored.
+    """
+    # a team listed twice in the table: every row with that name counts
+    rows_by_team: Dict[str, List[int]] = {}
+    for i, row in enumerate(standings.rows):
+        rows_by_team.setdefault(row.Team, []).append(i)
+
+    player_tables: Dict[str, Standings] = {}
+    summary: List[dict] = []
+    for player, names in player_teams.items():
+        positions = sorted({i for name in names for i in rows_by_team.get(name, ())})
+        rows = [standings.rows[i] for i in positions]
+        player_tables[player] = Standings(rows)
+
+        totals = {"name": player}
+        for c in STAT_COLUMNS:
+            totals[c] = sum(getattr(r, c) or 0 for r in rows)
+        summary.append(totals)
+
+    # stable, like the multi-column sort_values of the DataFrame path
+    summary.sort(key=lambda s: tuple(-s[c] for c in SORT_COLUMNS))
+    summary = [{"position": i, **s} for i, s in enumerate(summary, start=1)]
+    return player_tables, summary
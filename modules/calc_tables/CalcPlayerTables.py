@@ -1,10 +1,46 @@
+import numpy as np
 import pandas as pd
 from typing import Dict, Tuple, List
 
+def build_membership(
+    table: pd.DataFrame,
+    player_teams: Dict[str, List[str]],
+    team_col: str = "Team",
+) -> np.ndarray:
+    """
+    Boolean indicator matrix of shape (players, table rows).
+
+    membership[p, i] is True when row i of table is one of the teams of the
+    p-th player in player_teams (dict order). Team names that are not in the
+    table are ignored, exactly like DataFrame.isin.
+    """
+    team_lists = list(player_teams.values())
+    membership = np.zeros((len(team_lists), len(table)), dtype=bool)
+    if not team_lists or table.empty:
+        return membership
+
+    teams = pd.Index(table[team_col])
+    if teams.is_unique:
+        flat_players = np.repeat(np.arange(len(team_lists)), [len(t) for t in team_lists])
+        flat_names = [name for names in team_lists for name in names]
+        cols = teams.get_indexer(flat_names)
+        found = cols >= 0
+        membership[flat_players[found], cols[found]] = True
+    else:
+        # a team listed twice in the table: every row with that name counts
+        rows_by_team: Dict[str, List[int]] = {}
+        for i, name in enumerate(teams):
+            rows_by_team.setdefault(name, []).append(i)
+        for p, names in enumerate(team_lists):
+            for name in names:
+                membership[p, rows_by_team.get(name, [])] = True
+    return membership
+
 def build_player_tables(
     table: pd.DataFrame,
     player_teams: Dict[str, List[str]],
     team_col: str = "Team",
+    copy: bool = False,
 ) -> Tuple[Dict[str, pd.DataFrame], pd.DataFrame]:
     """
     Parameters
@@ -16,6 +52,9 @@ def build_player_tables(
         {player_name: [team_name, ...]}.
     team_col : str
         Column in df that holds the team names to match against.
+    copy : bool
+        Give every player an independent copy of their table instead of a
+        view (about twice the time for many players).
 
     Returns
     -------
@@ -24,6 +63,15 @@ def build_player_tables(
         with the LAST COLUMN removed.
     summary : DataFrame
         Index: player names. Columns: sums of df columns 3..end (1-based).
+
+    Notes
+    -----
+    Team membership is resolved once into a players x teams indicator
+    matrix (see build_membership); the summary is a single matrix product
+    and the player tables are slices of one positional take, so the cost
+    grows linearly with the number of players. Without copy=True the tables
+    are views into that take: treat them as read-only (writing to one
+    raises SettingWithCopyWarning and may reach into other players' rows).
     """
     if team_col not in table.columns:
         raise ValueError(f"Column '{team_col}' not found in df. Available: {list(table.columns)}")
@@ -31,12 +79,21 @@ def build_player_tables(
     # drop last column
     if table.shape[1] >= 1:
         table = table.iloc[:, :-1] 
-    
-    # Per-player filter table to their teams
+
+    players = list(player_teams)
+    membership = build_membership(table, player_teams, team_col)
+
+    # Per-player table: that player's rows, in table order. All of them are
+    # gathered with one take; each player then gets a contiguous slice of it.
+    player_idx, row_idx = np.nonzero(membership)
+    stacked = table.take(row_idx)
+    ends = np.cumsum(np.bincount(player_idx, minlength=len(players)))
     player_tables: Dict[str, pd.DataFrame] = {}
-    for player, team_names in player_teams.items():
-        pl = table[table[team_col].isin(team_names)].copy()
-        player_tables[player] = pl
+    start = 0
+    for player, end in zip(players, ends.tolist()):
+        rows = stacked.iloc[start:end]
+        player_tables[player] = rows.copy() if copy else rows
+        start = end
 
     # 2) Summary: sum each numeric column from 3rd onward
     if table.shape[1] >= 3:
@@ -45,14 +102,21 @@ def build_player_tables(
         candidate_cols = []
     numeric_cols = [c for c in candidate_cols if pd.api.types.is_numeric_dtype(table[c])]
 
-    summary_rows = []
-    for player, team_names in player_teams.items():
-        pl_full = table[table[team_col].isin(team_names)]
-        sums = pl_full[numeric_cols].sum(numeric_only=True)
-        sums["name"] = player
-        summary_rows.append(sums)
-
-    summary = pd.DataFrame(summary_rows).fillna(0)
+    summary = pd.DataFrame(index=range(len(players)))
+    int_cols = [c for c in numeric_cols
+                if pd.api.types.is_integer_dtype(table[c]) or pd.api.types.is_bool_dtype(table[c])]
+    float_cols = [c for c in numeric_cols if c not in int_cols]
+    sums = {}
+    if int_cols:
+        values = table[int_cols].to_numpy(dtype=np.int64)
+        sums.update(zip(int_cols, (membership.astype(np.int64) @ values).T))
+    if float_cols:
+        # NaN counts as 0, like Series.sum()
+        values = np.nan_to_num(table[float_cols].to_numpy(dtype=np.float64))
+        sums.update(zip(float_cols, (membership.astype(np.float64) @ values).T))
+    for c in numeric_cols:
+        summary[c] = sums[c]
+    summary["name"] = players
 
     sort_cols = [c for c in ["Points", "GD", "GF"] if c in summary.columns]
     if not sort_cols:
@@ -62,4 +126,4 @@ def build_player_tables(
     summary.insert(0, "position", range(1, len(summary) + 1))
     summary.insert(1, "name", summary.pop("name"))
 
-    return player_tables, summary
\ No newline at end of file
+    return player_tables, summary
@@ -3,50 +3,139 @@ import os
 
 from datetime import date
 
-from modules.get_data.getPremierLeagueTable import get_premier_league_table
+from modules.common.BasePath import get_base_path
+from modules.common.Groups import DEFAULT_GROUP, group_root, players_file
+from modules.get_data.getPremierLeagueData import get_premier_league_fixtures
+from modules.get_data.FetchStandings import fetch_standings
 from modules.calc_tables.GetPlayerTeams import get_player_teams
-from modules.calc_tables.CalcPlayerTables import build_player_tables
+from modules.calc_tables.CalcPlayerStandings import build_player_standings
+from modules.calc_tables.Fingerprint import standings_fingerprint, read_fingerprint, write_fingerprint
+from modules.archive.SeasonArchive import append_snapshot, ensure_archive
+from modules.archive.SeasonSeries import update_series
+from modules.archive.SnapshotCatalog import get_catalog
+from modules.archive.SnapshotFormat import build_compact_snapshot, dump_snapshot
+from modules.simulate.MonteCarlo import cached_team_seasons, project_players, fixtures_from_next
+from modules.simulate.TitleRace import cached_title_race
+from modules.common.RunLog import span, record
+from modules.core.Standings import PLAYER_COLUMNS
 
-def calc_table():
+def build_snapshot(player_tables, summary, projection=None, title_race=None):
+    """
+    v1 snapshot JSON object from build_player_standings' output (Standings
+    tables and summary records) or build_player_tables' DataFrames.
+    calc_table writes v2 (see SnapshotFormat.build_compact_snapshot).
+    """
+    # Convert summary → list of dicts
+    summary_records = summary if isinstance(summary, list) else summary.to_dict(orient="records")
+
+    # Convert each player's table → list of dicts (without the Next column)
+    players_records = {
+        player: t.records(PLAYER_COLUMNS) if hasattr(t, "records") else t.to_dict(orient="records")
+        for player, t in player_tables.items()
+    }
+
+    # Bundle into one JSON object
+    output = {
+        "summary": summary_records,
+        "players": players_records,
+    }
+    if projection is not None:
+        output["projection"] = projection
+    if title_race is not None:
+        output["title_race"] = title_race
+    return output
+
+def write_snapshot(output, output_filepath):
+    # Write to json file
+    with span("json_write") as sizes:
+        with open(output_filepath, "w", encoding="utf-8") as f:
+            dump_snapshot(output, f)
+        sizes["json_bytes"] = os.path.getsize(output_filepath)
+
+def remaining_fixtures(table_rows):
+    """Remaining fixtures from the API, or just the next round (Next column) if that fails."""
+    try:
+        return get_premier_league_fixtures()
+    except Exception as e:
+        print(f"Fixture list unavailable ({e!r}), projecting the next round only")
+        return fixtures_from_next(table_rows)
+
+def calc_table(force=False, group=DEFAULT_GROUP, table=None, fixtures=None):
+    """
+    Fetch the standings, build every player's table and write today's
+    snapshot to data/YYYY-MM-DD.json.
+
+    If the standings and players.json are unchanged since the last snapshot
+    (same fingerprint) nothing is computed or written and False is returned,
+    unless force is set. Returns True when a new snapshot was written.
+
+    group selects the players/<group>.json file and the folder written to
+    (see modules.common.Groups). Batch runs pass the already fetched table
+    and fixtures so every group shares one fetch.
+    """
     # base directory
-    current_path = os.path.abspath(__file__)
-    while True:
-        if os.path.basename(current_path) == "PremierLeagueTipp2526":
-            base_path = current_path
-            break
-        parent = os.path.dirname(current_path)
-        if parent == current_path:  # reached filesystem root
-            raise FileNotFoundError(f"Project folder '{"PremierLeagueTipp2526"}' not found.")
-        current_path = parent
-    
-    filepath = os.path.join(base_path, "players", "players.json")
+    base_path = get_base_path()
+    root = group_root(group, base_path)
+
+    filepath = players_file(group, base_path)
     
     with open(filepath, "r", encoding="utf-8") as f:
         players = json.load(f)
     
-    url = 'https://www.premierleague.com/tables'
-    table = get_premier_league_table(url)
-    
+    if table is None:
+        # Fast path: pulselive JSON API; only start Chrome if that fails
+        table = fetch_standings()
+        record("standings", rows=len(table))
+
+    data_dir = os.path.join(root, "data")
+    with span("fingerprint", group=group):
+        fingerprint = standings_fingerprint(table, players)
+    if not force and fingerprint == read_fingerprint(data_dir):
+        print(f"[{group}] Standings and players unchanged since the last snapshot, nothing to do.")
+        record("unchanged", group=group, fingerprint=fingerprint)
+        return False
+
     player_teams = get_player_teams(players)
 
-    player_tables, summary = build_player_tables(table, player_teams)
+    with span("build_player_tables", group=group, players=len(player_teams), rows=len(table)):
+        player_tables, summary = build_player_standings(table, player_teams)
 
-    # Convert summary DataFrame → list of dicts
-    summary_records = summary.to_dict(orient="records")
+    # Monte Carlo projection of the final standings over the remaining fixtures
+    table_rows = table.records()
+    if fixtures is None:
+        fixtures = remaining_fixtures(table_rows)
+    # (the simulated seasons only depend on the table and fixtures, so every
+    # group of a batch run projects from the same cache/team_seasons.npz)
+    with span("projection", group=group, fixtures=len(fixtures)) as sizes:
+        seasons = cached_team_seasons(os.path.join(base_path, "cache"), table_rows, fixtures)
+        projection = project_players(seasons, player_teams)
+        sizes["simulations"] = projection["simulations"]
 
-    # Convert each player's DataFrame → list of dicts
-    players_records = {player: df.to_dict(orient="records") for player, df in player_tables.items()}
+    # Who has clinched 1st place or is out of it (games missing from the
+    # fixture list count as open, so the next-round fallback stays safe)
+    with span("title_race", group=group, players=len(player_teams)):
+        title_race = cached_title_race(data_dir, table_rows, player_teams, fixtures)
 
-    # Bundle into one JSON object
-    output = {
-        "summary": summary_records,
-        "players": players_records
-    }
+    output = build_compact_snapshot(table, player_teams, summary, projection, title_race)
 
     # create output filepath
-    today_str = date.today().strftime("%Y-%m-%d")
-    output_filepath = os.path.join(base_path, "data", f"{today_str}.json")
+    today = date.today()
+    today_str = today.strftime("%Y-%m-%d")
+    os.makedirs(data_dir, exist_ok=True)
+    output_filepath = os.path.join(data_dir, f"{today_str}.json")
 
-    # Write to json file
-    with open(output_filepath, "w", encoding="utf-8") as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+    write_snapshot(output, output_filepath)
+    get_catalog(data_dir).register(output_filepath)
+
+    # Full league table + player membership into the columnar season archive
+    archive_dir = os.path.join(root, "archive")
+    with span("archive_import", group=group) as sizes:
+        sizes["snapshots"] = ensure_archive(data_dir, archive_dir)
+    with span("archive_append", group=group, rows=len(table_rows)):
+        append_snapshot(today, table_rows, player_teams, archive_dir)
+    # Points/position series for the rank arrows and points race (new day only)
+    with span("series_update", group=group):
+        update_series(archive_dir)
+
+    write_fingerprint(data_dir, fingerprint, os.path.basename(output_filepath))
+    return True
\ No newline at end of file
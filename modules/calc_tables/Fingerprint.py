@@ -0,0 +1,36 @@
+import hashlib
+import json
+import os
+
+def standings_fingerprint(table, players):
+    """
+    Content hash of the parsed standings table plus the players file.
+
+    Key order and whitespace in players.json do not matter; any change to a
+    team's stats, the next opponents or a player's teams does. table is a
+    Standings table or a DataFrame of the same schema (same hash for both).
+    """
+    records = table.records() if hasattr(table, "records") else table.to_dict(orient="records")
+    payload = {
+        "table": records,
+        "players": players,
+    }
+    blob = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+def fingerprint_path(data_dir):
+    # lives in a subfolder so the data/*.json snapshot glob never sees it
+    return os.path.join(data_dir, "_meta", "fingerprint.json")
+
+def read_fingerprint(data_dir):
+    path = fingerprint_path(data_dir)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("fingerprint")
+
+def write_fingerprint(data_dir, fingerprint, snapshot):
+    path = fingerprint_path(data_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"fingerprint": fingerprint, "snapshot": snapshot}, f, indent=2)
@@ -0,0 +1,14 @@
+import os
+
+PROJECT_FOLDER = "PremierLeagueTipp2526"
+
+def get_base_path():
+    # walk up from this file until we hit the project folder
+    current_path = os.path.abspath(__file__)
+    while True:
+        if os.path.basename(current_path) == PROJECT_FOLDER:
+            return current_path
+        parent = os.path.dirname(current_path)
+        if parent == current_path:  # reached filesystem root
+            raise FileNotFoundError(f"Project folder '{PROJECT_FOLDER}' not found.")
+        current_path = parent
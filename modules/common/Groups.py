@@ -0,0 +1,26 @@
+import glob
+import os
+
+from modules.common.BasePath import get_base_path
+
+# players/players.json: the original group, writing to data/, archive/ and table.html
+DEFAULT_GROUP = "players"
+
+def group_names(base_path=None):
+    """Every tipping group: one players/<name>.json file each, sorted by name."""
+    base_path = base_path or get_base_path()
+    paths = glob.glob(os.path.join(base_path, "players", "*.json"))
+    return sorted(os.path.splitext(os.path.basename(p))[0] for p in paths)
+
+def group_root(group=DEFAULT_GROUP, base_path=None):
+    """
+    Folder holding a group's data/, archive/ and table.html: the project
+    folder for the default group, groups/<name>/ for every other one.
+    """
+    base_path = base_path or get_base_path()
+    if group == DEFAULT_GROUP:
+        return base_path
+    return os.path.join(base_path, "groups", group)
+
+def players_file(group=DEFAULT_GROUP, base_path=None):
+    return os.path.join(base_path or get_base_path(), "players", f"{group}.json")
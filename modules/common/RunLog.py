@@ -0,0 +1,110 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Set PLT_PROFILE=1 to run the whole pipeline under cProfile
+PROFILE_ENV = "PLT_PROFILE"
+
+# the active run; spans outside a run are not recorded
+CURRENT = None
+
+def peak_rss_mb():
+    """Peak resident set size of this process and of its reaped children (e.g. chromedriver)."""
+    if resource is None:
+        return None, None
+    # ru_maxrss is KiB on Linux
+    own = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    return round(own, 1), round(children, 1)
+
+class Run:
+    def __init__(self, log_path, command, profile):
+        self.log_path = log_path
+        self.command = command
+        self.run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S.%fZ")
+        self.t0 = time.perf_counter()
+        self.profiler = cProfile.Profile() if profile else None
+
+    def write(self, entry):
+        os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+        # one line per event, flushed right away so a killed run still leaves its spans
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"run": self.run_id, **entry}, default=str) + "\n")
+
+def start_run(log_path, command="update", profile=None):
+    """
+    Start recording spans to log_path (JSON lines). profile=None reads the
+    PLT_PROFILE environment variable.
+    """
+    global CURRENT
+    if profile is None:
+        profile = os.environ.get(PROFILE_ENV, "") not in ("", "0")
+    CURRENT = Run(log_path, command, profile)
+    CURRENT.write({"event": "start", "command": command,
+                   "time": datetime.now(timezone.utc).isoformat(timespec="seconds")})
+    if CURRENT.profiler:
+        CURRENT.profiler.enable()
+    return CURRENT
+
+@contextmanager
+def span(name, **payload):
+    """
+    Time a pipeline stage. The yielded dict can be filled with payload
+    sizes (bytes, rows, ...) inside the block; it is logged with the
+    duration and peak RSS when the block ends.
+    """
+    if CURRENT is None:
+        yield payload
+        return
+    run = CURRENT
+    start = time.perf_counter()
+    error = None
+    try:
+        yield payload
+    except BaseException as e:
+        error = repr(e)
+        raise
+    finally:
+        own, children = peak_rss_mb()
+        entry = {"event": "span", "span": name,
+                 "start_s": round(start - run.t0, 4),
+                 "duration_s": round(time.perf_counter() - start, 4),
+                 "peak_rss_mb": own, "children_peak_rss_mb": children, **payload}
+        if error:
+            entry["error"] = error
+        run.write(entry)
+
+def record(name, **payload):
+    """Log a single measurement that is not a timed stage."""
+    if CURRENT is not None:
+        CURRENT.write({"event": "value", "name": name, **payload})
+
+def finish_run(status="ok"):
+    global CURRENT
+    run = CURRENT
+    if run is None:
+        return
+    CURRENT = None
+    own, children = peak_rss_mb()
+    entry = {"event": "finish", "status": status, "duration_s": round(time.perf_counter() - run.t0, 4),
+             "peak_rss_mb": own, "children_peak_rss_mb": children}
+    if run.profiler:
+        run.profiler.disable()
+        prof_path = os.path.join(os.path.dirname(run.log_path), f"profile-{run.run_id}.prof")
+        run.profiler.dump_stats(prof_path)
+        out = io.StringIO()
+        pstats.Stats(run.profiler, stream=out).sort_stats("cumulative").print_stats(25)
+        print(out.getvalue())
+        entry["profile"] = prof_path
+    run.write(entry)
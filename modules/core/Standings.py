@@ -0,0 +1,103 @@
+from modules.get_data.StandingsSchema import STANDINGS_COLUMNS
+
+STAT_COLUMNS = ["Played", "Won", "Drawn", "Lost", "GF", "GA", "GD", "Points"]
+
+# player tables drop the last standings column (Next), like build_player_tables
+PLAYER_COLUMNS = STANDINGS_COLUMNS[:-1]
+
+class TeamRow:
+    """One team's line of the standings; a plain record without per-instance dict."""
+
+    __slots__ = tuple(STANDINGS_COLUMNS)
+
+    def __init__(self, Pos=None, Team=None, Played=None, Won=None, Drawn=None, Lost=None,
+                 GF=None, GA=None, GD=None, Points=None, Next=None):
+        self.Pos = Pos
+        self.Team = Team
+        self.Played = Played
+        self.Won = Won
+        self.Drawn = Drawn
+        self.Lost = Lost
+        self.GF = GF
+        self.GA = GA
+        self.GD = GD
+        self.Points = Points
+        self.Next = Next
+
+    @classmethod
+    def from_dict(cls, d):
+        return cls(*(d.get(c) for c in STANDINGS_COLUMNS))
+
+    def as_dict(self, columns=STANDINGS_COLUMNS):
+        return {c: getattr(self, c) for c in columns}
+
+    def __eq__(self, other):
+        return isinstance(other, TeamRow) and all(getattr(self, c) == getattr(other, c) for c in STANDINGS_COLUMNS)
+
+    def __repr__(self):
+        return f"TeamRow({', '.join(f'{c}={getattr(self, c)!r}' for c in STANDINGS_COLUMNS)})"
+
+class Standings:
+    """
+    Compact, pandas-free standings table: TeamRow records in table order
+    plus a team-name index.
+
+    Columns are STANDINGS_COLUMNS (Pos, Team, Played .. Points, Next).
+    to_dataframe / from_dataframe convert to and from the DataFrame schema
+    of get_premier_league_table.
+    """
+
+    __slots__ = ("rows", "index")
+
+    columns = STANDINGS_COLUMNS
+
+    def __init__(self, rows):
+        self.rows = list(rows)
+        self.index = {row.Team: i for i, row in enumerate(self.rows)}
+
+    @classmethod
+    def from_records(cls, records):
+        """Parsed rows -> table: rows without Pos or Team are dropped, the rest sorted by Pos."""
+        rows = [TeamRow.from_dict(r) for r in records]
+        rows = [r for r in rows if r.Pos is not None and r.Team is not None]
+        rows.sort(key=lambda r: r.Pos)
+        return cls(rows)
+
+    @classmethod
+    def from_dataframe(cls, df):
+        return cls.from_records(df.to_dict(orient="records"))
+
+    def to_dataframe(self, columns=STANDINGS_COLUMNS):
+        import pandas as pd
+        return pd.DataFrame(self.records(columns), columns=columns)
+
+    def records(self, columns=STANDINGS_COLUMNS):
+        return [row.as_dict(columns) for row in self.rows]
+
+    def subset(self, team_names):
+        """Rows of these teams, in table order (unknown names are ignored)."""
+        positions = sorted({self.index[name] for name in team_names if name in self.index})
+        return Standings(self.rows[i] for i in positions)
+
+    def team(self, name):
+        return self.rows[self.index[name]]
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def __eq__(self, other):
+        return isinstance(other, Standings) and self.rows == other.rows
+
+    def to_text(self, columns=STANDINGS_COLUMNS):
+        """Fixed-width text rendering, e.g. for the fetch command."""
+        cells = [[str(c) for c in columns]] + [["" if v is None else str(v) for v in r.as_dict(columns).values()]
+                                               for r in self.rows]
+        widths = [max(len(row[i]) for row in cells) for i in range(len(columns))]
+        return "\n".join("  ".join(v.rjust(w) if i != 1 else v.ljust(w) for i, (v, w) in enumerate(zip(row, widths)))
+                         for row in cells)
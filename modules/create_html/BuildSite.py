@@ -0,0 +1,158 @@
+import argparse
+import hashlib
+import json
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from html import escape
+
+from modules.common.BasePath import get_base_path
+from modules.archive.SnapshotCatalog import get_catalog, read_snapshot
+from modules.create_html import CreateHtml
+from modules.create_html.CreateHtml import build_html, load_series, render_snapshot_html
+
+CACHE_FILE = ".build-cache.json"
+
+# set once per worker process by init_worker
+WORKER_SERIES = None
+
+def init_worker(series):
+    global WORKER_SERIES
+    WORKER_SERIES = series
+
+def page_name(day):
+    return f"{day}.html"
+
+def render_nav(prev_day, next_day):
+    links = ['<a class="btn" href="index.html">All dates</a>']
+    if prev_day:
+        links.insert(0, f'<a class="btn" href="{page_name(prev_day)}">← {escape(prev_day)}</a>')
+    if next_day:
+        links.append(f'<a class="btn" href="{page_name(next_day)}">{escape(next_day)} →</a>')
+    return f'<div class="controls">{"".join(links)}</div>'
+
+def render_page(task):
+    """Worker: render one snapshot page to disk. task = (day, path, sha256, prev, next, out_path)."""
+    day, path, sha256, prev_day, next_day, out_path = task
+    data = read_snapshot(path, sha256)
+    html = render_snapshot_html(data, day, WORKER_SERIES, title=f"League Overview {day}",
+                                extra_sections=render_nav(prev_day, next_day))
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(html)
+    return day
+
+@lru_cache(maxsize=1)
+def template_hash():
+    """sha256 of the page code (CreateHtml and this module): any markup change re-renders every page."""
+    digest = hashlib.sha256()
+    for path in (CreateHtml.__file__, __file__):
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+def series_keys(series):
+    """
+    {date: hash of the series up to and including that date}. A page shows
+    the rank arrows and the points race up to its day, so that prefix is
+    what it depends on; chaining one hash per day keeps this linear.
+    """
+    if not series:
+        return {}
+    keys = {}
+    chained = hashlib.sha256()
+    for i, day in enumerate(series["dates"]):
+        column = [day] + [[group, name, field, values[i] if i < len(values) else None]
+                          for group in ("teams", "players")
+                          for name, fields in series.get(group, {}).items()
+                          for field, values in fields.items()]
+        chained.update(json.dumps(column, separators=(",", ":"), ensure_ascii=False).encode("utf-8"))
+        keys[day] = chained.hexdigest()
+    return keys
+
+def page_key(entry, prev_day, next_day, series_key):
+    # everything a page depends on: its snapshot, the page code, its neighbours and the series up to its day
+    raw = f"{template_hash()}|{entry['sha256']}|{prev_day}|{next_day}|{series_key}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def leader_on(series, day_idx):
+    for name, s in series["players"].items():
+        if s["position"][day_idx] == 1:
+            return f"{escape(str(name))} ({s['Points'][day_idx]})"
+    return ""
+
+def render_index(entries, series):
+    day_index = {day: i for i, day in enumerate(series["dates"])} if series else {}
+    rows = []
+    for entry in reversed(entries):
+        day = entry["date"]
+        leader = leader_on(series, day_index[day]) if day in day_index else ""
+        rows.append(f'<tr><td><a href="{page_name(day)}">{escape(day)}</a></td><td>{leader}</td></tr>')
+    table = ("<table class='data-table'><thead><tr><th>Date</th><th>Leader</th></tr></thead>"
+             f"<tbody>{''.join(rows)}</tbody></table>")
+    return build_html(table, "", title="League Archive")
+
+def build_site(out_dir=None, workers=None, force=False):
+    """
+    Render one page per snapshot in data/ plus an index into out_dir (default site/).
+
+    Pages are rendered on a process pool. A page is only re-rendered when
+    its snapshot checksum, the page code, its prev/next neighbours or the
+    season series up to its day changed since the last build (see
+    .build-cache.json), unless force is set.
+    Returns the list of dates that were (re-)rendered.
+    """
+    base_path = get_base_path()
+    out_dir = out_dir or os.path.join(base_path, "site")
+    os.makedirs(out_dir, exist_ok=True)
+
+    catalog = get_catalog(os.path.join(base_path, "data"))
+    entries = catalog.between()
+    series = load_series(base_path)
+    day_series = series_keys(series)
+
+    cache_path = os.path.join(out_dir, CACHE_FILE)
+    cache = {}
+    if os.path.exists(cache_path) and not force:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+
+    tasks = []
+    keys = {}
+    for i, entry in enumerate(entries):
+        prev_day = entries[i - 1]["date"] if i > 0 else None
+        next_day = entries[i + 1]["date"] if i + 1 < len(entries) else None
+        day = entry["date"]
+        keys[day] = page_key(entry, prev_day, next_day, day_series.get(day))
+        out_path = os.path.join(out_dir, page_name(day))
+        if cache.get(day) != keys[day] or not os.path.exists(out_path):
+            tasks.append((day, entry["path"], entry["sha256"], prev_day, next_day, out_path))
+
+    rendered = []
+    if tasks:
+        with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(series,)) as pool:
+            chunksize = max(1, len(tasks) // ((workers or os.cpu_count() or 1) * 4))
+            rendered = list(pool.map(render_page, tasks, chunksize=chunksize))
+
+    # pages of snapshots that no longer exist
+    for day in set(cache) - set(keys):
+        stale = os.path.join(out_dir, page_name(day))
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    with open(os.path.join(out_dir, "index.html"), "w", encoding="utf-8") as f:
+        f.write(render_index(entries, series))
+
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump(keys, f, indent=2)
+
+    print(f"Site: {len(rendered)} of {len(entries)} pages rendered into {out_dir}")
+    return rendered
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the static archive site, one page per snapshot.")
+    parser.add_argument("--out", help="output directory (default: site/)")
+    parser.add_argument("--workers", type=int, help="worker processes (default: all cores)")
+    parser.add_argument("--force", action="store_true", help="ignore the build cache")
+    args = parser.parse_args()
+    build_site(args.out, args.workers, args.force)
@@ -0,0 +1,232 @@
+"""
+Client-rendered output mode: a small page shell plus lazily fetched data.
+
+index.html carries the summary (and projection) as server-rendered HTML,
+so it paints at once. Every player is an empty details.player block whose
+table and season history live in a compact JSON chunk, fetched by the
+browser the first time the block is opened. Chunks, CSS and JS get
+content-hashed file names (cache them forever); each file is also written
+precompressed as .gz and, if the optional brotli package is installed, .br.
+
+    python -m modules.create_html.ClientPage [--group NAME] [--out DIR]
+"""
+import gzip
+import hashlib
+import json
+import os
+
+from datetime import datetime
+from html import escape
+
+try:
+    import brotli
+except ImportError:  # optional: only .gz files are written
+    brotli = None
+
+from modules.archive.SnapshotCatalog import get_catalog
+from modules.common.Groups import DEFAULT_GROUP, group_root
+from modules.common.RunLog import span
+from modules.create_html.CreateHtml import (
+    PAGE_CSS, PAGE_JS, add_movement, add_title_status, infer_table, load_series, order_columns, render_projection,
+    render_table,
+)
+
+CLIENT_CSS = """
+    .player-body .loading { color:var(--muted); }
+    .spark { width:100%; height:60px; margin-top:10px; }
+    .spark polyline { fill:none; stroke:var(--accent); stroke-width:2; }
+    """
+
+CLIENT_JS = """
+    function esc(v) {
+      return String(v ?? '').replace(/[&<>"']/g, c => ({'&':'&amp;','<':'&lt;','>':'&gt;','"':'&quot;',"'":'&#x27;'}[c]));
+    }
+    function renderTable(chunk) {
+      const head = chunk.columns.map(c => '<th>' + esc(c) + '</th>').join('');
+      const body = chunk.rows.map(r => '<tr>' + r.map(v => '<td>' + esc(v) + '</td>').join('') + '</tr>').join('');
+      return "<table class='data-table'><thead><tr>" + head + '</tr></thead><tbody>' + body + '</tbody></table>';
+    }
+    function renderHistory(h) {
+      // season position line, top of the box = 1st place
+      if (!h || h.position.length < 2) return '';
+      const n = h.position.length, worst = Math.max(...h.position.filter(v => v !== null), 2);
+      const pts = h.position.map((v, i) => v === null ? null : (i / (n - 1) * 1000).toFixed(1) + ',' + ((v - 1) / (worst - 1) * 56 + 2).toFixed(1))
+        .filter(p => p !== null).join(' ');
+      return '<svg class="spark" viewBox="0 0 1000 60" preserveAspectRatio="none"><polyline points="' + pts + '"/></svg>'
+        + '<div class="muted">Position ' + esc(h.from) + ' – ' + esc(h.to) + '</div>';
+    }
+    async function loadPlayer(d) {
+      if (d.dataset.loaded) return;
+      d.dataset.loaded = '1';
+      const body = d.querySelector('.player-body');
+      try {
+        const r = await fetch(d.dataset.chunk);
+        if (!r.ok) throw new Error(r.status);
+        const chunk = await r.json();
+        body.innerHTML = renderTable(chunk) + renderHistory(chunk.history);
+      } catch (e) {
+        delete d.dataset.loaded;
+        body.innerHTML = '<p><em>Could not load this table.</em></p>';
+      }
+    }
+    // toggle does not bubble: listen in the capture phase
+    document.addEventListener('toggle', e => {
+      if (e.target.matches && e.target.matches('details.player') && e.target.open) loadPlayer(e.target);
+    }, true);
+    """
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()[:12]
+
+def write_precompressed(path, data):
+    """path plus path.gz (and path.br with brotli); returns the paths written."""
+    written = [path]
+    with open(path, "wb") as f:
+        f.write(data)
+    # mtime=0: identical input gives byte-identical .gz files
+    with open(path + ".gz", "wb") as f:
+        f.write(gzip.compress(data, compresslevel=9, mtime=0))
+    written.append(path + ".gz")
+    if brotli is not None:
+        with open(path + ".br", "wb") as f:
+            f.write(brotli.compress(data))
+        written.append(path + ".br")
+    return written
+
+def write_hashed(out_dir, subdir, stem, ext, data):
+    """Write data as subdir/stem.<hash>.ext (+ compressed copies); returns the relative URL."""
+    name = f"{stem}.{content_hash(data)}{ext}"
+    rel = f"{subdir}/{name}"
+    path = os.path.join(out_dir, subdir, name)
+    if not os.path.exists(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        write_precompressed(path, data)
+    return rel
+
+def compact_json(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+def player_history(series, name, day_idx):
+    """Position/points of one player up to day_idx from the season series, or None."""
+    s = (series or {}).get("players", {}).get(name)
+    if s is None or day_idx < 0:
+        return None
+    dates = series["dates"][:day_idx + 1]
+    return {"from": dates[0], "to": dates[-1],
+            "position": s["position"][:day_idx + 1], "Points": s["Points"][:day_idx + 1]}
+
+def player_chunk(rows, series, name, day_idx):
+    """Columnar chunk of one player's table: {"columns", "rows": [[...]], "history"}."""
+    if day_idx >= 0:
+        rows = add_movement(rows, series["teams"], "Team", "Pos", day_idx)
+    cols, rows = infer_table(rows)
+    cols = order_columns(cols)
+    return {"columns": cols, "rows": [[r.get(c) for c in cols] for r in rows],
+            "history": player_history(series, name, day_idx)}
+
+def render_shell(title, summary_html, extra_sections, players_html, css_url, js_url):
+    return f"""<!doctype html>
+<html lang="en">
+<head>
+<meta charset="utf-8" />
+<meta name="viewport" content="width=device-width, initial-scale=1" />
+<title>{escape(title)}</title>
+<link rel="stylesheet" href="{css_url}" />
+<script defer src="{js_url}"></script>
+</head>
+<body>
+  <div class="wrap">
+    <div class="hdr">
+      <h1>{escape(title)}</h1>
+      <div class="muted" id="generated">Generated {escape(datetime.now().strftime('%Y-%m-%d %H:%M'))}</div>
+    </div>
+
+    <div class="card">
+      <h2>Summary</h2>
+      {summary_html}
+    </div>
+{extra_sections}
+
+    <div class="controls">
+      <button class="btn" onclick="expandAll()">Expand all players</button>
+      <button class="btn" onclick="collapseAll()">Collapse all players</button>
+    </div>
+
+    <div class="grid">
+      {players_html}
+    </div>
+  </div>
+</body>
+</html>"""
+
+def build_client_page(data, out_dir, day=None, series=None, title="League Overview"):
+    """
+    Write index.html, assets/ and chunks/ for one parsed snapshot to
+    out_dir. Hashed files that are no longer referenced are removed.
+    Returns the path of index.html.
+    """
+    day_idx = series["dates"].index(day) if series and day in series["dates"] else -1
+
+    summary_cols, summary_rows = infer_table(data.get("summary", []))
+    summary_cols, summary_rows = add_title_status(summary_cols, summary_rows, data.get("title_race"))
+    if day_idx >= 0:
+        summary_rows = add_movement(summary_rows, series["players"], "name", "position", day_idx)
+        at = summary_cols.index("position") + 1 if "position" in summary_cols else len(summary_cols)
+        summary_cols.insert(at, "Move")
+    extra_sections = render_projection(data["projection"]) if data.get("projection") else ""
+
+    referenced = set()
+    css_url = write_hashed(out_dir, "assets", "app", ".css", (PAGE_CSS + CLIENT_CSS).encode("utf-8"))
+    js_url = write_hashed(out_dir, "assets", "app", ".js", (PAGE_JS + CLIENT_JS).encode("utf-8"))
+    referenced.update([css_url, js_url])
+
+    blocks = []
+    for name, rows in (data.get("players") or {}).items():
+        chunk_url = write_hashed(out_dir, "chunks", "player", ".json",
+                                 compact_json(player_chunk(rows, series, name, day_idx)))
+        referenced.add(chunk_url)
+        blocks.append(f"""
+    <details class="player" data-chunk="{escape(chunk_url)}">
+      <summary><span class="chev">▶</span> {escape(str(name))}</summary>
+      <div class="player-body"><p class="loading">Loading…</p></div>
+    </details>""")
+
+    html = render_shell(title, render_table(summary_cols, summary_rows), extra_sections,
+                        "\n".join(blocks), css_url, js_url)
+    index_path = os.path.join(out_dir, "index.html")
+    write_precompressed(index_path, html.encode("utf-8"))
+
+    # drop chunks/assets of earlier builds (with their .gz/.br copies)
+    for subdir in ("assets", "chunks"):
+        folder = os.path.join(out_dir, subdir)
+        for fname in os.listdir(folder) if os.path.isdir(folder) else []:
+            base = fname
+            for ext in (".gz", ".br"):
+                if base.endswith(ext):
+                    base = base[:-len(ext)]
+            if f"{subdir}/{base}" not in referenced:
+                os.remove(os.path.join(folder, fname))
+    return index_path
+
+def make_client_page(group=DEFAULT_GROUP, out_dir=None):
+    """Client-rendered page of the latest snapshot, by default in app/ next to table.html."""
+    base_path = group_root(group)
+    out_dir = out_dir or os.path.join(base_path, "app")
+    catalog = get_catalog(os.path.join(base_path, "data"))
+    latest = catalog.latest()
+    if latest is None:
+        raise FileNotFoundError(f"No snapshots in {os.path.join(base_path, 'data')}")
+
+    with span("render_client", group=group, snapshot=latest["file"]) as sizes:
+        index_path = build_client_page(catalog.load(latest["date"]), out_dir, latest["date"], load_series(base_path))
+        sizes["index_bytes"] = os.path.getsize(index_path)
+    return index_path
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Write the client-rendered page of the latest snapshot.")
+    parser.add_argument("--group", default=DEFAULT_GROUP)
+    parser.add_argument("--out", help="output directory (default: app/)")
+    args = parser.parse_args()
+    print(make_client_page(args.group, args.out))
@@ -3,14 +3,18 @@ import os
 import sys
 
 from datetime import datetime
-from pathlib import Path
 from html import escape
 
+from modules.common.Groups import DEFAULT_GROUP, group_root
+from modules.archive.SnapshotCatalog import get_catalog
+from modules.common.RunLog import span
+
 def infer_table(data):
     """
     Accepts either:
       - {"columns":[...], "rows":[{...}, {...}]}
       - [{"colA":..., "colB":...}, {...}]
+      - {"colA":[...], "colB":[...]}  (columnar, as in v2 snapshots)
     Returns (columns, rows_as_list_of_dicts)
     """
     if isinstance(data, dict) and "columns" in data and "rows" in data:
@@ -20,6 +24,9 @@ def infer_table(data):
         if rows and isinstance(rows[0], list):
             rows = [dict(zip(columns, r)) for r in rows]
         return columns, rows
+    elif isinstance(data, dict) and data and all(isinstance(v, list) for v in data.values()):
+        columns = list(data)
+        return columns, [dict(zip(columns, r)) for r in zip(*data.values())]
     elif isinstance(data, list) and data:
         if isinstance(data[0], dict):
             # union of keys, but preserve first row order
@@ -47,8 +54,7 @@ def render_table(columns, rows):
     tbody = "<tbody>" + "".join(trs) + "</tbody>"
     return f"<table class='data-table'>{thead}{tbody}</table>"
 
-def build_html(summary_section, players_section, title="Tables"):
-    css = """
+PAGE_CSS = """
     :root {
       --bg:#0b1020; --card:#121834; --text:#e7eaf6; --muted:#aab0d6;
       --accent:#5b8cff; --border:#252b52; --table-stripe:#0f1530;
@@ -76,8 +82,14 @@ def build_html(summary_section, players_section, title="Tables"):
     .player-body { padding:0 16px 16px; }
     .muted { color:var(--muted); font-size:12px; }
     .hdr { display:flex; align-items:baseline; justify-content:space-between; gap:12px; margin-bottom:8px; }
+    .chart { width:100%; height:auto; }
+    .chart .axis { stroke:var(--border); }
+    .chart text { fill:var(--muted); font-size:11px; }
+    .legend { display:flex; flex-wrap:wrap; gap:6px 16px; margin-top:8px; font-size:13px; }
+    .legend .swatch { display:inline-block; width:12px; height:12px; border-radius:3px; margin-right:6px; vertical-align:-1px; }
     """
-    js = """
+
+PAGE_JS = """
     function expandAll() {
       document.querySelectorAll('details.player').forEach(d => d.open = true);
     }
@@ -85,6 +97,10 @@ def build_html(summary_section, players_section, title="Tables"):
       document.querySelectorAll('details.player').forEach(d => d.open = false);
     }
     """
+
+def build_html(summary_section, players_section, title="Tables", extra_sections=""):
+    css = PAGE_CSS
+    js = PAGE_JS
     return f"""<!doctype html>
 <html lang="en">
 <head>
@@ -105,6 +121,7 @@ def build_html(summary_section, players_section, title="Tables"):
       <h2>Summary</h2>
       {summary_section}
     </div>
+{extra_sections}
 
     <div class="controls">
       <button class="btn" onclick="expandAll()">Expand all players</button>
@@ -129,47 +146,158 @@ def render_player_block(name, table_html):
     </details>
     """
 
+def render_player_rows(name, table_rows, series=None, day_idx=-1):
+    """Player block from a snapshot's list of team rows, with rank arrows if series is given."""
+    if series is not None and day_idx >= 0:
+        table_rows = add_movement(table_rows, series["teams"], "Team", "Pos", day_idx)
+    p_cols, p_rows = infer_table(table_rows)  # table_rows is a list of dicts
+    p_cols = order_columns(p_cols)
+    return render_player_block(name, render_table(p_cols, p_rows))
+
 def order_columns(cols):
-    preferred = ["Pos", "Position", "Team", "Played", "Won", "Drawn", "Lost", "GF", "GA", "GD", "Points"]
+    preferred = ["Pos", "Position", "Move", "Team", "Played", "Won", "Drawn", "Lost", "GF", "GA", "GD", "Points"]
     seen = set()
     ordered = [c for c in preferred if c in cols and not seen.add(c)]
     # append any remaining columns in their original order
     ordered += [c for c in cols if c not in set(ordered)]
     return ordered
 
-def make_html_from_json():
-    # base directory
-    current_path = os.path.abspath(__file__)
-    while True:
-        if os.path.basename(current_path) == "PremierLeagueTipp2526":
-            base_path = current_path
-            break
-        parent = os.path.dirname(current_path)
-        if parent == current_path:  # reached filesystem root
-            raise FileNotFoundError(f"Project folder '{"PremierLeagueTipp2526"}' not found.")
-        current_path = parent
-    
-    json_dir = os.path.join(base_path, "data")
+def load_series(base_path):
+    """Season time series written by SeasonSeries.update_series, or None."""
+    path = os.path.join(base_path, "archive", "series.json")
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
 
-    if not os.path.exists(json_dir):
-        print(f"Folder {json_dir} does not exist")
-        sys.exit(1)
+def movement(values, day_idx):
+    """Places gained since the previous snapshot (positive = moved up), or None."""
+    if day_idx <= 0 or day_idx >= len(values):
+        return None
+    prev, cur = values[day_idx - 1], values[day_idx]
+    if prev is None or cur is None:
+        return None
+    return prev - cur
 
-    # Find all .json files and pick the most recently modified
-    json_files = list(Path(json_dir).glob("*.json"))
-    if not json_files:
-        print(f"No JSON files found in {json_dir}")
-        sys.exit(1)
+def format_movement(delta):
+    if delta is None:
+        return ""
+    if delta > 0:
+        return f"▲{delta}"
+    if delta < 0:
+        return f"▼{-delta}"
+    return "–"
 
-    latest_json = max(json_files, key=lambda p: p.stat().st_mtime)
-    print(f"Using latest JSON: {latest_json.name}")
-    
-    with open(latest_json, "r", encoding="utf-8") as f:
-        data = json.load(f)
+def add_movement(rows, series_group, key_col, pos_field, day_idx):
+    """Copy of rows with a 'Move' column taken from the series group."""
+    moved = []
+    for r in rows:
+        values = series_group.get(r.get(key_col), {}).get(pos_field, [])
+        moved.append({**r, "Move": format_movement(movement(values, day_idx))})
+    return moved
+
+TITLE_LABELS = {"clinched": "✔ clinched", "eliminated": "✘ out", "alive": "alive", "undecided": "? undecided"}
+
+def add_title_status(columns, rows, title_race):
+    """Columns and rows with a 'Title' column (see TitleRace.solve_title_race) after the name."""
+    if not title_race:
+        return columns, rows
+    rows = [{**r, "Title": TITLE_LABELS.get(title_race.get(r.get("name")), "")} for r in rows]
+    columns = list(columns)
+    columns.insert(columns.index("name") + 1 if "name" in columns else len(columns), "Title")
+    return columns, rows
+
+CHART_COLORS = ["#5b8cff", "#ff7a59", "#3ecf8e", "#f5c542", "#c77dff",
+                "#ff5d8f", "#4dd0e1", "#a3e635", "#fb923c", "#94a3b8"]
+
+def render_points_race(series, day_idx, max_players=10):
+    """Inline SVG line chart of the players' points up to day_idx."""
+    dates = series["dates"][:day_idx + 1]
+    players = series["players"]
+    current = {name: s["Points"][day_idx] for name, s in players.items()
+               if day_idx < len(s["Points"]) and s["Points"][day_idx] is not None}
+    if len(dates) < 2 or not current:
+        return ""
+    leaders = sorted(current, key=lambda name: -current[name])[:max_players]
+
+    width, height, pad = 1000, 320, 36
+    max_points = max(max(v for v in players[name]["Points"][:day_idx + 1] if v is not None) for name in leaders) or 1
+    x_step = (width - 2 * pad) / (len(dates) - 1)
+
+    def xy(i, v):
+        return f"{pad + i * x_step:.1f},{height - pad - v / max_points * (height - 2 * pad):.1f}"
+
+    lines = []
+    legend = []
+    for k, name in enumerate(leaders):
+        color = CHART_COLORS[k % len(CHART_COLORS)]
+        points = " ".join(xy(i, v) for i, v in enumerate(players[name]["Points"][:day_idx + 1]) if v is not None)
+        lines.append(f'<polyline fill="none" stroke="{color}" stroke-width="2" points="{points}"><title>{escape(str(name))}</title></polyline>')
+        legend.append(f'<span><span class="swatch" style="background:{color}"></span>{escape(str(name))} ({current[name]})</span>')
+
+    axis = (f'<line class="axis" x1="{pad}" y1="{height - pad}" x2="{width - pad}" y2="{height - pad}"/>'
+            f'<line class="axis" x1="{pad}" y1="{pad}" x2="{pad}" y2="{height - pad}"/>'
+            f'<text x="{pad}" y="{height - pad + 16}">{escape(dates[0])}</text>'
+            f'<text x="{width - pad}" y="{height - pad + 16}" text-anchor="end">{escape(dates[-1])}</text>'
+            f'<text x="{pad - 6}" y="{pad + 4}" text-anchor="end">{max_points}</text>')
+    return f"""
+    <div class="card">
+      <h2>Points race</h2>
+      <svg class="chart" viewBox="0 0 {width} {height}" role="img" aria-label="Points race">{axis}{"".join(lines)}</svg>
+      <div class="legend">{"".join(legend)}</div>
+    </div>
+    """
 
+def render_projection(projection):
+    """
+    Card with the Monte Carlo projection stored under "projection" in a
+    snapshot. A "next_round" projection (no fixture list, only the Next
+    column) is labelled as such: it is not a final-table projection.
+    """
+    cols, rows = infer_table(projection)
+    if not cols:
+        return ""
+    if projection.get("scope") == "next_round":
+        heading = "Next round"
+        note = (f"Fixture list unavailable: {projection.get('simulations', 0):,} simulations of the next "
+                f"{projection.get('fixtures', 0)} fixtures only; P(1st) is the chance to lead after them")
+    else:
+        heading = "Projection"
+        note = (f"{projection.get('simulations', 0):,} simulated seasons over "
+                f"{projection.get('fixtures', 0)} remaining fixtures")
+    return f"""
+    <div class="card">
+      <div class="hdr"><h2>{heading}</h2><div class="muted">{escape(note)}</div></div>
+      {render_table(cols, rows)}
+    </div>
+    """
+
+def render_snapshot_html(data, day=None, series=None, title="League Overview", extra_sections=""):
+    """
+    Full HTML page for one parsed snapshot. day (YYYY-MM-DD) and series
+    (see load_series) add the rank arrows and the points race up to that day.
+    """
     # Expect top-level keys: "summary" and "players"
     # summary can be dict or list-of-rows; players is a list of {name, table} or {name, columns, rows}
     summary_cols, summary_rows = infer_table(data.get("summary", []))
+    summary_cols, summary_rows = add_title_status(summary_cols, summary_rows, data.get("title_race"))
+
+    if data.get("projection"):
+        extra_sections += render_projection(data["projection"])
+
+    # Rank arrows and the points race come from the season series, if it
+    # covers the day of this snapshot
+    day_idx = -1
+    if series and day in series["dates"]:
+        day_idx = series["dates"].index(day)
+    if day_idx >= 0:
+        summary_rows = add_movement(summary_rows, series["players"], "name", "position", day_idx)
+        if "position" in summary_cols:
+            summary_cols.insert(summary_cols.index("position") + 1, "Move")
+        else:
+            summary_cols.append("Move")
+        extra_sections += render_points_race(series, day_idx)
+
     summary_html = render_table(summary_cols, summary_rows)
 
     players_html_blocks = []
@@ -178,10 +306,8 @@ def make_html_from_json():
     if isinstance(players, dict):
         # Your schema: { "Lukas": [ {...}, {...} ], "Mark": [ {...}, ... ] }
         for name, table_rows in players.items():
-            p_cols, p_rows = infer_table(table_rows)  # table_rows is a list of dicts
-            p_cols = order_columns(p_cols)
             players_html_blocks.append(
-                render_player_block(name, render_table(p_cols, p_rows))
+                render_player_rows(name, table_rows, series if day_idx >= 0 else None, day_idx)
             )
 
     elif isinstance(players, list):
@@ -201,9 +327,34 @@ def make_html_from_json():
                     render_player_block(str(p), "<p><em>No table data.</em></p>")
                 )
 
-    html = build_html(summary_html, "\n".join(players_html_blocks), title="League Overview")
+    return build_html(summary_html, "\n".join(players_html_blocks), title=title,
+                      extra_sections=extra_sections)
+
+def make_html_from_json(group=DEFAULT_GROUP):
+    # base directory (groups other than the default one live under groups/<name>/)
+    base_path = group_root(group)
+    
+    json_dir = os.path.join(base_path, "data")
+
+    if not os.path.exists(json_dir):
+        print(f"Folder {json_dir} does not exist")
+        sys.exit(1)
+
+    # Latest snapshot by date, from the catalog
+    catalog = get_catalog(json_dir)
+    latest = catalog.latest()
+    if latest is None:
+        print(f"No JSON files found in {json_dir}")
+        sys.exit(1)
+
+    print(f"Using latest JSON: {latest['file']}")
+    data = catalog.load(latest["date"])
+
+    with span("render_html", group=group, snapshot=latest["file"]) as sizes:
+        html = render_snapshot_html(data, latest["date"], load_series(base_path))
 
-    out_file = os.path.join(base_path, f"table.html")
-    with open(out_file, "w", encoding="utf-8") as f:
-        f.write(html)
+        out_file = os.path.join(base_path, f"table.html")
+        with open(out_file, "w", encoding="utf-8") as f:
+            f.write(html)
+        sizes["html_bytes"] = len(html.encode("utf-8"))
     return str(out_file)
\ No newline at end of file
@@ -0,0 +1,45 @@
+import os
+
+from functools import lru_cache
+
+import requests
+from urllib3.util.retry import Retry
+
+from modules.get_data.Cassette import CassetteAdapter, cassette_mode
+
+DEFAULT_API_BASE = "https://footballapi.pulselive.com/football"
+# PLT_API_BASE points the API calls somewhere else, e.g. a local stub server
+API_BASE = os.environ.get("PLT_API_BASE", DEFAULT_API_BASE)
+
+API_HEADERS = {
+    # These headers help mimic a normal browser request to the PL site
+    "User-Agent": "Mozilla/5.0",
+    "Accept": "application/json, text/plain, */*",
+    "Origin": "https://www.premierleague.com",
+    "Referer": "https://www.premierleague.com/",
+}
+
+@lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """
+    Shared keep-alive session for the pulselive API.
+
+    One pooled connection is reused for every request of a run, and transient
+    5xx/429 answers are retried with a short backoff. Responses are
+    recorded/replayed per PLT_CASSETTE_MODE (see Cassette).
+    """
+    session = requests.Session()
+    session.headers.update(API_HEADERS)
+    retry = Retry(total=2, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=("GET",))
+    adapter = CassetteAdapter(pool_connections=1, pool_maxsize=4, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def default_http():
+    """
+    Client for calls made without a session: the requests module itself, or
+    the shared session while cassettes are recording or replaying.
+    """
+    return requests if cassette_mode() == "off" else get_session()
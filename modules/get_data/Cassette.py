@@ -0,0 +1,197 @@
+"""
+Record/replay layer for everything the pipeline fetches: pulselive API
+responses (through the shared requests session) and rendered page sources
+(Chrome).
+
+PLT_CASSETTE_MODE selects the mode:
+
+    off      (default) fetch live, store nothing
+    record   fetch live and store every answer
+    replay   serve stored answers only; no network, no browser, selenium is
+             never imported. A request that was never recorded fails with
+             CassetteMiss (a requests.ConnectionError, so the fetch sources
+             fall back as they would offline)
+    auto     replay what is stored, record the rest
+
+Cassettes live in PLT_CASSETTE_DIR (default cassettes/ in the base path):
+
+    cassettes/blobs/ab/abcdef...   response bodies / page sources, named by
+                                   their sha256 (identical answers stored once)
+    cassettes/index/<key>.json     one request: what was asked and which blob
+                                   answered it; key = sha256 of the request
+
+    PLT_CASSETTE_MODE=record python UpdateTable.py all
+    PLT_CASSETTE_MODE=replay python UpdateTable.py all
+    python -m modules.get_data.Cassette     (list the recorded requests)
+"""
+import hashlib
+import json
+import os
+import sys
+import threading
+
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from modules.common.BasePath import get_base_path
+from modules.common.RunLog import record
+
+MODE_ENV = "PLT_CASSETTE_MODE"
+DIR_ENV = "PLT_CASSETTE_DIR"
+MODES = ("off", "record", "replay", "auto")
+
+# headers worth keeping with a recorded response
+KEPT_HEADERS = ("Content-Type", "Content-Encoding", "ETag", "Last-Modified")
+
+class CassetteMiss(requests.ConnectionError):
+    pass
+
+def cassette_mode():
+    # read on every call, so tests and benchmarks can switch modes at runtime
+    mode = os.environ.get(MODE_ENV, "off").strip().lower() or "off"
+    if mode not in MODES:
+        raise ValueError(f"{MODE_ENV} must be one of {', '.join(MODES)}, not {mode!r}")
+    return mode
+
+def replaying():
+    """True when fetches must come from cassettes only (no browser, no network)."""
+    return cassette_mode() == "replay"
+
+def cassette_dir():
+    return os.environ.get(DIR_ENV) or os.path.join(get_base_path(), "cassettes")
+
+def canonical_url(url):
+    # parameter order does not make a different request
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path, query, ""))
+
+def request_key(kind, *parts):
+    return hashlib.sha256("\n".join((kind,) + parts).encode("utf-8")).hexdigest()
+
+def write_atomic(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # unique per thread: sources record from worker threads
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    os.replace(tmp, path)
+
+class Cassettes:
+    """Content-addressed store of recorded answers under root."""
+
+    def __init__(self, root=None):
+        self.root = root or cassette_dir()
+
+    def blob_path(self, sha256):
+        return os.path.join(self.root, "blobs", sha256[:2], sha256)
+
+    def entry_path(self, key):
+        return os.path.join(self.root, "index", f"{key}.json")
+
+    def load(self, key):
+        """(entry, body bytes) of a recorded request, or None."""
+        try:
+            with open(self.entry_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            with open(self.blob_path(entry["body"]), "rb") as f:
+                return entry, f.read()
+        except FileNotFoundError:
+            return None
+
+    def store(self, key, body, **entry):
+        sha256 = hashlib.sha256(body).hexdigest()
+        if not os.path.exists(self.blob_path(sha256)):
+            write_atomic(self.blob_path(sha256), body)
+        entry = {**entry, "body": sha256, "recorded": datetime.now(timezone.utc).isoformat(timespec="seconds")}
+        write_atomic(self.entry_path(key), json.dumps(entry, indent=2, ensure_ascii=False).encode("utf-8"))
+
+    def entries(self):
+        folder = os.path.join(self.root, "index")
+        for name in sorted(os.listdir(folder)) if os.path.isdir(folder) else []:
+            if name.endswith(".json"):
+                with open(os.path.join(folder, name), "r", encoding="utf-8") as f:
+                    yield name[:-5], json.load(f)
+
+def replay_response(request, entry, body):
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.headers = CaseInsensitiveDict(entry.get("headers", {}))
+    response._content = body
+    response.url = request.url
+    response.request = request
+    response.reason = entry.get("reason", "")
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+class CassetteAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that records and replays according to PLT_CASSETTE_MODE
+    (mode "off" is a plain HTTPAdapter). Responses are keyed by method and
+    canonical URL; request headers are not part of the key.
+    """
+
+    def send(self, request, **kwargs):
+        mode = cassette_mode()
+        if mode == "off":
+            return super().send(request, **kwargs)
+
+        url = canonical_url(request.url)
+        key = request_key("http", request.method, url)
+        cassettes = Cassettes()
+        if mode in ("replay", "auto"):
+            hit = cassettes.load(key)
+            if hit is not None:
+                record("cassette", kind="http", hit=True, url=url)
+                return replay_response(request, *hit)
+            if mode == "replay":
+                record("cassette", kind="http", hit=False, url=url)
+                raise CassetteMiss(f"No cassette for {request.method} {url} (key {key[:12]})", request=request)
+
+        response = super().send(request, **kwargs)
+        # errors (and 429 rate limiting) are not worth replaying
+        if response.status_code < 400:
+            headers = {h: response.headers[h] for h in KEPT_HEADERS if h in response.headers}
+            # requests has already decoded the body, so it is stored decoded
+            headers.pop("Content-Encoding", None)
+            cassettes.store(key, response.content, kind="http", method=request.method, url=url,
+                            status=response.status_code, reason=response.reason, headers=headers)
+        return response
+
+def rendered_page(url, table_selector, fetch):
+    """
+    Rendered page source of url through the cassettes: fetch() (which starts
+    or reuses Chrome) only runs when the mode allows a live fetch.
+    """
+    mode = cassette_mode()
+    if mode == "off":
+        return fetch()
+
+    key = request_key("page", canonical_url(url), table_selector)
+    cassettes = Cassettes()
+    if mode in ("replay", "auto"):
+        hit = cassettes.load(key)
+        if hit is not None:
+            record("cassette", kind="page", hit=True, url=url)
+            return hit[1].decode("utf-8")
+        if mode == "replay":
+            record("cassette", kind="page", hit=False, url=url)
+            raise CassetteMiss(f"No cassette for page {url} (key {key[:12]})")
+
+    html = fetch()
+    cassettes.store(key, html.encode("utf-8"), kind="page", url=canonical_url(url), selector=table_selector)
+    return html
+
+if __name__ == "__main__":
+    # python -m modules.get_data.Cassette [cassette_dir]
+    store = Cassettes(sys.argv[1] if len(sys.argv) > 1 else None)
+    n = 0
+    for key, entry in store.entries():
+        n += 1
+        what = entry.get("method", "PAGE") + " " + entry["url"]
+        print(f"{key[:12]}  {entry['recorded']}  {entry.get('status', '')!s:>3}  {what}")
+    print(f"{n} recorded requests in {store.root}")
@@ -5,6 +5,32 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 
+import threading
+import time
+
+from modules.common.RunLog import span
+
+# Cookie-banner buttons seen on premierleague.com (OneTrust and generic fallbacks)
+COOKIE_SELECTORS = [
+    "button#onetrust-accept-btn-handler",
+    "button[aria-label*='Accept']",
+    "button[title*='Accept']",
+    "button[data-testid*='accept']",
+]
+
+# Requests the lean profile never needs to render the standings table:
+# images, fonts, media and third-party trackers/ads.
+LEAN_BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*.mp4", "*.webm", "*.m3u8", "*.mp3",
+    "*googletagmanager.com*", "*google-analytics.com*", "*googlesyndication.com*",
+    "*doubleclick.net*", "*facebook.net*", "*connect.facebook.com*", "*hotjar.com*",
+    "*scorecardresearch.com*", "*chartbeat.com*", "*chartbeat.net*", "*optimizely.com*",
+    "*newrelic.com*", "*nr-data.net*", "*amazon-adsystem.com*", "*adnxs.com*",
+    "*twitter.com*", "*tiktok.com*", "*brightcove*", "*youtube.com*", "*ytimg.com*",
+]
+
 def fetch_rendered_html(url: str, table_selector: str) -> str:
     opts = Options()
     opts.add_argument("--headless=new")
@@ -26,60 +52,200 @@ def fetch_rendered_html(url: str, table_selector: str) -> str:
         driver.quit()
     
 
+def dump_timeout_debug(driver, table_selector):
+    print("=== TIMEOUT DEBUG ===")
+    print("URL:", driver.current_url)
+    print("TITLE:", driver.title)
+    print("SELECTOR:", table_selector)
+
+    # See if any tables exist at all
+    try:
+        tables = driver.find_elements(By.TAG_NAME, "table")
+        print("Number of <table> elements found:", len(tables))
+    except Exception as e:
+        print("Error counting tables:", e)
+
+    # Dump some page source
+    src = driver.page_source
+    print("Page source first 8000 chars:")
+    print(src[:8000])
+
+    driver.save_screenshot("timeout_debug.png")
+
+
+def table_or_cookie_banner(table_selector, cookie_selectors=COOKIE_SELECTORS):
+    """
+    Wait condition that handles the cookie banner and the table in one wait.
+
+    On every poll it clicks the first clickable cookie button (once) and
+    returns the table element as soon as it is present, so the banner never
+    costs a wait of its own.
+    """
+    cookie_selector = ", ".join(cookie_selectors)
+    state = {"clicked": False}
+
+    def condition(driver):
+        if not state["clicked"]:
+            for btn in driver.find_elements(By.CSS_SELECTOR, cookie_selector):
+                try:
+                    if btn.is_displayed() and btn.is_enabled():
+                        btn.click()
+                        state["clicked"] = True
+                        print("Clicked cookie button")
+                        break
+                except Exception:
+                    pass
+        tables = driver.find_elements(By.CSS_SELECTOR, table_selector)
+        return tables[0] if tables else False
+
+    return condition
+
+
+def lean_chrome_options():
+    opts = Options()
+    opts.add_argument("--headless=new")
+    opts.add_argument("--disable-gpu")
+    opts.add_argument("--disable-extensions")
+    opts.add_argument("--disable-dev-shm-usage")
+    opts.add_argument("--no-first-run")
+    opts.add_argument("--mute-audio")
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.media_stream": 2,
+    })
+    # Return control once the DOM is parsed instead of waiting for every subresource
+    opts.page_load_strategy = "eager"
+    return opts
+
+
+def fetch_rendered_html_lean(url, table_selector, timeout=45):
+    """
+    Lean variant of fetch_rendered_html_debug.
+
+    Blocks images, fonts, media and third-party scripts, uses the eager
+    page-load strategy and waits for the cookie banner and the table in a
+    single wait. Prints the Chrome start-up time and the time-to-table.
+    """
+    t_start = time.perf_counter()
+    with span("chrome_start", profile="lean"):
+        driver = webdriver.Chrome(options=lean_chrome_options())
+    t_driver = time.perf_counter()
+    try:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+
+        with span("page_load", url=url):
+            driver.get(url)
+        # cookie banner and table share this one wait
+        with span("table_wait"):
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                table_or_cookie_banner(table_selector)
+            )
+        t_table = time.perf_counter()
+        print(f"Chrome started in {t_driver - t_start:.2f}s, "
+              f"table ready after {t_table - t_driver:.2f}s "
+              f"(time-to-table {t_table - t_start:.2f}s)")
+
+        with span("page_source") as sizes:
+            html = driver.page_source
+            sizes["html_bytes"] = len(html.encode("utf-8"))
+        return html
+
+    except TimeoutException:
+        dump_timeout_debug(driver, table_selector)
+        raise
+    finally:
+        driver.quit()
+
+
 def fetch_rendered_html_debug(url, table_selector):
     opts = Options()
     opts.add_argument("--headless=new")
-    driver = webdriver.Chrome(options=opts)
+    with span("chrome_start", profile="debug"):
+        driver = webdriver.Chrome(options=opts)
     try:
-        driver.get(url)
+        with span("page_load", url=url):
+            driver.get(url)
         wait = WebDriverWait(driver, 45)
 
         # Confirm page shell loaded
         wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
 
         # Optional: attempt cookie-banner dismissal
-        cookie_candidates = [
-            "button#onetrust-accept-btn-handler",
-            "button[aria-label*='Accept']",
-            "button[title*='Accept']",
-            "button[data-testid*='accept']",
-        ]
-
-        for selector in cookie_candidates:
-            try:
-                btn = WebDriverWait(driver, 2).until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                )
-                btn.click()
-                print(f"Clicked cookie button: {selector}")
-                break
-            except Exception:
-                pass
+        with span("cookie_wait"):
+            for selector in COOKIE_SELECTORS:
+                try:
+                    btn = WebDriverWait(driver, 2).until(
+                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
+                    )
+                    btn.click()
+                    print(f"Clicked cookie button: {selector}")
+                    break
+                except Exception:
+                    pass
 
         # Wait for target
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, table_selector)))
+        with span("table_wait"):
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, table_selector)))
 
-        return driver.page_source
+        with span("page_source") as sizes:
+            html = driver.page_source
+            sizes["html_bytes"] = len(html.encode("utf-8"))
+        return html
 
     except TimeoutException:
-        print("=== TIMEOUT DEBUG ===")
-        print("URL:", driver.current_url)
-        print("TITLE:", driver.title)
-        print("SELECTOR:", table_selector)
+        dump_timeout_debug(driver, table_selector)
+        raise
+    finally:
+        driver.quit()
 
-        # See if any tables exist at all
-        try:
-            tables = driver.find_elements(By.TAG_NAME, "table")
-            print("Number of <table> elements found:", len(tables))
-        except Exception as e:
-            print("Error counting tables:", e)
 
-        # Dump some page source
-        src = driver.page_source
-        print("Page source first 8000 chars:")
-        print(src[:8000])
+class WarmBrowser:
+    """
+    One long-lived lean Chrome for repeated fetches (live mode), so a poll
+    costs a page load instead of a browser start.
 
-        driver.save_screenshot("timeout_debug.png")
-        raise
-    finally:
-        driver.quit()
\ No newline at end of file
+    The driver is restarted after recycle_after fetches and after any error,
+    which keeps a leaking renderer from growing over days of uptime. Calls
+    are serialized; the instance may be used from worker threads.
+    """
+
+    def __init__(self, recycle_after=50):
+        self.recycle_after = recycle_after
+        self.driver = None
+        self.fetches = 0
+        self.lock = threading.Lock()
+
+    def start(self):
+        with span("chrome_start", profile="warm"):
+            self.driver = webdriver.Chrome(options=lean_chrome_options())
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+        self.fetches = 0
+
+    def fetch(self, url, table_selector, timeout=45):
+        with self.lock:
+            if self.driver is None or self.fetches >= self.recycle_after:
+                self.close()
+                self.start()
+            try:
+                with span("page_load", url=url, warm=self.fetches):
+                    self.driver.get(url)
+                with span("table_wait"):
+                    WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(
+                        table_or_cookie_banner(table_selector)
+                    )
+                self.fetches += 1
+                return self.driver.page_source
+            except Exception:
+                self.close()
+                raise
+
+    def close(self):
+        if self.driver is not None:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"Closing Chrome failed: {e!r}")
+            self.driver = None
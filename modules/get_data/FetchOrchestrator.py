@@ -0,0 +1,202 @@
+"""
+Asyncio layer over the blocking standings sources.
+
+Every source is a function fetch(timeout) -> Standings that runs in a
+worker thread. first_valid starts them one after the other (a later source
+is started once the previous one has had hedge_delay_s to answer, or as soon
+as everything started so far has failed; hedge_delay_s=0 races them all),
+retries each with jittered exponential backoff and returns the first table
+that passes check_standings. Everything shares one total time budget.
+
+    python -m modules.get_data.FetchOrchestrator --api-base http://127.0.0.1:8000/football
+"""
+import asyncio
+import os
+import random
+
+from concurrent.futures import ThreadPoolExecutor
+
+from modules.common.BasePath import get_base_path
+from modules.common.RunLog import span, record
+from modules.core.Standings import Standings
+from modules.get_data.StandingsSchema import check_standings
+
+# whole fetch: all sources, attempts and backoff sleeps
+DEFAULT_BUDGET_S = 150
+# how long a started source may work alone before the next one joins
+HEDGE_DELAY_S = 15
+ATTEMPTS = 3
+BACKOFF_BASE_S = 1.0
+BACKOFF_CAP_S = 10.0
+# per-attempt caps; an attempt never gets more than the budget left
+API_TIMEOUT_S = 30
+PAGE_TIMEOUT_S = 45
+PL_TEAMS = 20
+
+def backoff_delay(attempt, base=BACKOFF_BASE_S, cap=BACKOFF_CAP_S, rng=random):
+    """"Full jitter" backoff before retry attempt+1: uniform in [0, min(cap, base * 2**attempt)]."""
+    return rng.uniform(0, min(cap, base * 2 ** attempt))
+
+def api_source(api_base=None, label="2025/26"):
+    """
+    pulselive API source. The compSeason id is cached in
+    cache/compseason.json for the real API only, never for another api_base
+    (e.g. a stub server).
+    """
+    def fetch(timeout):
+        from modules.get_data.ApiSession import API_BASE, API_HEADERS, DEFAULT_API_BASE, get_session
+        from modules.get_data.getCompSeasonID import get_comp_season_id
+        from modules.get_data.getStandingDf import get_standings
+
+        base = api_base or API_BASE
+        timeout = min(timeout, API_TIMEOUT_S)
+        cache_path = os.path.join(get_base_path(), "cache", "compseason.json") if base == DEFAULT_API_BASE else None
+        session = get_session()
+        with span("api_standings") as sizes:
+            comp_season_id = get_comp_season_id(base, API_HEADERS, label=label, session=session,
+                                                cache_path=cache_path, timeout=timeout)
+            standings = get_standings(base, API_HEADERS, comp_season_id, session=session, timeout=timeout)
+            sizes["rows"] = len(standings)
+        return standings
+    return fetch
+
+def page_source(url, lean=True, parser="lxml"):
+    """Rendered page source (Chrome). Selenium is imported when the source starts, not before."""
+    def fetch(timeout):
+        from modules.get_data.getPremierLeagueTable import get_premier_league_standings
+        return get_premier_league_standings(url, lean=lean, parser=parser, timeout=min(timeout, PAGE_TIMEOUT_S))
+    return fetch
+
+def warm_page_source(browser, url, parser="lxml"):
+    """Rendered page source on a long-lived FetchHtml.WarmBrowser (live mode)."""
+    def fetch(timeout):
+        from modules.get_data.Cassette import rendered_page
+        from modules.get_data.ParseStandings import TABLE_SELECTOR, parse_standings
+        from modules.get_data.TeamNames import canonical_rows
+
+        html = rendered_page(url, TABLE_SELECTOR,
+                             lambda: browser.fetch(url, TABLE_SELECTOR, timeout=min(timeout, PAGE_TIMEOUT_S)))
+        with span("parse", parser=parser, html_bytes=len(html.encode("utf-8"))) as sizes:
+            standings = Standings.from_records(canonical_rows(parse_standings(html, parser)))
+            sizes["rows"] = len(standings)
+        return standings
+    return fetch
+
+def static_page_source(url, parser="lxml"):
+    """Plain GET of a page that already contains the table (mirrors, stub servers); no browser."""
+    def fetch(timeout):
+        from modules.get_data.ApiSession import get_session
+        from modules.get_data.ParseStandings import parse_standings
+        from modules.get_data.TeamNames import canonical_rows
+
+        r = get_session().get(url, timeout=min(timeout, API_TIMEOUT_S))
+        r.raise_for_status()
+        with span("parse", parser=parser, html_bytes=len(r.content)) as sizes:
+            standings = Standings.from_records(canonical_rows(parse_standings(r.text, parser)))
+            sizes["rows"] = len(standings)
+        return standings
+    return fetch
+
+async def attempt_source(name, fetch, deadline, executor, attempts, validate):
+    """Run one source with retries until it returns a valid table, runs out of attempts or of time."""
+    loop = asyncio.get_running_loop()
+    error = None
+    for attempt in range(attempts):
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            break
+        start = loop.time()
+        try:
+            # the worker thread cannot be interrupted; on timeout it is abandoned
+            result = await asyncio.wait_for(loop.run_in_executor(executor, fetch, remaining), remaining)
+            validate(result)
+            record("fetch_attempt", source=name, attempt=attempt + 1, ok=True,
+                   duration_s=round(loop.time() - start, 4))
+            return result
+        except Exception as e:
+            error = e
+            record("fetch_attempt", source=name, attempt=attempt + 1, ok=False,
+                   duration_s=round(loop.time() - start, 4), error=repr(e))
+            print(f"[{name}] attempt {attempt + 1}/{attempts} failed: {e!r}")
+        if attempt + 1 < attempts:
+            delay = min(backoff_delay(attempt), deadline - loop.time())
+            if delay > 0:
+                await asyncio.sleep(delay)
+    raise error or TimeoutError(f"no time left for source '{name}'")
+
+async def first_valid(sources, budget_s=DEFAULT_BUDGET_S, hedge_delay_s=HEDGE_DELAY_S,
+                      attempts=ATTEMPTS, expected_rows=PL_TEAMS):
+    """
+    (name, Standings) of the first source in sources ({name: fetch}, in
+    start order) to deliver a table that passes check_standings. The other
+    sources are cancelled. Raises RuntimeError when none did within budget_s.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + budget_s
+    validate = lambda table: check_standings(table, expected_rows)
+    executor = ThreadPoolExecutor(max_workers=max(1, len(sources)), thread_name_prefix="fetch")
+
+    waiting = list(sources.items())
+    running = {}
+    errors = {}
+    next_start = loop.time()
+    try:
+        while waiting or running:
+            now = loop.time()
+            if now >= deadline:
+                break
+            if waiting and (not running or now >= next_start):
+                name, fetch = waiting.pop(0)
+                task = asyncio.create_task(attempt_source(name, fetch, deadline, executor, attempts, validate))
+                running[task] = name
+                next_start = now + hedge_delay_s
+                continue
+
+            timeout = deadline - now
+            if waiting:
+                timeout = min(timeout, next_start - now)
+            done, _ = await asyncio.wait(running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                name = running.pop(task)
+                try:
+                    return name, task.result()
+                except Exception as e:
+                    errors[name] = e
+    finally:
+        for task in running:
+            task.cancel()
+        if running:
+            await asyncio.gather(*running, return_exceptions=True)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    for name in list(running.values()) + [name for name, _ in waiting]:
+        errors.setdefault(name, TimeoutError("fetch budget used up"))
+    details = "; ".join(f"{name}: {e!r}" for name, e in errors.items())
+    raise RuntimeError(f"No standings source delivered a valid table within {budget_s}s ({details})")
+
+def fetch_first_valid(sources, budget_s=DEFAULT_BUDGET_S, hedge_delay_s=HEDGE_DELAY_S,
+                      attempts=ATTEMPTS, expected_rows=PL_TEAMS):
+    """Blocking wrapper around first_valid; returns the Standings only."""
+    with span("fetch", sources=",".join(sources), budget_s=budget_s) as sizes:
+        name, standings = asyncio.run(first_valid(sources, budget_s, hedge_delay_s, attempts, expected_rows))
+        sizes["source"] = name
+        sizes["rows"] = len(standings)
+    print(f"Standings from source '{name}'")
+    return standings
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Fetch the standings through the orchestrator.")
+    parser.add_argument("--api-base", help="API base URL (default: PLT_API_BASE or the real API)")
+    parser.add_argument("--page", help="URL of a page that already contains the table (no browser)")
+    parser.add_argument("--budget", type=float, default=DEFAULT_BUDGET_S)
+    parser.add_argument("--hedge", type=float, default=HEDGE_DELAY_S, help="0 races all sources at once")
+    parser.add_argument("--attempts", type=int, default=ATTEMPTS)
+    parser.add_argument("--rows", type=int, default=PL_TEAMS, help="expected number of teams")
+    args = parser.parse_args()
+
+    sources = {"api": api_source(args.api_base)}
+    if args.page:
+        sources["static"] = static_page_source(args.page)
+    print(fetch_first_valid(sources, args.budget, args.hedge, args.attempts, args.rows).to_text())
@@ -0,0 +1,38 @@
+import os
+
+# PLT_TABLES_URL points the page source somewhere else, e.g. a local stub server
+TABLES_URL = os.environ.get("PLT_TABLES_URL", 'https://www.premierleague.com/tables')
+
+# source -> sources handed to the orchestrator, in start order
+SOURCE_MODES = {
+    "auto": ("api", "page"),    # API first, Chrome joins if it is slow or fails
+    "race": ("api", "page"),    # both at once, first valid table wins
+    "api": ("api",),
+    "page": ("page",),
+    "static": ("static",),      # TABLES_URL without a browser (server-rendered copies, stubs)
+}
+
+def fetch_standings(source="auto", lean=True, parser="lxml", budget_s=None):
+    """
+    Current standings (a compact Standings table, see modules.core.Standings)
+    from the pulselive API ("api"), the rendered page ("page") or the API
+    with the page hedged behind it ("auto"). Use .to_dataframe() for pandas.
+
+    All sources go through FetchOrchestrator: retries with jittered backoff,
+    one total time budget (budget_s) and a schema check on the result.
+    Selenium is only imported when the page is actually needed.
+    """
+    if source not in SOURCE_MODES:
+        raise ValueError(f"Unknown standings source '{source}'. Use {', '.join(SOURCE_MODES)}.")
+
+    from modules.get_data.FetchOrchestrator import (
+        DEFAULT_BUDGET_S, HEDGE_DELAY_S, api_source, page_source, static_page_source, fetch_first_valid,
+    )
+    builders = {
+        "api": lambda: api_source(),
+        "page": lambda: page_source(TABLES_URL, lean=lean, parser=parser),
+        "static": lambda: static_page_source(TABLES_URL, parser=parser),
+    }
+    sources = {name: builders[name]() for name in SOURCE_MODES[source]}
+    hedge_delay_s = 0 if source == "race" else HEDGE_DELAY_S
+    return fetch_first_valid(sources, budget_s or DEFAULT_BUDGET_S, hedge_delay_s)
@@ -0,0 +1,186 @@
+import sys
+import time
+
+from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
+
+from modules.get_data.ToInt import to_int
+from modules.get_data.take import take
+
+TABLE_SELECTOR = "div.standings__table-container table.standings-table"
+
+def make_row(pos, team, stats, next_team):
+    return {
+        "Pos":    to_int(pos),
+        "Team":   team,
+        "Played": to_int(stats.get("standingsRowStatPlayed")),
+        "Won":    to_int(stats.get("standingsRowStatWon")),
+        "Drawn":  to_int(stats.get("standingsRowStatDrawn")),
+        "Lost":   to_int(stats.get("standingsRowStatLost")),
+        "GF":     to_int(stats.get("standingsRowStatGoalFor")),
+        "GA":     to_int(stats.get("standingsRowStatGoalAgainst")),
+        "GD":     to_int(stats.get("standingsRowStatGoalDifference")),
+        "Points": to_int(stats.get("standingsRowPoints")),
+        "Next":   next_team,
+    }
+
+STAT_IDS = [
+    "standingsRowStatPlayed", "standingsRowStatWon", "standingsRowStatDrawn", "standingsRowStatLost",
+    "standingsRowStatGoalFor", "standingsRowStatGoalAgainst", "standingsRowStatGoalDifference",
+    "standingsRowPoints",
+]
+
+def parse_standings_bs4(html):
+    """Reference parser: BeautifulSoup + one CSS query per cell."""
+    soup = BeautifulSoup(html, "lxml")
+
+    table = soup.select_one(TABLE_SELECTOR)
+    if not table:
+        raise ValueError(f"Could not find standings table with selector '{TABLE_SELECTOR}'.")
+
+    rows = []
+    for row in table.select('tbody [data-testid="standingsRow"]'):
+        # Position (there are two position spans for different breakpoints; pick the first meaningful one)
+        pos_els = row.select('[data-testid="standingsRowPosition"]')
+        if not pos_els:
+            # Some builds keep position in a single element
+            pos_text = row.select_one(".standings-row__position")
+            pos = pos_text.get_text(strip=True) if pos_text else None
+        else:
+            pos = pos_els[0].get_text(strip=True)
+
+        # Team name (prefer the long one if present)
+        team = None
+        team_long = row.select_one('[data-testid="standingsTeamName"]')
+        if team_long:
+            team = team_long.get_text(strip=True)
+        else:
+            team_short = row.select_one(".standings-row__team-name-short")
+            team = team_short.get_text(strip=True) if team_short else None
+
+        stats = {dt_id: take(dt_id, row) for dt_id in STAT_IDS}
+
+        # Next opponent (read the alt text from the badge in the 'next team' cell if available)
+        next_cell = row.select_one('[data-testid="standingsRowNextTeam"]')
+        next_team = None
+        if next_cell:
+            # Try alt text (e.g., "Newcastle United club badge")
+            img = next_cell.select_one("img[alt]")
+            if img and img.has_attr("alt"):
+                alt = img["alt"].strip()
+                next_team = alt.replace(" club badge", "")
+            # If no image/alt, keep None
+
+        rows.append(make_row(pos, team, stats, next_team))
+
+    return rows
+
+# BeautifulSoup's get_text() leaves out the contents of these tags
+SKIP_TEXT_TAGS = {"script", "style", "template"}
+
+def collect_text(node, parts):
+    if not isinstance(node.tag, str) or node.tag in SKIP_TEXT_TAGS:
+        return
+    if node.text:
+        parts.append(node.text)
+    for child in node:
+        collect_text(child, parts)
+        if child.tail:
+            parts.append(child.tail)
+
+def cell_text(el):
+    # same result as BeautifulSoup's get_text(strip=True)
+    parts = []
+    collect_text(el, parts)
+    return "".join(p.strip() for p in parts)
+
+def has_class(el, cls):
+    return cls in (el.get("class") or "").split()
+
+TABLE_XPATH = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' standings__table-container ')]"
+    "//table[contains(concat(' ', normalize-space(@class), ' '), ' standings-table ')]"
+)
+ROWS_XPATH = etree.XPath(".//tbody//*[@data-testid='standingsRow']")
+
+def parse_standings_lxml(html):
+    """
+    Fast parser: one compiled XPath for the table and its rows, then a
+    single walk over each row's descendants that picks up every
+    data-testid cell at once. Emits the same rows as parse_standings_bs4.
+    """
+    doc = lxml_html.document_fromstring(html)
+
+    tables = TABLE_XPATH(doc)
+    if not tables:
+        raise ValueError(f"Could not find standings table with selector '{TABLE_SELECTOR}'.")
+
+    rows = []
+    for row in ROWS_XPATH(tables[0]):
+        cells = {}
+        pos_fallback = None
+        team_short = None
+        for el in row.iterdescendants():
+            if not isinstance(el.tag, str):
+                continue
+            dt_id = el.get("data-testid")
+            if dt_id is not None:
+                if dt_id not in cells:
+                    cells[dt_id] = el
+            elif el.get("class"):
+                if pos_fallback is None and has_class(el, "standings-row__position"):
+                    pos_fallback = el
+                elif team_short is None and has_class(el, "standings-row__team-name-short"):
+                    team_short = el
+
+        pos_el = cells.get("standingsRowPosition", pos_fallback)
+        pos = cell_text(pos_el) if pos_el is not None else None
+
+        team_el = cells.get("standingsTeamName", team_short)
+        team = cell_text(team_el) if team_el is not None else None
+
+        stats = {dt_id: cell_text(cells[dt_id]) for dt_id in STAT_IDS if dt_id in cells}
+
+        next_team = None
+        next_cell = cells.get("standingsRowNextTeam")
+        if next_cell is not None:
+            for img in next_cell.iter("img"):
+                alt = img.get("alt")
+                if alt is not None:
+                    next_team = alt.strip().replace(" club badge", "")
+                    break
+
+        rows.append(make_row(pos, team, stats, next_team))
+
+    return rows
+
+PARSERS = {
+    "bs4": parse_standings_bs4,
+    "lxml": parse_standings_lxml,
+}
+
+def parse_standings(html, parser="lxml"):
+    if parser not in PARSERS:
+        raise ValueError(f"Unknown standings parser '{parser}'. Available: {list(PARSERS)}")
+    return PARSERS[parser](html)
+
+def check_parsers(html):
+    """Parse html with every backend; return {parser: seconds}, raising if their rows differ."""
+    timings = {}
+    results = {}
+    for name, parse in PARSERS.items():
+        start = time.perf_counter()
+        results[name] = parse(html)
+        timings[name] = time.perf_counter() - start
+    reference = results["bs4"]
+    for name, rows in results.items():
+        if rows != reference:
+            raise AssertionError(f"Parser '{name}' disagrees with 'bs4' on {len(rows)} vs {len(reference)} rows.")
+    return timings
+
+if __name__ == "__main__":
+    # python -m modules.get_data.ParseStandings page.html [page.html ...]
+    for path in sys.argv[1:]:
+        with open(path, "r", encoding="utf-8") as f:
+            timings = check_parsers(f.read())
+        print(path, " ".join(f"{name}={secs * 1000:.1f}ms" for name, secs in timings.items()))
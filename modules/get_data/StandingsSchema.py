@@ -0,0 +1,27 @@
+STANDINGS_COLUMNS = ["Pos", "Team", "Played", "Won", "Drawn", "Lost", "GF", "GA", "GD", "Points", "Next"]
+
+def check_standings_schema(df, expected_rows=None):
+    """
+    Raise ValueError unless df looks like a parsed standings table:
+    the STANDINGS_COLUMNS in order, no missing Pos/Team and, if given,
+    exactly expected_rows rows.
+    """
+    if list(df.columns) != STANDINGS_COLUMNS:
+        raise ValueError(f"Unexpected standings columns: {list(df.columns)}")
+    if df.empty:
+        raise ValueError("Standings table is empty.")
+    if df["Pos"].isna().any() or df["Team"].isna().any():
+        raise ValueError("Standings table has rows without position or team.")
+    if expected_rows is not None and len(df) != expected_rows:
+        raise ValueError(f"Expected {expected_rows} standings rows, got {len(df)}.")
+    return df
+
+def check_standings(standings, expected_rows=None):
+    """check_standings_schema for the compact Standings table (no pandas)."""
+    if len(standings) == 0:
+        raise ValueError("Standings table is empty.")
+    if any(row.Pos is None or row.Team is None for row in standings):
+        raise ValueError("Standings table has rows without position or team.")
+    if expected_rows is not None and len(standings) != expected_rows:
+        raise ValueError(f"Expected {expected_rows} standings rows, got {len(standings)}.")
+    return standings
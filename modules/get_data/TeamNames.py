@@ -0,0 +1,51 @@
+"""
+Team names as players/*.json spells them, and the spellings the standings
+sources use for the same clubs: the pulselive API's name and shortName,
+the club abbreviation and the table page's badge texts.
+
+Every source maps its names through TEAM_NAMES, so Team and Next come out
+the same whichever source delivered the table (and the fingerprint does
+not change with the source). A name that is not listed is an error, never
+passed through: add the new spelling (or a promoted club) here.
+"""
+
+# players/*.json name, pulselive shortName, abbreviation, other spellings
+CLUBS = [
+    ("Arsenal", "Arsenal", "ARS"),
+    ("Aston Villa", "Aston Villa", "AVL"),
+    ("AFC Bournemouth", "Bournemouth", "BOU"),
+    ("Brentford", "Brentford", "BRE"),
+    ("Brighton and Hove Albion", "Brighton", "BHA", "Brighton & Hove Albion"),
+    ("Burnley", "Burnley", "BUR"),
+    ("Chelsea", "Chelsea", "CHE"),
+    ("Crystal Palace", "Crystal Palace", "CRY"),
+    ("Everton", "Everton", "EVE"),
+    ("Fulham", "Fulham", "FUL"),
+    ("Leeds United", "Leeds", "LEE"),
+    ("Liverpool", "Liverpool", "LIV"),
+    ("Manchester City", "Man City", "MCI"),
+    ("Manchester United", "Man Utd", "MUN"),
+    ("Newcastle United", "Newcastle", "NEW"),
+    ("Nottingham Forest", "Nott'm Forest", "NFO"),
+    ("Sunderland", "Sunderland", "SUN"),
+    ("Tottenham Hotspur", "Spurs", "TOT"),
+    ("West Ham United", "West Ham", "WHU"),
+    ("Wolverhampton Wanderers", "Wolves", "WOL"),
+]
+
+TEAMS = [club[0] for club in CLUBS]
+
+TEAM_NAMES = {spelling: club[0] for club in CLUBS for spelling in club}
+
+def team_name(name, source="API"):
+    """players/*.json spelling of a source's team name; ValueError for a name not in TEAM_NAMES."""
+    try:
+        return TEAM_NAMES[name]
+    except KeyError:
+        raise ValueError(f"Unknown team {name!r} from the {source}: add it to CLUBS in "
+                         "modules/get_data/TeamNames.py") from None
+
+def canonical_rows(rows, source="page"):
+    """Standings rows with Team and Next (where known) in players/*.json spelling."""
+    # (rows without a Team are left alone: Standings.from_records drops them)
+    return [{**row, **{c: team_name(row[c], source) for c in ("Team", "Next") if row.get(c)}} for row in rows]
@@ -1,10 +1,31 @@
-import requests
+import json
+import os
 
-def get_comp_season_id(base, headers, label="2025/26", comp_id=1):
+from modules.get_data.ApiSession import default_http
+
+def get_comp_season_id(base, headers, label="2025/26", comp_id=1, session=None, cache_path=None, timeout=30):
     # comp_id=1 is Premier League
-    r = requests.get(f"{base}/compseasons", params={"comps": comp_id}, headers=headers, timeout=30)
+    # The id of a season never changes, so it is cached on disk once found.
+    cache_key = f"{comp_id}:{label}"
+    cache = {}
+    if cache_path and os.path.exists(cache_path):
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache_key in cache:
+            return cache[cache_key]
+
+    http = session if session is not None else default_http()
+    r = http.get(f"{base}/compseasons", params={"comps": comp_id}, headers=headers, timeout=timeout)
     r.raise_for_status()
-    for cs in r.json().get("compSeasons", []):
+    data = r.json()
+    # Older responses list seasons under "compSeasons", paged ones under "content"
+    for cs in data.get("compSeasons", data.get("content", [])):
         if cs.get("label") == label:
-            return cs.get("id")
-    raise ValueError(f"Could not find compSeason with label {label}")
\ No newline at end of file
+            comp_season_id = int(cs.get("id"))
+            if cache_path:
+                cache[cache_key] = comp_season_id
+                os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+                with open(cache_path, "w", encoding="utf-8") as f:
+                    json.dump(cache, f, indent=2)
+            return comp_season_id
+    raise ValueError(f"Could not find compSeason with label {label}")
@@ -0,0 +1,36 @@
+from modules.get_data.ApiSession import default_http
+from modules.get_data.TeamNames import team_name
+
+def get_fixtures(base, headers, comp_season_id, statuses="U", session=None):
+    """
+    Fixtures of a compSeason from the pulselive API, by default only the
+    unplayed ones (status U). Returns a list of
+    {"home": team, "away": team, "kickoff": epoch millis or None}, teams in
+    players/*.json spelling (see TeamNames).
+    """
+    http = session if session is not None else default_http()
+    fixtures = []
+    page = 0
+    while True:
+        r = http.get(
+            f"{base}/fixtures",
+            params={"compSeasons": comp_season_id, "statuses": statuses, "altIds": "true",
+                    "page": page, "pageSize": 100, "sort": "asc"},
+            headers=headers,
+            timeout=30
+        )
+        r.raise_for_status()
+        data = r.json()
+        for fx in data.get("content", []):
+            teams = fx.get("teams", [])
+            if len(teams) != 2:
+                continue
+            fixtures.append({
+                "home": team_name(teams[0]["team"]["name"]),
+                "away": team_name(teams[1]["team"]["name"]),
+                "kickoff": (fx.get("kickoff") or {}).get("millis"),
+            })
+        num_pages = (data.get("pageInfo") or {}).get("numPages", 1)
+        page += 1
+        if page >= num_pages:
+            return fixtures
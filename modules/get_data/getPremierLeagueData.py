@@ -1,15 +1,39 @@
+import os
+
+from modules.common.BasePath import get_base_path
+from modules.get_data.ApiSession import API_BASE, API_HEADERS, DEFAULT_API_BASE, get_session
 from modules.get_data.getCompSeasonID import get_comp_season_id
+from modules.get_data.getStandingDf import get_standings
+from modules.get_data.getFixtures import get_fixtures
+from modules.common.RunLog import span
+
+def get_premier_league_data(label="2025/26"):
+    """
+    Browserless standings source: the pulselive JSON API behind premierleague.com.
+
+    Returns the same DataFrame schema as get_premier_league_table. The
+    compSeason id is cached in cache/compseason.json so a normal run costs a
+    single HTTP request.
+    """
+    return get_premier_league_standings(label).to_dataframe()
+
+def get_premier_league_standings(label="2025/26"):
+    """get_premier_league_data as a compact Standings table (no pandas)."""
+    session = get_session()
+    with span("api_standings") as sizes:
+        standings = get_standings(API_BASE, API_HEADERS, cached_comp_season_id(label), session=session)
+        sizes["rows"] = len(standings)
+    return standings
+
+def cached_comp_season_id(label="2025/26"):
+    # ids of a stub or mirror API must not end up in the real cache
+    cache_path = os.path.join(get_base_path(), "cache", "compseason.json") if API_BASE == DEFAULT_API_BASE else None
+    return get_comp_season_id(API_BASE, API_HEADERS, label=label,
+                              session=get_session(), cache_path=cache_path)
 
-def get_premier_league_data():
-    base = "https://footballapi.pulselive.com/football"
-    headers = {
-        # These headers help mimic a normal browser request to the PL site
-        "User-Agent": "Mozilla/5.0",
-        "Accept": "application/json, text/plain, */*",
-        "Origin": "https://www.premierleague.com",
-        "Referer": "https://www.premierleague.com/",
-    }
-    comp_season_id = get_comp_season_id(base, headers)
-    table = get_premier_league_data(base, headers, comp_season_id)
-
-    print(table)
\ No newline at end of file
+def get_premier_league_fixtures(label="2025/26"):
+    """Remaining (unplayed) fixtures of the season from the pulselive API."""
+    with span("api_fixtures") as sizes:
+        fixtures = get_fixtures(API_BASE, API_HEADERS, cached_comp_season_id(label), session=get_session())
+        sizes["fixtures"] = len(fixtures)
+    return fixtures
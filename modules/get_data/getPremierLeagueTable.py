@@ -1,82 +1,43 @@
 # modules/get_data/parsePremierLeagueStandings.py
-from bs4 import BeautifulSoup
-import pandas as pd
+from modules.get_data.Cassette import rendered_page
+from modules.get_data.ParseStandings import TABLE_SELECTOR, parse_standings
+from modules.get_data.TeamNames import canonical_rows
+from modules.common.RunLog import span
+from modules.core.Standings import Standings
 
-from modules.get_data.ToInt import to_int
-from modules.get_data.take import take
-from modules.get_data.FetchHtml import fetch_rendered_html_debug
-
-def get_premier_league_table(url: str) -> pd.DataFrame:
+def get_premier_league_table(url: str, lean: bool = True, parser: str = "lxml"):
     """
     Parse the Premier League standings table from HTML that contains:
       <div class="standings__table-container"><table class="standings-table">...</table></div>
 
     Returns a DataFrame with columns:
     Pos, Team, Played, Won, Drawn, Lost, GF, GA, GD, Points, Next
-    """
-    table_selector = "div.standings__table-container table.standings-table"
-    html = fetch_rendered_html_debug(url, table_selector)
-
-    soup = BeautifulSoup(html, "lxml")
-
-    table = soup.select_one(table_selector)
-    if not table:
-        raise ValueError("Could not find standings table with selector "
-                         "'div.standings__table-container table.standings-table'.")
-
-    rows = []
-    for row in table.select('tbody [data-testid="standingsRow"]'):
-        # Position (there are two position spans for different breakpoints; pick the first meaningful one)
-        pos_els = row.select('[data-testid="standingsRowPosition"]')
-        if not pos_els:
-            # Some builds keep position in a single element
-            pos_text = row.select_one(".standings-row__position")
-            pos = pos_text.get_text(strip=True) if pos_text else None
-        else:
-            pos = pos_els[0].get_text(strip=True)
-
-        # Team name (prefer the long one if present)
-        team = None
-        team_long = row.select_one('[data-testid="standingsTeamName"]')
-        if team_long:
-            team = team_long.get_text(strip=True)
-        else:
-            team_short = row.select_one(".standings-row__team-name-short")
-            team = team_short.get_text(strip=True) if team_short else None
 
-        played = take("standingsRowStatPlayed", row)
-        won    = take("standingsRowStatWon", row)
-        drawn  = take("standingsRowStatDrawn", row)
-        lost   = take("standingsRowStatLost", row)
-        gf     = take("standingsRowStatGoalFor", row)
-        ga     = take("standingsRowStatGoalAgainst", row)
-        gd     = take("standingsRowStatGoalDifference", row)
-        pts    = take("standingsRowPoints", row)
-
-        # Next opponent (read the alt text from the badge in the 'next team' cell if available)
-        next_cell = row.select_one('[data-testid="standingsRowNextTeam"]')
-        next_team = None
-        if next_cell:
-            # Try alt text (e.g., "Newcastle United club badge")
-            img = next_cell.select_one("img[alt]")
-            if img and img.has_attr("alt"):
-                alt = img["alt"].strip()
-                next_team = alt.replace(" club badge", "")
-            # If no image/alt, keep None
-
-        rows.append({
-            "Pos":    to_int(pos),
-            "Team":   team,
-            "Played": to_int(played),
-            "Won":    to_int(won),
-            "Drawn":  to_int(drawn),
-            "Lost":   to_int(lost),
-            "GF":     to_int(gf),
-            "GA":     to_int(ga),
-            "GD":     to_int(gd),
-            "Points": to_int(pts),
-            "Next":   next_team,
-        })
+    With lean=True the page is fetched with the lean Chrome profile
+    (no images/fonts/trackers, one consolidated wait); lean=False uses the
+    slower debug fetch. parser selects the HTML backend ("lxml" single-pass
+    or the reference "bs4" one), see ParseStandings.PARSERS.
+    """
+    return get_premier_league_standings(url, lean=lean, parser=parser).to_dataframe()
 
-    df = pd.DataFrame(rows).dropna(subset=["Pos", "Team"]).sort_values("Pos").reset_index(drop=True)
-    return df
\ No newline at end of file
+def get_premier_league_standings(url: str, lean: bool = True, parser: str = "lxml", timeout: float = 45) -> Standings:
+    """
+    get_premier_league_table as a compact Standings table (no pandas).
+    timeout bounds the wait for the table (lean fetch only).
+    """
+    def fetch():
+        # selenium is only imported when Chrome is really needed (not on cassette replay)
+        from modules.get_data.FetchHtml import fetch_rendered_html_debug, fetch_rendered_html_lean
+
+        if lean:
+            return fetch_rendered_html_lean(url, TABLE_SELECTOR, timeout=timeout)
+        return fetch_rendered_html_debug(url, TABLE_SELECTOR)
+
+    html = rendered_page(url, TABLE_SELECTOR, fetch)
+
+    with span("parse", parser=parser, html_bytes=len(html.encode("utf-8"))) as sizes:
+        # badge texts and short names -> players/*.json spelling, like the API source
+        rows = canonical_rows(parse_standings(html, parser))
+        standings = Standings.from_records(rows)
+        sizes["rows"] = len(standings)
+    return standings
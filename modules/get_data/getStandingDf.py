@@ -1,42 +1,92 @@
-import pandas as pd
-import requests
+from modules.core.Standings import Standings
+from modules.get_data.ApiSession import default_http
+from modules.get_data.StandingsSchema import check_standings, check_standings_schema
+from modules.get_data.TeamNames import team_name
 
-def get_standings_df(base, headers, comp_season_id):
+# pulselive stat names -> our column names
+STAT_NAMES = {
+    "Played": ("played", "matchesPlayed"),
+    "Won":    ("won", "wins"),
+    "Drawn":  ("drawn", "draws"),
+    "Lost":   ("lost", "losses"),
+    "GF":     ("goalsFor",),
+    "GA":     ("goalsAgainst",),
+    "GD":     ("goalsDifference", "goalDifference"),
+    "Points": ("points",),
+}
+
+def stat_to_int(value):
+    # the API reports counts as floats (e.g. 19.0)
+    if value is None:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+def next_opponent(entry, team_name):
+    # "next" is the team's upcoming fixture; the opponent is the other team in it
+    fixture = entry.get("next") or {}
+    for side in fixture.get("teams", []):
+        name = (side.get("team") or {}).get("name")
+        if name and name != team_name:
+            return name
+    return None
+
+def get_standings_df(base, headers, comp_season_id, session=None, timeout=30):
+    """
+    Fetch the overall standings of a compSeason from the pulselive API.
+
+    Returns a DataFrame with the same columns as get_premier_league_table:
+    Pos, Team, Played, Won, Drawn, Lost, GF, GA, GD, Points, Next
+
+    Team and Next are in players/*.json spelling (see TeamNames); a team
+    the mapping does not know raises ValueError.
+    """
+    df = get_standings(base, headers, comp_season_id, session=session, timeout=timeout).to_dataframe()
+    return check_standings_schema(df)
+
+def get_standings(base, headers, comp_season_id, session=None, timeout=30):
+    """get_standings_df as a compact, pandas-free Standings table."""
+    http = session if session is not None else default_http()
     # Standings for a given compSeason
-    r = requests.get(
+    r = http.get(
         f"{base}/standings",
-        params={"compSeasons": comp_season_id, "altIds": "true"},
+        params={"compSeasons": comp_season_id, "altIds": "true", "detail": 2},
         headers=headers,
-        timeout=30
+        timeout=timeout
     )
     r.raise_for_status()
     data = r.json()
 
-    # The API returns multiple tables (overall/home/away). We take the overall.
+    # The API may return multiple tables (overall/home/away). We take the overall.
+    tables = data.get("tables", [])
     overall = None
-    for table in data.get("tables", []):
+    for table in tables:
         if table.get("type", {}).get("value") == "TOTAL":
             overall = table
             break
+    if overall is None and len(tables) == 1:
+        overall = tables[0]
     if overall is None:
         raise RuntimeError("No overall standings found in API response.")
 
     rows = []
     for pos in overall.get("entries", []):
         team = pos["team"]
-        stats = pos["stats"]  # list of dicts with 'name' and 'value'
-        stat_map = {s["name"]: s["value"] for s in stats}
-        rows.append({
-            "Team": team.get("name"),
-            "Played": stat_map.get("matchesPlayed"),
-            "Won": stat_map.get("wins"),
-            "Drawn": stat_map.get("draws"),
-            "Lost": stat_map.get("losses"),
-            "GF": stat_map.get("goalsFor"),
-            "GA": stat_map.get("goalsAgainst"),
-            "GD": stat_map.get("goalDifference"),
-            "Points": stat_map.get("points")
-        })
-
-    df = pd.DataFrame(rows).sort_values("Pos").reset_index(drop=True)
-    return df
\ No newline at end of file
+        # detail=2 answers carry an "overall" block, older ones a list of {name, value}
+        if "overall" in pos:
+            stat_map = pos["overall"]
+        else:
+            stat_map = {s["name"]: s["value"] for s in pos.get("stats", [])}
+
+        name = team.get("name")
+        row = {"Pos": stat_to_int(pos.get("position")), "Team": team_name(name)}
+        for col, names in STAT_NAMES.items():
+            value = next((stat_map[n] for n in names if n in stat_map), None)
+            row[col] = stat_to_int(value)
+        opponent = next_opponent(pos, name)
+        row["Next"] = team_name(opponent) if opponent else None
+        rows.append(row)
+
+    return check_standings(Standings.from_records(rows))
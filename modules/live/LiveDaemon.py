@@ -0,0 +1,222 @@
+"""
+Live matchday mode: one long-running process that keeps a warm HTTP
+session (and, if the API fails, one warm Chrome), polls the standings every
+LIVE_POLL_S during match windows and backs off to at most IDLE_POLL_S
+otherwise. Only players owning a team whose row changed are recomputed and
+re-rendered; live.html is rewritten from the cached player blocks.
+
+    python -m modules.live.LiveDaemon [--group NAME] [--source auto|api|page] [--once]
+
+live.html only has the live summary and player tables. table.html (with
+the projection, title race and points race) and the snapshots stay with
+the daily job, so live mode never replaces them with the reduced layout.
+"""
+import json
+import os
+import time
+
+from datetime import datetime
+from html import escape
+
+from modules.common.Groups import DEFAULT_GROUP, group_root, players_file
+from modules.calc_tables.CalcPlayerStandings import build_player_standings
+from modules.calc_tables.GetPlayerTeams import get_player_teams
+from modules.core.Standings import PLAYER_COLUMNS
+from modules.create_html.CreateHtml import build_html, infer_table, render_player_rows, render_table
+
+LIVE_POLL_S = 60
+IDLE_POLL_S = 30 * 60
+# a match window runs from shortly before kickoff to well after the final whistle
+PRE_KICKOFF_S = 10 * 60
+MATCH_WINDOW_S = 2 * 60 * 60 + 15 * 60
+# keep polling fast for a while after a change (fixtures unknown or rescheduled)
+RECENT_CHANGE_S = 30 * 60
+FIXTURE_REFRESH_S = 6 * 60 * 60
+# one poll, all sources and retries included
+POLL_BUDGET_S = 90
+
+LIVE_FILE = "live.html"
+
+def match_windows(kickoffs):
+    """(start, end) epoch seconds of each kickoff (epoch millis, None skipped), sorted."""
+    return sorted((k / 1000 - PRE_KICKOFF_S, k / 1000 + MATCH_WINDOW_S) for k in kickoffs if k is not None)
+
+def next_poll_delay(now, windows, last_change=None):
+    """
+    Seconds until the next poll: LIVE_POLL_S inside a match window or
+    shortly after a change, otherwise until the next window opens, capped
+    at IDLE_POLL_S.
+    """
+    if any(start <= now <= end for start, end in windows):
+        return LIVE_POLL_S
+    if last_change is not None and now - last_change < RECENT_CHANGE_S:
+        return LIVE_POLL_S
+    upcoming = [start for start, _ in windows if start > now]
+    if not upcoming:
+        return IDLE_POLL_S
+    return min(max(min(upcoming) - now, LIVE_POLL_S), IDLE_POLL_S)
+
+class LiveState:
+    """
+    Latest standings with every player's table, totals and rendered block.
+
+    update() diffs a new table against the previous one row by row and
+    recomputes only the players owning a changed team. Memory is bounded by
+    the number of players: nothing is kept per poll.
+    """
+
+    def __init__(self, player_teams):
+        self.player_teams = player_teams
+        self.owners = {}
+        for player, teams in player_teams.items():
+            for team in teams:
+                self.owners.setdefault(team, []).append(player)
+        self.table = None
+        self.totals = {}
+        self.blocks = {}
+
+    def update(self, table):
+        """Apply a new Standings table; returns the set of recomputed players."""
+        if self.table is None:
+            affected = set(self.player_teams)
+        else:
+            changed = {row.Team for row in table if row.Team not in self.table
+                       or self.table.team(row.Team) != row}
+            changed |= {row.Team for row in self.table if row.Team not in table}
+            affected = {p for team in changed for p in self.owners.get(team, ())}
+        self.table = table
+        if not affected:
+            return affected
+
+        subset = {p: self.player_teams[p] for p in self.player_teams if p in affected}
+        player_tables, summary = build_player_standings(table, subset)
+        for record in summary:
+            name = record["name"]
+            self.totals[name] = {k: v for k, v in record.items() if k != "position"}
+            self.blocks[name] = render_player_rows(name, player_tables[name].records(PLAYER_COLUMNS))
+        return affected
+
+    def summary(self):
+        """Summary records like build_player_standings, from the cached totals."""
+        # ties keep player order, like build_player_standings
+        ranked = sorted((self.totals[p] for p in self.player_teams),
+                        key=lambda s: (-s["Points"], -s["GD"], -s["GF"]))
+        return [{"position": i, **s} for i, s in enumerate(ranked, start=1)]
+
+    def render(self, status=""):
+        summary_cols, summary_rows = infer_table(self.summary())
+        live_card = f"""
+    <div class="card">
+      <div class="hdr"><h2>Live</h2><div class="muted">{escape(status)}</div></div>
+      <p class="muted">Projection, title race and history: <a href="table.html">daily table</a></p>
+    </div>
+    """
+        players_html = "\n".join(self.blocks[p] for p in self.player_teams)
+        return build_html(render_table(summary_cols, summary_rows), players_html,
+                          title="League Overview (live)", extra_sections=live_card)
+
+def write_atomic(path, text):
+    # a reader (web server, browser) never sees a half written page
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+def load_player_teams(group):
+    with open(players_file(group), "r", encoding="utf-8") as f:
+        return get_player_teams(json.load(f))
+
+def fetch_kickoffs():
+    """Kickoff times (epoch millis) of unplayed and live fixtures."""
+    from modules.get_data.ApiSession import API_BASE, API_HEADERS, get_session
+    from modules.get_data.getFixtures import get_fixtures
+    from modules.get_data.getPremierLeagueData import cached_comp_season_id
+
+    fixtures = get_fixtures(API_BASE, API_HEADERS, cached_comp_season_id(), statuses="U,L", session=get_session())
+    return [fx["kickoff"] for fx in fixtures]
+
+def make_sources(source, browser_holder, parser="lxml"):
+    from modules.get_data.Cassette import replaying
+    from modules.get_data.FetchOrchestrator import api_source, page_source, warm_page_source
+    from modules.get_data.FetchStandings import TABLES_URL
+
+    def browser():
+        # Chrome is only started if the page is actually polled
+        if not browser_holder:
+            from modules.get_data.FetchHtml import WarmBrowser
+            browser_holder.append(WarmBrowser())
+        return browser_holder[0]
+
+    sources = {}
+    if source in ("auto", "api"):
+        sources["api"] = api_source()
+    if source in ("auto", "page") and replaying():
+        # recorded page sources only: no Chrome to keep warm
+        sources["page"] = page_source(TABLES_URL, parser=parser)
+    elif source in ("auto", "page"):
+        sources["page"] = lambda timeout: warm_page_source(browser(), TABLES_URL, parser)(timeout)
+    return sources
+
+def run_live(group=DEFAULT_GROUP, source="auto", once=False):
+    """Poll and re-render until interrupted (or after one poll with once=True)."""
+    from modules.get_data.FetchOrchestrator import HEDGE_DELAY_S, fetch_first_valid
+
+    # not table.html: that page is the daily job's full render
+    out_file = os.path.join(group_root(group), LIVE_FILE)
+    players_path = players_file(group)
+    browser_holder = []
+    sources = make_sources(source, browser_holder)
+
+    state = None
+    players_mtime = None
+    windows = []
+    fixtures_at = None
+    last_change = None
+    try:
+        while True:
+            now = time.time()
+            if fixtures_at is None or now - fixtures_at > FIXTURE_REFRESH_S:
+                try:
+                    windows = match_windows(fetch_kickoffs())
+                except Exception as e:
+                    print(f"Fixture list unavailable ({e!r}), polling on changes only")
+                fixtures_at = now
+
+            mtime = os.path.getmtime(players_path)
+            if state is None or mtime != players_mtime:
+                state = LiveState(load_player_teams(group))
+                players_mtime = mtime
+
+            try:
+                table = fetch_first_valid(sources, POLL_BUDGET_S, HEDGE_DELAY_S)
+            except Exception as e:
+                print(f"Poll failed: {e}")
+            else:
+                t0 = time.perf_counter()
+                affected = state.update(table)
+                if affected:
+                    last_change = now
+                    stamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+                    write_atomic(out_file, state.render(f"updated {stamp}"))
+                    print(f"{stamp}: {len(affected)} of {len(state.player_teams)} players recomputed "
+                          f"in {(time.perf_counter() - t0) * 1000:.1f} ms -> {out_file}")
+
+            if once:
+                return state
+            time.sleep(next_poll_delay(time.time(), windows, last_change))
+    except KeyboardInterrupt:
+        print("Stopped.")
+        return state
+    finally:
+        for browser in browser_holder:
+            browser.close()
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Live matchday mode.")
+    parser.add_argument("--group", default=DEFAULT_GROUP)
+    parser.add_argument("--source", choices=["auto", "api", "page"], default="auto")
+    parser.add_argument("--once", action="store_true", help="poll and render once, then exit")
+    args = parser.parse_args()
+    run_live(args.group, args.source, args.once)
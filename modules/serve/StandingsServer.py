@@ -0,0 +1,300 @@
+"""
+Small asyncio HTTP server for the latest snapshot (standard library only).
+
+The latest snapshot, and with history=True the season series, is parsed
+once and kept in memory. Responses are cached per URL and encoding, carry
+a strong ETag (If-None-Match -> 304) and are gzipped for clients that ask.
+A background task watches the data/ folder, data/_meta/catalog.json and
+archive/series.json and reloads as soon as a new snapshot is written. The
+server only reads: it never writes the catalog of the data/ it serves.
+
+    GET /                          full page (as table.html)
+    GET /players/<name>            page with one player's table
+    GET /api/summary               summary rows
+    GET /api/players               player names
+    GET /api/players/<name>        one player's rows
+    GET /api/snapshots?from=&to=   catalog entries in a date range
+    GET /api/snapshots/<date>      one day's snapshot
+    GET /api/history?from=&to=&player=   position/points series (history=True)
+    GET /healthz
+
+    python -m modules.serve.StandingsServer [--port 8080] [--group NAME] [--history]
+"""
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+
+from collections import OrderedDict
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from modules.archive.SnapshotCatalog import SnapshotCatalog, catalog_path
+from modules.common.Groups import DEFAULT_GROUP, group_root
+from modules.create_html.CreateHtml import build_html, load_series, render_player_rows, render_snapshot_html
+
+RELOAD_INTERVAL_S = 1.0
+IDLE_TIMEOUT_S = 15
+CACHE_SIZE = 256
+# smaller bodies are not worth compressing
+GZIP_MIN_BYTES = 1024
+
+REASONS = {200: "OK", 304: "Not Modified", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed"}
+
+class HttpError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def json_body(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+class SnapshotStore:
+    """In-memory latest snapshot (plus series) of one group; reload() when the files change."""
+
+    def __init__(self, group=DEFAULT_GROUP, history=False, base_path=None):
+        self.root = group_root(group, base_path)
+        self.data_dir = os.path.join(self.root, "data")
+        self.history = history
+        self.stamp = None
+        self.reload()
+
+    def file_stamp(self):
+        stamp = []
+        # data/ itself: a snapshot added or removed without a catalog update changes its mtime
+        for path in (self.data_dir, catalog_path(self.data_dir), os.path.join(self.root, "archive", "series.json")):
+            try:
+                stamp.append(os.stat(path).st_mtime_ns)
+            except FileNotFoundError:
+                stamp.append(None)
+        return tuple(stamp)
+
+    def changed(self):
+        return self.file_stamp() != self.stamp
+
+    def reload(self):
+        """
+        Load everything into locals first and swap it in only when all of it
+        succeeded; on a failure the store keeps its old state and stamp, so
+        changed() stays True and the next check retries.
+        """
+        stamp = self.file_stamp()
+        # a fresh, read-only catalog, not the shared get_catalog instance of this process
+        catalog = SnapshotCatalog(self.data_dir, read_only=True)
+        latest = catalog.latest()
+        snapshot = catalog.load() if latest else {"summary": [], "players": {}}
+        series = load_series(self.root) if self.history else None
+        self.catalog, self.latest, self.snapshot, self.series = catalog, latest, snapshot, series
+        self.stamp = stamp
+
+class StandingsServer:
+    def __init__(self, store):
+        self.store = store
+        self.cache = OrderedDict()
+        self.routes = [
+            ("/api/summary", self.api_summary),
+            ("/api/players/", self.api_player),
+            ("/api/players", self.api_players),
+            ("/api/snapshots/", self.api_snapshot),
+            ("/api/snapshots", self.api_snapshots),
+            ("/api/history", self.api_history),
+            ("/players/", self.page_player),
+            ("/healthz", self.healthz),
+            ("/", self.page_index),
+        ]
+
+    # --- endpoints: (content type, body bytes) -------------------------------
+
+    def page_index(self, rest, query):
+        if rest:
+            raise HttpError(404, "Not found")
+        day = self.store.latest["date"] if self.store.latest else None
+        return "text/html; charset=utf-8", render_snapshot_html(self.store.snapshot, day, self.store.series).encode("utf-8")
+
+    def page_player(self, rest, query):
+        rows = self.player_rows(rest)
+        block = render_player_rows(rest, rows).replace('<details class="player">', '<details class="player" open>', 1)
+        return "text/html; charset=utf-8", build_html("", block, title=rest).encode("utf-8")
+
+    def api_summary(self, rest, query):
+        return "application/json", json_body(self.store.snapshot.get("summary", []))
+
+    def api_players(self, rest, query):
+        return "application/json", json_body(list(self.store.snapshot.get("players", {})))
+
+    def api_player(self, rest, query):
+        return "application/json", json_body(self.player_rows(rest))
+
+    def api_snapshots(self, rest, query):
+        entries = self.store.catalog.between(query.get("from"), query.get("to"))
+        return "application/json", json_body([{k: e[k] for k in ("date", "file", "sha256", "size")} for e in entries])
+
+    def api_snapshot(self, rest, query):
+        try:
+            return "application/json", json_body(self.store.catalog.load(rest))
+        except (FileNotFoundError, ValueError):
+            raise HttpError(404, f"No snapshot for {rest}")
+
+    def api_history(self, rest, query):
+        series = self.store.series
+        if series is None:
+            raise HttpError(404, "History not loaded (start the server with --history)")
+        dates = series["dates"]
+        lo = 0 if "from" not in query else next((i for i, d in enumerate(dates) if d >= query["from"]), len(dates))
+        hi = len(dates) if "to" not in query else next((i for i, d in enumerate(dates) if d > query["to"]), len(dates))
+        players = series["players"]
+        if "player" in query:
+            if query["player"] not in players:
+                raise HttpError(404, f"Unknown player {query['player']}")
+            players = {query["player"]: players[query["player"]]}
+        return "application/json", json_body({
+            "dates": dates[lo:hi],
+            "players": {name: {k: s[k][lo:hi] for k in ("position", "Points")} for name, s in players.items()},
+        })
+
+    def healthz(self, rest, query):
+        latest = self.store.latest
+        return "application/json", json_body({"ok": True, "latest": latest["date"] if latest else None})
+
+    def player_rows(self, name):
+        players = self.store.snapshot.get("players", {})
+        if name not in players:
+            raise HttpError(404, f"Unknown player {name}")
+        return players[name]
+
+    # --- HTTP ----------------------------------------------------------------
+
+    def response_for(self, target, gzip_ok):
+        """(status, content type, body, etag), cached per target and encoding."""
+        key = (target, gzip_ok)
+        hit = self.cache.get(key)
+        if hit is not None:
+            self.cache.move_to_end(key)
+            return hit
+
+        url = urlsplit(target)
+        path = unquote(url.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        for prefix, handler in self.routes:
+            if path == prefix or (prefix.endswith("/") and path.startswith(prefix)):
+                try:
+                    ctype, body = handler(path[len(prefix):], query)
+                    status = 200
+                except HttpError as e:
+                    status, ctype, body = e.status, "application/json", json_body({"error": str(e)})
+                break
+        else:
+            status, ctype, body = 404, "application/json", json_body({"error": "Not found"})
+
+        etag = f'"{hashlib.sha256(body).hexdigest()[:20]}"'
+        encoding = None
+        if gzip_ok and len(body) >= GZIP_MIN_BYTES:
+            body, encoding = gzip.compress(body, compresslevel=6, mtime=0), "gzip"
+            etag = etag[:-1] + '-gz"'
+        result = (status, ctype, body, etag, encoding)
+        self.cache[key] = result
+        if len(self.cache) > CACHE_SIZE:
+            self.cache.popitem(last=False)
+        return result
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    request_line = await asyncio.wait_for(reader.readline(), IDLE_TIMEOUT_S)
+                except asyncio.TimeoutError:
+                    break
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    await self.send(writer, 400, "application/json", json_body({"error": "Bad request"}), close=True)
+                    break
+                method, target, version = parts
+                keep_alive = (headers.get("connection", "").lower() != "close"
+                              and (version == "HTTP/1.1" or headers.get("connection", "").lower() == "keep-alive"))
+                if method not in ("GET", "HEAD"):
+                    await self.send(writer, 405, "application/json", json_body({"error": "Only GET and HEAD"}),
+                                    close=not keep_alive)
+                else:
+                    gzip_ok = "gzip" in headers.get("accept-encoding", "")
+                    status, ctype, body, etag, encoding = self.response_for(target, gzip_ok)
+                    if status == 200 and etag in [t.strip() for t in headers.get("if-none-match", "").split(",")]:
+                        status, body = 304, b""
+                    await self.send(writer, status, ctype, body, etag=etag, encoding=encoding,
+                                    head=method == "HEAD", close=not keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def send(self, writer, status, ctype, body, etag=None, encoding=None, head=False, close=False):
+        lines = [f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+                 f"Content-Type: {ctype}",
+                 f"Content-Length: {len(body)}",
+                 "Cache-Control: no-cache",
+                 "Vary: Accept-Encoding"]
+        if etag:
+            lines.append(f"ETag: {etag}")
+        if encoding and status == 200:
+            lines.append(f"Content-Encoding: {encoding}")
+        if close:
+            lines.append("Connection: close")
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        if not head and status != 304:
+            writer.write(body)
+        await writer.drain()
+
+    async def watch(self):
+        """Hot reload: poll the data/, catalog and series mtimes and drop the response cache on a change."""
+        while True:
+            await asyncio.sleep(RELOAD_INTERVAL_S)
+            if self.store.changed():
+                try:
+                    self.store.reload()
+                except Exception as e:
+                    # e.g. caught mid-write; the old state and stamp stay, so the next tick retries
+                    print(f"Reload failed: {e!r}")
+                    continue
+                self.cache.clear()
+                latest = self.store.latest
+                print(f"Reloaded, latest snapshot {latest['date'] if latest else None}")
+
+async def serve(host="127.0.0.1", port=8080, group=DEFAULT_GROUP, history=False):
+    app = StandingsServer(SnapshotStore(group, history))
+    server = await asyncio.start_server(app.handle, host, port)
+    latest = app.store.latest
+    print(f"Serving {latest['file'] if latest else 'no snapshot'} on http://{host}:{port}/")
+    watcher = asyncio.create_task(app.watch())
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        watcher.cancel()
+
+def run_server(host="127.0.0.1", port=8080, group=DEFAULT_GROUP, history=False):
+    try:
+        asyncio.run(serve(host, port, group, history))
+    except KeyboardInterrupt:
+        print("Stopped.")
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve the latest snapshot over HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--group", default=DEFAULT_GROUP)
+    parser.add_argument("--history", action="store_true", help="also load archive/series.json for /api/history")
+    args = parser.parse_args()
+    run_server(args.host, args.port, args.group, args.history)
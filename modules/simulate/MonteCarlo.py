@@ -0,0 +1,251 @@
+import hashlib
+import json
+import math
+import os
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+import numpy as np
+
+DEFAULT_SEED = 2526
+CHUNK_SIZE = 10_000
+
+# home teams score a little more, away teams a little less
+HOME_ADVANTAGE = 1.12
+# games of league-average form added to every team's record (shrinks early-season noise)
+PRIOR_GAMES = 5
+
+# goals per team and match are capped here (P(more) is ~1e-5 even for strong attacks)
+MAX_GOALS = 11
+
+PROJECTION_COLUMNS = ["position", "name", "P(1st) %", "Exp. Points", "Exp. GD"]
+
+def fixtures_from_next(table_rows):
+    """
+    Fallback fixture list from the Next column: the next round only, marked
+    as such (see fixture_scope). Home/away is unknown there, so these
+    fixtures are played on neutral ground.
+    """
+    seen = set()
+    fixtures = []
+    for row in table_rows:
+        team, opponent = row.get("Team"), row.get("Next")
+        if not team or not opponent or (opponent, team) in seen:
+            continue
+        seen.add((team, opponent))
+        fixtures.append({"home": team, "away": opponent, "neutral": True, "next_round": True})
+    return fixtures
+
+def fixture_scope(fixtures):
+    """"next_round" for fixtures_from_next's fallback list, "season" for the full fixture list."""
+    return "next_round" if fixtures and all(f.get("next_round") for f in fixtures) else "season"
+
+def scoring_rates(table_rows, fixtures, team_index):
+    """Poisson goal rates (home, away) per fixture from each team's goals per game."""
+    n = len(team_index)
+    played = np.zeros(n)
+    gf = np.zeros(n)
+    ga = np.zeros(n)
+    for row in table_rows:
+        i = team_index[row["Team"]]
+        played[i], gf[i], ga[i] = row.get("Played") or 0, row.get("GF") or 0, row.get("GA") or 0
+
+    league_rate = gf.sum() / played.sum() if played.sum() else 1.35
+    attack = (gf + PRIOR_GAMES * league_rate) / (played + PRIOR_GAMES)
+    defence = (ga + PRIOR_GAMES * league_rate) / (played + PRIOR_GAMES)
+
+    home = np.array([team_index[f["home"]] for f in fixtures], dtype=np.int64)
+    away = np.array([team_index[f["away"]] for f in fixtures], dtype=np.int64)
+    advantage = np.array([1.0 if f.get("neutral") else HOME_ADVANTAGE for f in fixtures])
+    lam_home = attack[home] * defence[away] / league_rate * advantage
+    lam_away = attack[away] * defence[home] / league_rate / advantage
+    return home, away, lam_home, lam_away
+
+def poisson_cdf(lam):
+    """(fixtures x MAX_GOALS) cumulative Poisson probabilities P(goals <= k)."""
+    k = np.arange(MAX_GOALS)
+    log_pmf = -lam[:, None] + k * np.log(lam[:, None]) - np.array([math.lgamma(i + 1) for i in k])
+    return np.cumsum(np.exp(log_pmf), axis=1).astype(np.float32)
+
+def draw_goals(rng, n, cdf):
+    # inverse-CDF sampling: goals = number of CDF steps below a uniform draw;
+    # several times faster than Generator.poisson on (n x fixtures) arrays
+    u = rng.random((n, cdf.shape[0]), dtype=np.float32)
+    goals = np.zeros((n, cdf.shape[0]), dtype=np.int16)
+    for k in range(MAX_GOALS):
+        goals += u > cdf[:, k]
+    return goals
+
+def simulate_chunk(args):
+    """
+    Simulate n seasons at once; returns the final (points, GD, GF) of every
+    team, each (simulations x teams) int16.
+    """
+    (n, seed_seq, home, away, cdf_home, cdf_away, base_pts, base_gd, base_gf) = args
+    rng = np.random.default_rng(seed_seq)
+    n_teams = len(base_pts)
+
+    goals_home = draw_goals(rng, n, cdf_home)
+    goals_away = draw_goals(rng, n, cdf_away)
+
+    draws = goals_home == goals_away
+    pts_home = np.where(goals_home > goals_away, 3.0, draws.astype(np.float64))
+    pts_away = np.where(goals_away > goals_home, 3.0, draws.astype(np.float64))
+    goals_home = goals_home.astype(np.float64)
+    goals_away = goals_away.astype(np.float64)
+
+    # fixtures -> teams via one-hot incidence matrices (one BLAS product each)
+    home_onehot = np.zeros((len(home), n_teams))
+    home_onehot[np.arange(len(home)), home] = 1.0
+    away_onehot = np.zeros((len(away), n_teams))
+    away_onehot[np.arange(len(away)), away] = 1.0
+
+    team_pts = base_pts + pts_home @ home_onehot + pts_away @ away_onehot
+    team_gd = base_gd + (goals_home - goals_away) @ home_onehot + (goals_away - goals_home) @ away_onehot
+    team_gf = base_gf + goals_home @ home_onehot + goals_away @ away_onehot
+    return tuple(np.rint(a).astype(np.int16) for a in (team_pts, team_gd, team_gf))
+
+def simulate_teams(
+    table_rows: List[dict],
+    fixtures: List[dict],
+    n_sims: int = 100_000,
+    seed: int = DEFAULT_SEED,
+    workers: int = None,
+) -> dict:
+    """
+    The simulated seasons themselves, independent of any player: every
+    team's final points, GD and GF per simulation.
+
+    table_rows are standings rows (Team, Played, GF, GA, GD, Points, ...),
+    fixtures the remaining matches as {"home", "away"} dicts. Each fixture
+    is drawn from independent Poisson scores (rates from each side's goals
+    per game, see scoring_rates); the simulations run in
+    chunks of CHUNK_SIZE, each with its own child of SeedSequence(seed),
+    so the result for a seed is the same with or without a process pool
+    (workers > 1).
+
+    Returns {"teams", "points", "gd", "gf", "simulations", "fixtures",
+    "seed", "scope"}; points/gd/gf are (simulations x teams) int16 arrays,
+    scope is "next_round" when only the next round was simulated (the
+    fixtures_from_next fallback), so the result is no final-table projection.
+    """
+    teams = [row["Team"] for row in table_rows]
+    team_index = {team: i for i, team in enumerate(teams)}
+    scope = fixture_scope(fixtures)
+    fixtures = [f for f in fixtures if f["home"] in team_index and f["away"] in team_index]
+
+    base = {c: np.array([float(row.get(c) or 0) for row in table_rows]) for c in ("Points", "GD", "GF")}
+    home, away, lam_home, lam_away = scoring_rates(table_rows, fixtures, team_index)
+
+    n_chunks = max(1, math.ceil(n_sims / CHUNK_SIZE))
+    seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+    cdf_home, cdf_away = poisson_cdf(lam_home), poisson_cdf(lam_away)
+    chunks = [(min(CHUNK_SIZE, n_sims - k * CHUNK_SIZE), seeds[k], home, away, cdf_home, cdf_away,
+               base["Points"], base["GD"], base["GF"]) for k in range(n_chunks)]
+
+    if workers and workers > 1 and n_chunks > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(simulate_chunk, chunks))
+    else:
+        results = [simulate_chunk(chunk) for chunk in chunks]
+
+    points, gd, gf = (np.concatenate([r[i] for r in results]) for i in range(3))
+    return {"teams": teams, "points": points, "gd": gd, "gf": gf,
+            "simulations": n_sims, "fixtures": len(fixtures), "seed": seed, "scope": scope}
+
+def project_players(seasons: dict, player_teams: Dict[str, List[str]]) -> dict:
+    """
+    Projection of the tip-game standings from simulate_teams' seasons: each
+    player's totals are the sums over their teams, the winner of a season
+    the player ahead on points, then GD, then GF (like the summary).
+
+    Returns {"columns", "rows", "simulations", "fixtures", "seed", "scope"},
+    rows ordered by probability of finishing 1st (of leading after the next
+    round for scope "next_round").
+    """
+    team_index = {team: i for i, team in enumerate(seasons["teams"])}
+    players = list(player_teams)
+    n_sims = seasons["simulations"]
+
+    membership = np.zeros((len(players), len(team_index)))
+    for p, names in enumerate(player_teams.values()):
+        for name in names:
+            if name in team_index:
+                membership[p, team_index[name]] = 1.0
+
+    firsts = np.zeros(len(players), dtype=np.int64)
+    points = np.zeros(len(players))
+    gd = np.zeros(len(players))
+    # teams -> players, CHUNK_SIZE seasons at a time to bound the float copies
+    for k in range(0, n_sims, CHUNK_SIZE):
+        player_pts = seasons["points"][k:k + CHUNK_SIZE] @ membership.T
+        player_gd = seasons["gd"][k:k + CHUNK_SIZE] @ membership.T
+        player_gf = seasons["gf"][k:k + CHUNK_SIZE] @ membership.T
+        key = player_pts * 1e9 + (player_gd + 1e4) * 1e4 + player_gf
+        firsts += np.bincount(np.argmax(key, axis=1), minlength=len(players))
+        points += player_pts.sum(axis=0)
+        gd += player_gd.sum(axis=0)
+    points /= n_sims
+    gd /= n_sims
+
+    rows = [{"name": name, "P(1st) %": round(100.0 * float(firsts[p]) / n_sims, 1),
+             "Exp. Points": round(float(points[p]), 1), "Exp. GD": round(float(gd[p]), 1)}
+            for p, name in enumerate(players)]
+    rows.sort(key=lambda r: (-r["P(1st) %"], -r["Exp. Points"]))
+    for position, row in enumerate(rows, start=1):
+        row["position"] = position
+    rows = [{c: row[c] for c in PROJECTION_COLUMNS} for row in rows]
+
+    return {"columns": PROJECTION_COLUMNS, "rows": rows,
+            "simulations": n_sims, "fixtures": seasons["fixtures"], "seed": seasons["seed"],
+            "scope": seasons["scope"]}
+
+def simulate_season(
+    table_rows: List[dict],
+    player_teams: Dict[str, List[str]],
+    fixtures: List[dict],
+    n_sims: int = 100_000,
+    seed: int = DEFAULT_SEED,
+    workers: int = None,
+) -> dict:
+    """
+    Monte Carlo projection of the final tip-game standings: simulate_teams
+    followed by project_players. Batch runs simulate once and project per
+    group (see cached_team_seasons).
+    """
+    return project_players(simulate_teams(table_rows, fixtures, n_sims, seed, workers), player_teams)
+
+def seasons_key(table_rows, fixtures, n_sims, seed):
+    blob = json.dumps({"table": table_rows, "fixtures": fixtures, "simulations": n_sims, "seed": seed},
+                      sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+def seasons_path(cache_dir):
+    return os.path.join(cache_dir, "team_seasons.npz")
+
+def cached_team_seasons(cache_dir, table_rows, fixtures, n_sims=100_000, seed=DEFAULT_SEED):
+    """
+    simulate_teams, cached in cache/team_seasons.npz per input (table,
+    fixtures, simulations and seed), so every group of a batch run and
+    forced re-runs share one simulation.
+    """
+    key = seasons_key(table_rows, fixtures, n_sims, seed)
+    path = seasons_path(cache_dir)
+    if os.path.exists(path):
+        with np.load(path) as cached:
+            # (caches written before "scope" existed are simulated again)
+            if str(cached["key"]) == key and "scope" in cached.files:
+                return {"teams": cached["teams"].tolist(), "points": cached["points"], "gd": cached["gd"],
+                        "gf": cached["gf"], "simulations": int(cached["simulations"]),
+                        "fixtures": int(cached["fixtures"]), "seed": int(cached["seed"]),
+                        "scope": str(cached["scope"])}
+
+    seasons = simulate_teams(table_rows, fixtures, n_sims, seed)
+    os.makedirs(cache_dir, exist_ok=True)
+    # np.savez adds .npz unless the name already ends with it; replace so a
+    # concurrent reader never sees half a file
+    tmp = f"{path[:-4]}.{os.getpid()}.tmp.npz"
+    np.savez(tmp, key=key, **{k: np.asarray(v) for k, v in seasons.items()})
+    os.replace(tmp, path)
+    return seasons
@@ -0,0 +1,276 @@
+import hashlib
+import json
+import os
+
+from typing import Dict, List
+
+import numpy as np
+
+SEASON_GAMES = 38
+
+# points of the home and the away side for a home win, a draw and an away win
+HOME_POINTS = np.array([3, 1, 0])
+AWAY_POINTS = np.array([0, 1, 3])
+
+# search nodes per player before giving up (the player is then reported
+# "undecided"); PLT_TITLE_NODE_BUDGET overrides it
+NODE_BUDGET = 200_000
+NODE_BUDGET_ENV = "PLT_TITLE_NODE_BUDGET"
+# rounds of the Lagrangian relaxation tried before the search
+LAGRANGE_ROUNDS = 100
+
+class BudgetExceeded(Exception):
+    pass
+
+def node_budget_default():
+    return int(os.environ.get(NODE_BUDGET_ENV) or NODE_BUDGET)
+
+def complete_fixtures(table_rows, fixtures, season_games=SEASON_GAMES):
+    """
+    The fixture list, topped up with one "bye" game (away=None) per game a
+    team still has to play but that is not in the list: live or postponed
+    games, or every game when no fixture list is available. A bye can give
+    its team 0, 1 or 3 points with nobody on the other side, which only
+    widens the set of outcomes, so clinched/eliminated stay safe claims.
+    """
+    fixtures = list(fixtures or [])
+    listed = {}
+    for f in fixtures:
+        for side in ("home", "away"):
+            if f.get(side) is not None:
+                listed[f[side]] = listed.get(f[side], 0) + 1
+    for row in table_rows:
+        missing = season_games - (row.get("Played") or 0) - listed.get(row["Team"], 0)
+        fixtures.extend({"home": row["Team"], "away": None} for _ in range(max(0, missing)))
+    return fixtures
+
+def pairwise_bounds(points, owned, home, away):
+    """
+    best[x, y] / worst[x, y]: the most / least points player x can end up
+    ahead of player y over all outcomes of the remaining fixtures.
+
+    A fixture's contribution only depends on its outcome and on which of its
+    two teams x and y own (4 patterns each), so the best and worst case of a
+    pair are sums over fixtures, and all pairs at once are one matrix product
+    of the players' one-hot fixture patterns with the pattern value tables.
+    """
+    n_fixtures = len(home)
+    # pattern of a player in a fixture: 2 * owns home team + owns away team
+    pattern = 2 * owned[:, home] + owned[:, away]                     # players x fixtures
+    onehot = np.zeros((len(points), 4, n_fixtures))
+    onehot[np.arange(len(points))[:, None], pattern, np.arange(n_fixtures)[None, :]] = 1.0
+    onehot = onehot.reshape(len(points), -1)
+
+    xs = np.arange(4)[:, None]
+    ys = np.arange(4)[None, :]
+    d_home = (xs >> 1) - (ys >> 1)
+    d_away = (xs & 1) - (ys & 1)
+    values = HOME_POINTS[:, None, None] * d_home + AWAY_POINTS[:, None, None] * d_away    # outcome x (x, y) pattern
+
+    gap = points[:, None] - points[None, :]
+    bounds = []
+    for table in (values.max(axis=0), values.min(axis=0)):
+        # column (s, f) of player y: value of fixture f if x has pattern s there
+        per_y = table[:, pattern].transpose(1, 0, 2).reshape(len(points), -1)
+        bounds.append(gap + np.rint(onehot @ per_y.T).astype(np.int64))
+    return bounds
+
+def lagrange_bound(diff, gap, home, away, rounds=LAGRANGE_ROUNDS):
+    """
+    Lagrangian relaxation of "x ends level with or ahead of every rival".
+
+    diff: rivals x teams ownership of x minus that of each rival; gap: x's
+    current lead on each rival. With a weight per rival the constraints
+    merge into one objective that every fixture maximises on its own. True
+    if that choice of outcomes keeps every rival behind or level (x is
+    alive), False if the weighted bound is below zero (no outcome can, x is
+    out), None if undecided after rounds. Weights move multiplicatively
+    towards the rivals still ahead.
+    """
+    weights = np.full(len(gap), 1.0 / len(gap))
+    n_teams = diff.shape[1]
+    for _ in range(rounds):
+        value = weights @ diff                      # weighted worth of a point per team
+        score = HOME_POINTS[None, :] * value[home][:, None] + AWAY_POINTS[None, :] * value[away][:, None]
+        if gap @ weights + score.max(axis=1).sum() < -1e-9:
+            return False
+        choice = score.argmax(axis=1)
+        team_points = (np.bincount(home, HOME_POINTS[choice], n_teams)
+                       + np.bincount(away, AWAY_POINTS[choice], n_teams))
+        total = gap + diff @ team_points
+        if (total >= 0).all():
+            return True
+        weights *= np.exp(-total / (np.abs(total).max() + 1))
+        weights /= weights.sum()
+    return None
+
+def search_outcomes(gain, gap, node_budget=NODE_BUDGET):
+    """
+    Exact check whether some outcome of the fixtures keeps every rival
+    behind or level: depth-first over the fixtures (gain[f, o, rival]: what x
+    gains on the rival if fixture f ends with outcome o), pruned with the
+    pairwise bounds of the fixtures left, with dominated outcomes dropped
+    and failed (fixture, points gap) states memoised. Raises BudgetExceeded
+    after node_budget nodes.
+    """
+    varies = gain.max(axis=1) != gain.min(axis=1)
+    relevant = varies.any(axis=1)
+    # fixtures no rival cares about add the same to every outcome
+    gap = gap + gain[~relevant, 0, :].sum(axis=0)
+    gain = gain[relevant]
+    # fail first: fixtures that matter to the most rivals are decided first
+    gain = gain[np.argsort(-varies[relevant].sum(axis=1), kind="stable")]
+
+    suffix_max = np.zeros((len(gain) + 1, gain.shape[2]), dtype=np.int64)
+    suffix_min = np.zeros_like(suffix_max)
+    suffix_max[:-1] = np.cumsum(gain.max(axis=1)[::-1], axis=0)[::-1]
+    suffix_min[:-1] = np.cumsum(gain.min(axis=1)[::-1], axis=0)[::-1]
+
+    failed = set()
+    nodes = 0
+
+    def search(k, gap):
+        nonlocal nodes
+        if (gap + suffix_min[k] >= 0).all():
+            return True
+        if (gap + suffix_max[k] < 0).any():
+            return False
+        key = (k, gap.tobytes())
+        if key in failed:
+            return False
+        nodes += 1
+        if nodes > node_budget:
+            raise BudgetExceeded()
+
+        outcomes = []
+        for o in range(3):
+            g = gain[k, o]
+            # an outcome no better than another for every rival is never needed
+            if any((gain[k, p] >= g).all() and (p < o or (gain[k, p] != g).any()) for p in range(3) if p != o):
+                continue
+            outcomes.append((-(gap + g + suffix_max[k + 1]).min(), o))
+        for _, o in sorted(outcomes):
+            if search(k + 1, gap + gain[k, o]):
+                return True
+        failed.add(key)
+        return False
+
+    return search(0, gap)
+
+def solve_player(x, points, owned, home, away, best, worst, node_budget=NODE_BUDGET):
+    """
+    Title status of player x (best/worst: rows x of pairwise_bounds).
+
+    The exact pairwise bounds decide who is out because of one rival and
+    who has clinched; the Lagrangian relaxation (lagrange_bound) most of the
+    rest. Only what is left goes to the exact search (search_outcomes);
+    "undecided" if that runs out of node_budget.
+    """
+    rivals = np.arange(len(points)) != x
+    if (best[rivals] < 0).any():
+        return "eliminated"      # some rival finishes ahead whatever happens
+    if (worst[rivals] > 0).all():
+        return "clinched"        # ahead of everyone whatever happens
+    threats = worst < 0
+    if not threats.any():
+        return "alive"
+
+    # only rivals that can still finish ahead of x matter from here on
+    diff = owned[x][None, :] - owned[threats]
+    gap = points[x] - points[threats]
+    decided = lagrange_bound(diff, gap, home, away)
+    if decided is not None:
+        return "alive" if decided else "eliminated"
+
+    gain = (HOME_POINTS[None, :, None] * diff[:, home].T[:, None, :]
+            + AWAY_POINTS[None, :, None] * diff[:, away].T[:, None, :])
+    try:
+        return "alive" if search_outcomes(gain, gap, node_budget) else "eliminated"
+    except BudgetExceeded:
+        return "undecided"
+
+def solve_title_race(table_rows, player_teams: Dict[str, List[str]], fixtures=None,
+                     season_games=SEASON_GAMES, node_budget=None):
+    """
+    {player: "clinched" | "eliminated" | "alive" | "undecided"} for 1st
+    place of the summary (most points; a points tie counts as still alive,
+    since goal difference decides it).
+
+    fixtures are the remaining {"home", "away"} fixtures; games missing from
+    the list are added as byes (see complete_fixtures), so None gives safe
+    but weaker answers. The first three are exact; players whose search
+    exceeds node_budget (default NODE_BUDGET, or PLT_TITLE_NODE_BUDGET) are
+    "undecided".
+    """
+    node_budget = node_budget_default() if node_budget is None else node_budget
+    players = list(player_teams)
+    if not players:
+        return {}
+    team_index = {row["Team"]: i for i, row in enumerate(table_rows)}
+    bye = len(team_index)
+
+    owned = np.zeros((len(players), bye + 1), dtype=np.int64)
+    for p, names in enumerate(player_teams.values()):
+        for name in set(names):
+            if name in team_index:
+                owned[p, team_index[name]] = 1
+    team_points = np.array([row.get("Points") or 0 for row in table_rows] + [0], dtype=np.int64)
+    points = owned @ team_points
+
+    fixtures = [f for f in complete_fixtures(table_rows, fixtures, season_games)
+                if f["home"] in team_index and (f.get("away") is None or f["away"] in team_index)]
+    home = np.array([team_index[f["home"]] for f in fixtures], dtype=np.int64)
+    away = np.array([bye if f.get("away") is None else team_index[f["away"]] for f in fixtures], dtype=np.int64)
+
+    best, worst = pairwise_bounds(points, owned, home, away)
+    return {player: solve_player(x, points, owned, home, away, best[x], worst[x], node_budget)
+            for x, player in enumerate(players)}
+
+def title_race_key(table_rows, player_teams, fixtures, node_budget=None):
+    blob = json.dumps({"table": table_rows, "players": player_teams, "fixtures": fixtures,
+                       "node_budget": node_budget_default() if node_budget is None else node_budget},
+                      sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+def title_race_path(data_dir):
+    return os.path.join(data_dir, "_meta", "title_race.json")
+
+def cached_title_race(data_dir, table_rows, player_teams, fixtures=None, node_budget=None):
+    """
+    solve_title_race, cached in data/_meta/title_race.json per input
+    (table, players, fixtures and node budget), so re-runs on an unchanged
+    snapshot and forced re-runs skip the search.
+    """
+    key = title_race_key(table_rows, player_teams, fixtures, node_budget)
+    path = title_race_path(data_dir)
+    cache = {}
+    if os.path.exists(path):
+        with open(path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+        if cache.get("key") == key:
+            return cache["status"]
+
+    status = solve_title_race(table_rows, player_teams, fixtures, node_budget=node_budget)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"key": key, "status": status}, f, indent=2, ensure_ascii=False)
+    return status
+
+if __name__ == "__main__":
+    # python -m modules.simulate.TitleRace [archive_dir] [--node-budget N]  (title race of the last archived day)
+    import argparse
+    import time
+
+    from modules.archive.SeasonArchive import load_archive
+
+    parser = argparse.ArgumentParser(description="Title race of the last archived day.")
+    parser.add_argument("archive_dir", nargs="?")
+    parser.add_argument("--node-budget", type=int, help=f"search nodes per player (default {NODE_BUDGET})")
+    args = parser.parse_args()
+    archive = load_archive(args.archive_dir)
+    day = archive.last_date()
+    t0 = time.perf_counter()
+    result = solve_title_race(archive.table_rows(day), archive.player_teams(day), node_budget=args.node_budget)
+    print(f"{day}: solved in {(time.perf_counter() - t0) * 1000:.1f} ms")
+    for player, s in result.items():
+        print(f"  {player:<20} {s}")
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# the repo root, so tests import modules.* and benchmarks.* like UpdateTable.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,66 @@
+"""
+Re-record tests/cassettes/update_all, the cassettes test_cassette_replay.py
+and benchmarks/run_benchmarks.py replay: `UpdateTable.py all` against the
+stub API (tests/stub_api.py) on RECORD_BASE, in a scratch copy of the
+project, plus the stub's table page as a rendered page source. The stub
+serves that page fully rendered, so a plain GET stands in for Chrome.
+
+    python tests/record_cassette.py
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from urllib.parse import urlsplit
+
+from stub_api import StubApi
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CASSETTE_DIR = os.path.join(REPO, "tests", "cassettes", "update_all")
+# fixed, so the recorded URLs (and keys) do not change between recordings
+RECORD_BASE = "http://127.0.0.1:8765/football"
+RECORD_TABLES_URL = "http://127.0.0.1:8765/tables"
+# what UpdateTable.py needs; everything else it writes itself
+PROJECT_PARTS = ("UpdateTable.py", "modules", "players")
+
+def project_copy(parent):
+    """Copy of the project under parent/PremierLeagueTipp2526 (see get_base_path)."""
+    from modules.common.BasePath import PROJECT_FOLDER
+
+    root = os.path.join(parent, PROJECT_FOLDER)
+    os.makedirs(root)
+    for part in PROJECT_PARTS:
+        src = os.path.join(REPO, part)
+        if os.path.isdir(src):
+            shutil.copytree(src, os.path.join(root, part), ignore=shutil.ignore_patterns("__pycache__"))
+        else:
+            shutil.copy2(src, root)
+    return root
+
+def run_update_all(root, mode, cassette_dir, api_base=RECORD_BASE, log=None):
+    env = {**os.environ, "PLT_CASSETTE_MODE": mode, "PLT_CASSETTE_DIR": cassette_dir,
+           "PLT_API_BASE": api_base, "PLT_RUN_LOG": log or os.path.join(root, "runs.jsonl")}
+    return subprocess.run([sys.executable, "UpdateTable.py", "all"], cwd=root, env=env,
+                          capture_output=True, text=True, timeout=300)
+
+def record_page(url, cassette_dir):
+    import requests
+
+    from modules.get_data.Cassette import rendered_page
+    from modules.get_data.ParseStandings import TABLE_SELECTOR
+
+    os.environ.update({"PLT_CASSETTE_MODE": "record", "PLT_CASSETTE_DIR": cassette_dir})
+    rendered_page(url, TABLE_SELECTOR, lambda: requests.get(url, timeout=10).text)
+
+if __name__ == "__main__":
+    sys.path.insert(0, REPO)
+    shutil.rmtree(CASSETTE_DIR, ignore_errors=True)
+    with StubApi("ok", port=urlsplit(RECORD_BASE).port) as stub, tempfile.TemporaryDirectory() as tmp:
+        result = run_update_all(project_copy(tmp), "record", CASSETTE_DIR)
+        print(result.stdout, result.stderr, sep="")
+        assert stub.tables_url == RECORD_TABLES_URL
+        record_page(RECORD_TABLES_URL, CASSETTE_DIR)
+    print(f"Recorded {sum(stub.hits.values())} requests ({stub.hits}) to {CASSETTE_DIR}")
+    sys.exit(result.returncode)
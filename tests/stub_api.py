@@ -0,0 +1,206 @@
+"""
+Local stand-in for the pulselive API and the premierleague.com table page,
+for the tests and for manual runs of the fetch layer (standard library
+only, plus the synthetic table of benchmarks.synthetic). The API answers
+follow fixtures/pulselive_standings.json, and both the API and the page
+spell clubs the way pulselive does (e.g. "Brighton & Hove Albion"), not
+like players/*.json.
+
+    python tests/stub_api.py [--port 8000] [--mode ok|slow|flaky|bad]
+    PLT_API_BASE=http://127.0.0.1:8000/football PLT_TABLES_URL=http://127.0.0.1:8000/tables \
+        python UpdateTable.py fetch --source auto
+
+Modes change the standings endpoint only:
+
+    ok      the table
+    slow    the table after delay_s
+    flaky   503 for the first `failures` requests, then the table
+    limited 429 (rate limited) for the first `failures` requests, then the table
+    bad     200 with an empty table (fails check_standings)
+"""
+import copy
+import json
+import os
+import sys
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.synthetic import standings_html, synthetic_rows
+from modules.get_data.TeamNames import TEAMS, team_name
+
+MODES = ("ok", "slow", "flaky", "limited", "bad")
+COMP_SEASON_ID = 777
+KICKOFF_MILLIS = 1_767_225_600_000
+# one standings answer in the pulselive format (detail=2: team/club blocks
+# with altIds, overall/home/away, the next fixture); the stub keeps its
+# structure and team spellings and puts its own rows in
+RECORDED_STANDINGS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "pulselive_standings.json")
+
+with open(RECORDED_STANDINGS, "r", encoding="utf-8") as f:
+    RECORDED = json.load(f)
+# players/*.json name -> that club's recorded entry
+RECORDED_ENTRIES = {team_name(e["team"]["name"]): e for e in RECORDED["tables"][0]["entries"]}
+
+def league_rows(seed=0):
+    """synthetic_rows with the real club names, so players/*.json teams are found."""
+    names = {f"Team {i:03d}": team for i, team in enumerate(TEAMS)}
+    return [{**r, "Team": names[r["Team"]], "Next": names[r["Next"]]} for r in synthetic_rows(len(TEAMS), seed)]
+
+def stat_block(won, drawn, lost, gf, ga):
+    # the API sends every count as a float
+    return {"played": float(won + drawn + lost), "won": float(won), "drawn": float(drawn), "lost": float(lost),
+            "goalsFor": float(gf), "goalsAgainst": float(ga), "goalsDifference": float(gf - ga),
+            "points": float(3 * won + drawn)}
+
+def next_fixture(team, opponent):
+    fixture = copy.deepcopy(RECORDED_ENTRIES[team]["next"])
+    fixture["teams"] = [{"team": RECORDED_ENTRIES[team]["team"]}, {"team": RECORDED_ENTRIES[opponent]["team"]}]
+    fixture["kickoff"]["millis"] = KICKOFF_MILLIS
+    return fixture
+
+def standings_payload(rows):
+    payload = copy.deepcopy(RECORDED)
+    entries = []
+    for r in rows:
+        entry = copy.deepcopy(RECORDED_ENTRIES[r["Team"]])
+        entry["position"] = entry["startingPosition"] = r["Pos"]
+        home = (r["Won"] // 2, r["Drawn"] // 2, r["Lost"] // 2, r["GF"] // 2, r["GA"] // 2)
+        entry["overall"] = stat_block(r["Won"], r["Drawn"], r["Lost"], r["GF"], r["GA"])
+        entry["home"] = stat_block(*home)
+        entry["away"] = stat_block(*(total - h for total, h in zip(
+            (r["Won"], r["Drawn"], r["Lost"], r["GF"], r["GA"]), home)))
+        entry["next"] = next_fixture(r["Team"], r["Next"])
+        entries.append(entry)
+    payload["tables"][0]["entries"] = entries
+    return payload
+
+def page_rows(rows):
+    """rows with the pulselive spellings, as the table page shows them."""
+    spell = lambda team: RECORDED_ENTRIES[team]["team"]["name"]
+    return [{**r, "Team": spell(r["Team"]), "Next": spell(r["Next"])} for r in rows]
+
+def fixtures_payload(rows):
+    # one round: every team against its Next opponent, each pair once
+    seen = set()
+    content = []
+    for r in rows:
+        pair = frozenset((r["Team"], r["Next"]))
+        if pair in seen:
+            continue
+        seen.add(pair)
+        content.append(next_fixture(r["Team"], r["Next"]))
+    return {"pageInfo": {"page": 0, "numPages": 1, "pageSize": 100, "numEntries": len(content)}, "content": content}
+
+class StubApi:
+    """
+    Stub server on 127.0.0.1 in a background thread (port 0 = any free one).
+    hits counts the requests per endpoint.
+    """
+
+    def __init__(self, mode="ok", port=0, delay_s=1.0, failures=3, rows=None):
+        if mode not in MODES:
+            raise ValueError(f"mode must be one of {', '.join(MODES)}")
+        self.mode = mode
+        self.delay_s = delay_s
+        self.failures = failures
+        self.rows = rows or league_rows()
+        self.hits = {}
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), self.handler())
+        self.server.daemon_threads = True
+        self.thread = None
+
+    @property
+    def base(self):
+        return f"http://127.0.0.1:{self.server.server_port}/football"
+
+    @property
+    def tables_url(self):
+        return f"http://127.0.0.1:{self.server.server_port}/tables"
+
+    def count(self, endpoint):
+        with self.lock:
+            self.hits[endpoint] = self.hits.get(endpoint, 0) + 1
+            return self.hits[endpoint]
+
+    def standings(self):
+        n = self.count("standings")
+        if self.mode == "slow":
+            time.sleep(self.delay_s)
+        if self.mode == "flaky" and n <= self.failures:
+            return 503, {"error": "try again"}
+        if self.mode == "limited" and n <= self.failures:
+            return 429, {"error": "rate limited"}
+        if self.mode == "bad":
+            return 200, standings_payload([])
+        return 200, standings_payload(self.rows)
+
+    def handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def send(self, status, body, ctype="application/json"):
+                data = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def do_GET(self):
+                path = urlsplit(self.path).path
+                if path == "/football/compseasons":
+                    stub.count("compseasons")
+                    season = {**RECORDED["compSeason"], "id": float(COMP_SEASON_ID)}
+                    return self.send(200, json.dumps({"content": [season]}))
+                if path == "/football/standings":
+                    status, payload = stub.standings()
+                    return self.send(status, json.dumps(payload))
+                if path == "/football/fixtures":
+                    stub.count("fixtures")
+                    return self.send(200, json.dumps(fixtures_payload(stub.rows)))
+                if path == "/tables":
+                    stub.count("tables")
+                    return self.send(200, standings_html(page_rows(stub.rows)), "text/html; charset=utf-8")
+                self.send(404, json.dumps({"error": "not found"}))
+
+        return Handler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Stub pulselive API and table page.")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--mode", choices=MODES, default="ok")
+    parser.add_argument("--delay", type=float, default=5.0, help="seconds the slow mode waits")
+    parser.add_argument("--failures", type=int, default=3, help="503 answers in flaky mode")
+    args = parser.parse_args()
+    stub = StubApi(args.mode, args.port, args.delay, args.failures)
+    print(f"Stub API on {stub.base} (table page {stub.tables_url}), mode {args.mode}")
+    try:
+        stub.server.serve_forever()
+    except KeyboardInterrupt:
+        stub.stop()
@@ -0,0 +1,61 @@
+import json
+import os
+
+from datetime import date
+
+import pytest
+import requests
+
+from modules.get_data.Cassette import CassetteAdapter, Cassettes
+from record_cassette import CASSETTE_DIR, project_copy, run_update_all
+from stub_api import StubApi
+
+def cassette_session():
+    # no urllib3 retries, so the adapter sees every answer
+    session = requests.Session()
+    session.mount("http://", CassetteAdapter())
+    return session
+
+def test_error_answers_are_not_recorded(tmp_path, monkeypatch):
+    monkeypatch.setenv("PLT_CASSETTE_MODE", "record")
+    monkeypatch.setenv("PLT_CASSETTE_DIR", str(tmp_path))
+    session = cassette_session()
+    for mode, status in (("limited", 429), ("flaky", 503)):
+        with StubApi(mode, failures=1) as stub:
+            url = f"{stub.base}/standings"
+            assert session.get(url).status_code == status
+            assert not list(Cassettes(str(tmp_path)).entries())
+            assert session.get(url).status_code == 200
+            entries = list(Cassettes(str(tmp_path)).entries())
+            assert [e["status"] for _, e in entries] == [200]
+        for name in os.listdir(tmp_path / "index"):
+            os.remove(tmp_path / "index" / name)
+
+def test_update_all_replays_offline(tmp_path):
+    # nothing listens on the recorded API base: every answer must come from the cassette
+    root = project_copy(str(tmp_path))
+    result = run_update_all(root, "replay", CASSETTE_DIR)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "Standings from source 'api'" in result.stdout
+
+    snapshot = os.path.join(root, "data", f"{date.today():%Y-%m-%d}.json")
+    with open(snapshot, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    assert len(data["table"]["Team"]) == 20
+    assert os.path.getsize(os.path.join(root, "table.html")) > 0
+
+    with open(os.path.join(root, "runs.jsonl"), "r", encoding="utf-8") as f:
+        events = [json.loads(line) for line in f]
+    hits = [e for e in events if e.get("name") == "cassette"]
+    assert hits and all(e["hit"] for e in hits)
+    assert events[-1]["status"] == "ok"
+
+def test_benchmark_replays_the_committed_cassettes(tmp_path):
+    from benchmarks.run_benchmarks import Suite, bench_replay
+
+    suite = Suite(repeat=1)
+    bench_replay(suite, CASSETTE_DIR)
+    assert sorted(r["params"]["source"] for r in suite.results) == ["api", "page"]
+
+    with pytest.raises(RuntimeError):
+        bench_replay(Suite(repeat=1), str(tmp_path))
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+import pytest
+
+import modules.get_data.FetchOrchestrator as orchestrator
+
+from modules.get_data.FetchOrchestrator import api_source, first_valid, static_page_source
+from stub_api import StubApi
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    # keep the retries, drop the jittered sleeps between them
+    monkeypatch.setattr(orchestrator, "backoff_delay", lambda attempt: 0.01)
+
+def run(sources, budget_s=10, hedge_delay_s=5, attempts=3):
+    return asyncio.run(first_valid(sources, budget_s, hedge_delay_s, attempts))
+
+def both(stub):
+    return {"api": api_source(stub.base), "static": static_page_source(stub.tables_url)}
+
+def test_ok_api_wins_and_page_is_never_fetched():
+    with StubApi("ok") as stub:
+        name, table = run(both(stub))
+    assert name == "api"
+    assert len(table) == 20
+    assert "tables" not in stub.hits
+
+def test_slow_api_is_hedged_by_the_next_source():
+    with StubApi("slow", delay_s=2.0) as stub:
+        t0 = time.perf_counter()
+        name, table = run(both(stub), hedge_delay_s=0.2)
+        elapsed = time.perf_counter() - t0
+    assert name == "static"
+    assert len(table) == 20
+    assert elapsed < 1.5
+
+def test_race_starts_every_source_at_once():
+    with StubApi("slow", delay_s=2.0) as stub:
+        name, _ = run(both(stub), hedge_delay_s=0)
+        # the api request was started too; it may still be on its way to the stub
+        deadline = time.perf_counter() + 1.0
+        while "standings" not in stub.hits and time.perf_counter() < deadline:
+            time.sleep(0.01)
+    assert name == "static"
+    assert stub.hits["standings"] == 1
+
+def test_flaky_api_is_retried():
+    # the session retries 503 twice itself, so the orchestrator's second attempt gets through
+    with StubApi("flaky", failures=3) as stub:
+        name, table = run({"api": api_source(stub.base)})
+    assert name == "api"
+    assert len(table) == 20
+    assert stub.hits["standings"] == 4
+
+def test_flaky_api_runs_out_of_attempts():
+    with StubApi("flaky", failures=100) as stub:
+        with pytest.raises(RuntimeError, match="api"):
+            run({"api": api_source(stub.base)}, attempts=2)
+    assert stub.hits["standings"] == 6
+
+def test_bad_payload_fails_validation_and_falls_back():
+    with StubApi("bad") as stub:
+        t0 = time.perf_counter()
+        name, table = run(both(stub), hedge_delay_s=30)
+        elapsed = time.perf_counter() - t0
+    assert name == "static"
+    assert len(table) == 20
+    # every attempt was used on the api, and the page did not wait for the hedge delay
+    assert stub.hits["standings"] == 3
+    assert elapsed < 5
+
+def test_budget_bounds_the_whole_fetch():
+    with StubApi("slow", delay_s=3.0) as stub:
+        t0 = time.perf_counter()
+        with pytest.raises(RuntimeError, match="budget"):
+            run({"api": api_source(stub.base)}, budget_s=0.5)
+        elapsed = time.perf_counter() - t0
+    assert elapsed < 1.5
@@ -0,0 +1,64 @@
+import json
+import os
+
+from benchmarks.synthetic import synthetic_table
+from modules.calc_tables.Fingerprint import standings_fingerprint
+from modules.common.Groups import players_file
+from modules.core.Standings import Standings
+from record_cassette import project_copy, run_update_all
+from stub_api import StubApi, league_rows
+
+UNCHANGED = "unchanged since the last snapshot"
+
+def test_fingerprint_ignores_players_key_order_but_not_content():
+    table = synthetic_table()
+    players = {"Anna": ["Team 001", "Team 002"], "Ben": ["Team 003"]}
+    reordered = {"Ben": ["Team 003"], "Anna": ["Team 001", "Team 002"]}
+    assert standings_fingerprint(table, players) == standings_fingerprint(table, reordered)
+    assert standings_fingerprint(table, players) == standings_fingerprint(Standings.from_dataframe(table), players)
+    assert standings_fingerprint(table, players) != standings_fingerprint(table, {**players, "Ben": ["Team 004"]})
+
+    table.loc[0, "Next"] = "Team 019"
+    assert standings_fingerprint(table, players) != standings_fingerprint(synthetic_table(), players)
+
+def outputs(root):
+    """mtime_ns of everything a run writes: the snapshots, the fingerprint and table.html."""
+    paths = [os.path.join(root, "table.html"), os.path.join(root, "data", "_meta", "fingerprint.json")]
+    paths += [os.path.join(root, "data", name) for name in os.listdir(os.path.join(root, "data"))
+              if name.endswith(".json")]
+    return {path: os.stat(path).st_mtime_ns for path in paths}
+
+def test_update_all_skips_write_and_render_until_something_changes(tmp_path):
+    root = project_copy(str(tmp_path))
+    with StubApi("ok") as stub:
+        def run():
+            result = run_update_all(root, "off", str(tmp_path / "cassettes"), api_base=stub.base)
+            assert result.returncode == 0, result.stdout + result.stderr
+            return result.stdout
+
+        assert UNCHANGED not in run()
+        written = outputs(root)
+
+        # same standings, same players: no snapshot, no fingerprint, no page
+        assert UNCHANGED in run()
+        assert outputs(root) == written
+
+        stub.rows = league_rows(seed=1)
+        assert UNCHANGED not in run()
+        changed = outputs(root)
+        assert changed.keys() == written.keys()
+        assert all(changed[path] != written[path] for path in written)
+
+        path = players_file(base_path=root)
+        with open(path, "r", encoding="utf-8") as f:
+            players = json.load(f)
+        with open(path, "w", encoding="utf-8") as f:
+            # key order and whitespace only
+            json.dump([dict(reversed(list(player.items()))) for player in players], f, indent=4)
+        assert UNCHANGED in run()
+
+        players[0]["teams"] = players[0]["teams"][1:]
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(players, f)
+        assert UNCHANGED not in run()
+        assert outputs(root)[os.path.join(root, "table.html")] != changed[os.path.join(root, "table.html")]
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+import modules.simulate.MonteCarlo as MC
+
+from benchmarks.synthetic import synthetic_rows
+
+ROWS = synthetic_rows(8, seed=4)
+TEAMS = [r["Team"] for r in ROWS]
+# double round robin: the rest of the season
+SEASON = [{"home": h, "away": a} for h in TEAMS for a in TEAMS if h != a]
+
+def test_fixture_scope_of_the_next_column_fallback_is_next_round():
+    fallback = MC.fixtures_from_next(ROWS)
+    assert fallback and all(f["neutral"] for f in fallback)
+    assert MC.fixture_scope(fallback) == "next_round"
+    assert MC.fixture_scope(SEASON) == "season"
+    assert MC.fixture_scope([]) == "season"
+    assert MC.simulate_teams(ROWS, fallback, n_sims=100)["scope"] == "next_round"
+
+def test_fixtures_from_next_lists_each_pairing_once():
+    rows = [{"Team": "A", "Next": "B"}, {"Team": "B", "Next": "A"}, {"Team": "C", "Next": None}]
+    assert MC.fixtures_from_next(rows) == [{"home": "A", "away": "B", "neutral": True, "next_round": True}]
+
+def test_a_seed_gives_the_same_seasons_with_and_without_a_pool():
+    # several chunks, so the pool really splits the work
+    n_sims = 3 * MC.CHUNK_SIZE - 123
+    serial = MC.simulate_teams(ROWS, SEASON, n_sims, seed=7, workers=None)
+    pooled = MC.simulate_teams(ROWS, SEASON, n_sims, seed=7, workers=2)
+    assert serial["points"].shape == (n_sims, len(TEAMS))
+    for c in ("points", "gd", "gf"):
+        assert np.array_equal(serial[c], pooled[c])
+    assert MC.simulate_teams(ROWS, SEASON, n_sims, seed=8)["points"].tolist() != serial["points"].tolist()
+
+def test_simulated_points_stay_within_the_possible_range():
+    seasons = MC.simulate_teams(ROWS, SEASON, 2_000, seed=1)
+    base = np.array([r["Points"] for r in ROWS])
+    games = 2 * (len(TEAMS) - 1)
+    assert (seasons["points"] >= base).all() and (seasons["points"] <= base + 3 * games).all()
+
+@pytest.fixture
+def counted(monkeypatch):
+    """simulate_teams with a call counter."""
+    calls = []
+    simulate = MC.simulate_teams
+
+    def counting(*args, **kwargs):
+        calls.append(args)
+        return simulate(*args, **kwargs)
+
+    monkeypatch.setattr(MC, "simulate_teams", counting)
+    return calls
+
+def test_cached_team_seasons_reuses_a_matching_key(tmp_path, counted):
+    first = MC.cached_team_seasons(str(tmp_path), ROWS, SEASON, n_sims=500, seed=3)
+    again = MC.cached_team_seasons(str(tmp_path), ROWS, SEASON, n_sims=500, seed=3)
+    assert len(counted) == 1
+    assert again["teams"] == first["teams"] and again["scope"] == first["scope"] == "season"
+    assert np.array_equal(again["points"], first["points"])
+
+@pytest.mark.parametrize("change", [
+    {"seed": 4},
+    {"n_sims": 600},
+    {"fixtures": SEASON[:-1]},
+    {"table_rows": [{**ROWS[0], "Points": ROWS[0]["Points"] + 1}] + ROWS[1:]},
+])
+def test_cached_team_seasons_ignores_a_different_key(tmp_path, counted, change):
+    args = {"table_rows": ROWS, "fixtures": SEASON, "n_sims": 500, "seed": 3}
+    MC.cached_team_seasons(str(tmp_path), **args)
+    changed = MC.cached_team_seasons(str(tmp_path), **{**args, **change})
+    assert len(counted) == 2
+    assert changed["simulations"] == change.get("n_sims", 500) and changed["seed"] == change.get("seed", 3)
+    # and the new run replaced the cache
+    MC.cached_team_seasons(str(tmp_path), **{**args, **change})
+    assert len(counted) == 2
@@ -0,0 +1,31 @@
+import glob
+import os
+
+import pytest
+
+from benchmarks.synthetic import standings_html, synthetic_rows
+from modules.get_data.ParseStandings import parse_standings
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "fixtures")
+PAGES = sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.html")))
+
+def test_there_is_a_saved_page():
+    assert PAGES
+
+@pytest.mark.parametrize("path", PAGES, ids=os.path.basename)
+def test_parsers_agree_on_saved_pages(path):
+    with open(path, "r", encoding="utf-8") as f:
+        html = f.read()
+    rows = parse_standings(html, "lxml")
+    assert rows == parse_standings(html, "bs4")
+    assert len(rows) == 20
+    assert [r["Pos"] for r in rows] == list(range(1, 21))
+
+def test_parsers_agree_on_a_synthetic_page():
+    html = standings_html(synthetic_rows(200))
+    assert parse_standings(html, "lxml") == parse_standings(html, "bs4")
+
+def test_missing_table_raises_for_both():
+    for parser in ("lxml", "bs4"):
+        with pytest.raises(ValueError):
+            parse_standings("<html><body><table></table></body></html>", parser)
@@ -0,0 +1,72 @@
+import json
+import os
+
+from modules.archive.SnapshotCatalog import SnapshotCatalog, catalog_path, get_catalog
+
+def write(data_dir, day, payload):
+    path = os.path.join(data_dir, f"{day}.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(payload, f)
+    return path
+
+def test_catalog_follows_the_directory(tmp_path):
+    data_dir = str(tmp_path)
+    write(data_dir, "2025-08-16", {"summary": [], "players": {}})
+    catalog = get_catalog(data_dir)
+    assert catalog.dates == ["2025-08-16"]
+
+    # a snapshot added behind the catalog's back (e.g. a git pull) is picked up
+    write(data_dir, "2025-08-17", {"summary": [], "players": {"a": []}})
+    assert get_catalog(data_dir).dates == ["2025-08-16", "2025-08-17"]
+
+    # removed, and edited by hand
+    os.remove(os.path.join(data_dir, "2025-08-16.json"))
+    path = write(data_dir, "2025-08-17", {"summary": [], "players": {"a": [], "b": []}})
+    catalog = get_catalog(data_dir)
+    assert catalog.dates == ["2025-08-17"]
+    assert catalog.load()["players"] == {"a": [], "b": []}
+    assert catalog.latest()["size"] == os.path.getsize(path)
+
+    # unchanged directory: no rescan, and the saved catalog matches
+    assert not catalog.refresh()
+    assert SnapshotCatalog(data_dir).snapshots == catalog.snapshots
+
+def test_save_leaves_no_temporary_files(tmp_path):
+    write(str(tmp_path), "2025-08-16", {"summary": [], "players": {}})
+    SnapshotCatalog(str(tmp_path)).save()
+    assert os.listdir(os.path.dirname(catalog_path(str(tmp_path)))) == ["catalog.json"]
+
+def test_same_size_edit_is_rehashed(tmp_path):
+    data_dir = str(tmp_path)
+    path = write(data_dir, "2025-08-16", {"summary": [], "players": {"a": []}})
+    catalog = get_catalog(data_dir)
+    assert catalog.load()["players"] == {"a": []}
+    before = catalog.latest()["sha256"]
+
+    write(data_dir, "2025-08-16", {"summary": [], "players": {"b": []}})
+    os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+    catalog = get_catalog(data_dir)
+    assert catalog.latest()["sha256"] != before
+    assert catalog.load()["players"] == {"b": []}
+
+def test_lookups_skip_the_listing_while_nothing_changed(tmp_path, monkeypatch):
+    import modules.archive.SnapshotCatalog as module
+
+    write(str(tmp_path), "2025-08-16", {"summary": [], "players": {}})
+    catalog = get_catalog(str(tmp_path))
+    listings = []
+    real = module.snapshot_stats
+    monkeypatch.setattr(module, "snapshot_stats", lambda d: listings.append(d) or real(d))
+    for _ in range(5):
+        assert get_catalog(str(tmp_path)) is catalog
+    assert listings == []
+
+    write(str(tmp_path), "2025-08-17", {"summary": [], "players": {}})
+    assert get_catalog(str(tmp_path)).dates == ["2025-08-16", "2025-08-17"]
+    assert len(listings) == 1
+
+def test_read_only_catalog_never_writes(tmp_path):
+    write(str(tmp_path), "2025-08-16", {"summary": [], "players": {}})
+    catalog = SnapshotCatalog(str(tmp_path), read_only=True)
+    assert catalog.dates == ["2025-08-16"]
+    assert not os.path.exists(catalog_path(str(tmp_path)))
@@ -0,0 +1,133 @@
+import random
+
+import pytest
+
+from modules.core.Standings import STAT_COLUMNS, TeamRow
+from modules.core.StandingsEngine import StandingsEngine
+
+TEAMS = ["Arsenal", "Brentford", "Chelsea", "Everton", "Fulham", "Liverpool"]
+
+def row(team, won=0, drawn=0, lost=0, gf=0, ga=0):
+    """Seed row with consistent Played, GD and Points."""
+    return TeamRow(None, team, won + drawn + lost, won, drawn, lost, gf, ga, gf - ga, 3 * won + drawn, None)
+
+def random_results(seed, n=60, teams=TEAMS):
+    rnd = random.Random(seed)
+    results = []
+    for _ in range(n):
+        home, away = rnd.sample(teams, 2)
+        # few goals, so that ties on points, GD and GF are common
+        results.append({"home": home, "away": away, "home_goals": rnd.randint(0, 2), "away_goals": rnd.randint(0, 2)})
+    return results
+
+def recompute(teams, results):
+    """The table from scratch: all results added up, then sorted with the tie-breakers."""
+    stats = {t: dict.fromkeys(STAT_COLUMNS, 0) for t in teams}
+    for r in results:
+        for team, gf, ga in ((r["home"], r["home_goals"], r["away_goals"]), (r["away"], r["away_goals"], r["home_goals"])):
+            s = stats[team]
+            s["Played"] += 1
+            s["Won"] += gf > ga
+            s["Drawn"] += gf == ga
+            s["Lost"] += gf < ga
+            s["GF"] += gf
+            s["GA"] += ga
+            s["GD"] += gf - ga
+            s["Points"] += 3 if gf > ga else 1 if gf == ga else 0
+
+    def level_key(team):
+        return (stats[team]["Points"], stats[team]["GD"], stats[team]["GF"])
+
+    def h2h(team):
+        group = [t for t in teams if level_key(t) == level_key(team)]
+        pts = away = 0
+        for r in results:
+            if r["home"] == team and r["away"] in group:
+                pts += 3 if r["home_goals"] > r["away_goals"] else r["home_goals"] == r["away_goals"]
+            elif r["away"] == team and r["home"] in group:
+                pts += 3 if r["away_goals"] > r["home_goals"] else r["home_goals"] == r["away_goals"]
+                away += r["away_goals"]
+        return pts, away
+
+    order = sorted(teams, key=lambda t: tuple(-v for v in level_key(t) + h2h(t)) + (t,))
+    return [{"Pos": pos, "Team": t, **stats[t]} for pos, t in enumerate(order, start=1)]
+
+def records(engine):
+    return engine.table().records(["Pos", "Team"] + STAT_COLUMNS)
+
+def test_apply_then_revert_gives_back_the_same_table():
+    rnd = random.Random(1)
+    seeded = [row(t, *(rnd.randint(0, 5) for _ in range(5))) for t in TEAMS]
+    players = {"Anna": ["Arsenal", "Chelsea"], "Ben": ["Chelsea", "Fulham", "Liverpool"]}
+    engine = StandingsEngine(seeded, players)
+    before, before_summary = records(engine), engine.player_summary()
+
+    for r in random_results(2, n=20):
+        engine.apply(r["home"], r["away"], r["home_goals"], r["away_goals"])
+        assert records(engine) != before
+        engine.revert(r["home"], r["away"], r["home_goals"], r["away_goals"])
+        assert records(engine) == before
+        assert engine.player_summary() == before_summary
+
+# each case puts Zeta first by the step under test, against the name order
+@pytest.mark.parametrize("alpha, zeta", [
+    (row("Alpha", drawn=2, gf=9), row("Zeta", won=1, lost=1, ga=3)),         # points
+    (row("Alpha", won=1, gf=1), row("Zeta", won=1, gf=2)),                  # goal difference
+    (row("Alpha", won=1, gf=1), row("Zeta", won=1, gf=3, ga=2)),            # goals scored
+])
+def test_points_goal_difference_and_goals_scored(alpha, zeta):
+    assert StandingsEngine([alpha, zeta]).ranking() == ["Zeta", "Alpha"]
+
+def test_ties_on_points_gd_and_gf_go_to_head_to_head_points():
+    # level on points, GD and GF after Zeta beats Alpha: the name alone would put Alpha first
+    engine = StandingsEngine([row("Alpha", won=1, gf=1), row("Zeta", lost=1, ga=1)])
+    engine.apply("Zeta", "Alpha", 1, 0)
+    assert [r.Points for r in engine.table()] == [3, 3]
+    assert engine.ranking() == ["Zeta", "Alpha"]
+
+def test_ties_on_head_to_head_points_go_to_head_to_head_away_goals():
+    engine = StandingsEngine(["Alpha", "Zeta"])
+    engine.apply("Alpha", "Zeta", 2, 2)            # Zeta scores 2 away
+    engine.apply("Zeta", "Alpha", 1, 1)            # Alpha scores 1 away
+    assert engine.ranking() == ["Zeta", "Alpha"]
+
+def test_head_to_head_only_counts_the_level_teams():
+    # Zeta's win over Chelsea must not count in the Alpha-Zeta tie
+    engine = StandingsEngine([row("Alpha", won=2, gf=2), row("Zeta", won=1, gf=1), "Chelsea"])
+    engine.apply("Chelsea", "Zeta", 0, 1)
+    assert engine.ranking() == ["Alpha", "Zeta", "Chelsea"]
+
+def test_full_tie_goes_to_the_name():
+    engine = StandingsEngine(["Zeta", "Alpha", "Mid"])
+    assert engine.ranking() == ["Alpha", "Mid", "Zeta"]
+    engine.apply("Zeta", "Alpha", 1, 1)
+    engine.apply("Alpha", "Zeta", 1, 1)
+    assert engine.ranking() == ["Alpha", "Zeta", "Mid"]
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_a_full_recompute_after_every_result(seed):
+    players = {"Anna": ["Arsenal", "Brentford"], "Ben": ["Everton", "Fulham", "Liverpool"], "Cem": []}
+    engine = StandingsEngine(TEAMS, players)
+    results = random_results(seed)
+    for n, r in enumerate(results, start=1):
+        engine.apply(r["home"], r["away"], r["home_goals"], r["away_goals"])
+        table = recompute(TEAMS, results[:n])
+        assert records(engine) == table
+
+    totals = {row["Team"]: row for row in table}
+    for summary in engine.player_summary():
+        for c in STAT_COLUMNS:
+            assert summary[c] == sum(totals[t][c] for t in players[summary["name"]])
+
+def test_replay_matches_applying_one_by_one():
+    results = random_results(3)
+    one_by_one = StandingsEngine(TEAMS)
+    for r in results:
+        one_by_one.apply(r["home"], r["away"], r["home_goals"], r["away_goals"])
+    replayed = StandingsEngine(TEAMS)
+    assert replayed.replay({k: str(v) for k, v in r.items()} for r in results) == len(results)
+    assert records(replayed) == records(one_by_one)
+
+def test_unknown_team_is_an_error():
+    with pytest.raises(ValueError, match="Unknown team"):
+        StandingsEngine(TEAMS).apply("Arsenal", "Leeds United", 1, 0)
@@ -0,0 +1,151 @@
+import asyncio
+import gzip
+import http.client
+import json
+import os
+import shutil
+import threading
+
+import pytest
+
+from modules.archive.SnapshotCatalog import catalog_path
+from modules.serve.StandingsServer import SnapshotStore, StandingsServer
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DAYS = ["2025-09-03", "2025-09-04", "2025-09-05"]
+
+def make_root(parent, days=DAYS):
+    root = os.path.join(parent, "root")
+    os.makedirs(os.path.join(root, "data"))
+    for day in days:
+        shutil.copy(os.path.join(REPO, "data", f"{day}.json"), os.path.join(root, "data"))
+    return root
+
+@pytest.fixture
+def root(tmp_path):
+    return make_root(str(tmp_path))
+
+@pytest.fixture
+def server(root):
+    """(StandingsServer, port) on a background event loop."""
+    app = StandingsServer(SnapshotStore(base_path=root))
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(asyncio.start_server(app.handle, "127.0.0.1", 0))
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    yield app, server.sockets[0].getsockname()[1]
+
+    async def shutdown():
+        server.close()
+        tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    asyncio.run_coroutine_threadsafe(shutdown(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(5)
+    loop.close()
+
+def get(port, path, method="GET", **headers):
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    conn.request(method, path, headers=headers)
+    response = conn.getresponse()
+    body = response.read()
+    conn.close()
+    return response, body
+
+def test_endpoints(server, root):
+    app, port = server
+    snapshot = app.store.snapshot
+    player = next(iter(snapshot["players"]))
+
+    response, body = get(port, "/healthz")
+    assert response.status == 200 and json.loads(body) == {"ok": True, "latest": DAYS[-1]}
+    assert json.loads(get(port, "/api/summary")[1]) == snapshot["summary"]
+    assert json.loads(get(port, "/api/players")[1]) == list(snapshot["players"])
+    assert json.loads(get(port, f"/api/players/{player}")[1]) == snapshot["players"][player]
+
+    entries = json.loads(get(port, f"/api/snapshots?from={DAYS[1]}&to={DAYS[1]}")[1])
+    assert [e["date"] for e in entries] == [DAYS[1]]
+    assert [e["date"] for e in json.loads(get(port, "/api/snapshots")[1])] == DAYS
+    with open(os.path.join(root, "data", f"{DAYS[0]}.json"), encoding="utf-8") as f:
+        assert json.loads(get(port, f"/api/snapshots/{DAYS[0]}")[1]) == json.load(f)
+
+    response, body = get(port, "/")
+    assert response.status == 200 and response.getheader("Content-Type").startswith("text/html")
+    assert player in body.decode("utf-8")
+    response, body = get(port, f"/players/{player}")
+    assert response.status == 200 and b'<details class="player" open>' in body
+
+    for path in ("/api/players/Nobody", "/players/Nobody", "/api/snapshots/2024-01-01", "/api/history", "/nope"):
+        response, body = get(port, path)
+        assert response.status == 404 and "error" in json.loads(body), path
+    assert get(port, "/healthz", method="POST")[0].status == 405
+    response, body = get(port, "/healthz", method="HEAD")
+    assert response.status == 200 and body == b""
+
+def test_etag_and_if_none_match(server):
+    _, port = server
+    response, body = get(port, "/api/summary")
+    etag = response.getheader("ETag")
+    assert response.status == 200 and etag
+
+    response, empty = get(port, "/api/summary", **{"If-None-Match": etag})
+    assert response.status == 304 and empty == b""
+    assert response.getheader("ETag") == etag
+    response, _ = get(port, "/api/summary", **{"If-None-Match": f'"other", {etag}'})
+    assert response.status == 304
+    response, again = get(port, "/api/summary", **{"If-None-Match": '"other"'})
+    assert response.status == 200 and again == body
+
+    # the gzipped variant has its own tag; a 304 never answers an error
+    response, zipped = get(port, "/", **{"Accept-Encoding": "gzip"})
+    assert response.getheader("Content-Encoding") == "gzip" and response.getheader("ETag").endswith('-gz"')
+    assert gzip.decompress(zipped) == get(port, "/")[1]
+    response, _ = get(port, "/nope")
+    assert get(port, "/nope", **{"If-None-Match": response.getheader("ETag")})[0].status == 404
+
+def test_keep_alive_serves_several_requests_on_one_connection(server):
+    _, port = server
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    for path in ("/healthz", "/api/players", "/healthz"):
+        conn.request("GET", path)
+        response = conn.getresponse()
+        assert response.status == 200
+        response.read()
+    conn.close()
+
+def test_store_never_writes_the_catalog(root):
+    os.makedirs(os.path.dirname(catalog_path(os.path.join(root, "data"))))
+    store = SnapshotStore(base_path=root)
+    assert store.latest["date"] == DAYS[-1]
+    assert not os.path.exists(catalog_path(store.data_dir))
+    store.reload()
+    assert not os.path.exists(catalog_path(store.data_dir))
+
+def test_a_snapshot_added_without_a_catalog_update_is_picked_up(root):
+    data_dir = os.path.join(root, "data")
+    # an old mtime, so the new file changes it even on coarse filesystem clocks
+    os.utime(data_dir, ns=(0, 0))
+    store = SnapshotStore(base_path=root)
+    assert not store.changed()
+
+    shutil.copy(os.path.join(REPO, "data", "2025-09-06.json"), data_dir)
+    assert store.changed()
+    store.reload()
+    assert not store.changed()
+    assert store.latest["date"] == "2025-09-06"
+
+def test_history_endpoint(root):
+    series = {"dates": DAYS, "players": {"Anna": {"position": [2, 1, 1], "Points": [3, 6, 7]},
+                                         "Ben": {"position": [1, 2, 2], "Points": [4, 4, 5]}}}
+    os.makedirs(os.path.join(root, "archive"))
+    with open(os.path.join(root, "archive", "series.json"), "w", encoding="utf-8") as f:
+        json.dump(series, f)
+    app = StandingsServer(SnapshotStore(base_path=root, history=True))
+
+    status, _, body, _, _ = app.response_for(f"/api/history?from={DAYS[1]}&player=Anna", False)
+    assert status == 200
+    assert json.loads(body) == {"dates": DAYS[1:], "players": {"Anna": {"position": [1, 1], "Points": [6, 7]}}}
+    assert app.response_for("/api/history?player=Nobody", False)[0] == 404
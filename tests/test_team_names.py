@@ -0,0 +1,56 @@
+import glob
+import json
+import os
+
+import pytest
+
+import stub_api
+
+from modules.calc_tables.Fingerprint import standings_fingerprint
+from modules.get_data.FetchOrchestrator import api_source, static_page_source
+from modules.get_data.ParseStandings import parse_standings
+from modules.get_data.TeamNames import TEAMS, canonical_rows, team_name
+from stub_api import StubApi
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def test_every_players_file_team_is_a_known_club():
+    for path in glob.glob(os.path.join(REPO, "players", "*.json")):
+        with open(path, "r", encoding="utf-8") as f:
+            for player in json.load(f):
+                assert {t["name"] for t in player["teams"]} <= set(TEAMS), path
+
+def test_recorded_api_answer_maps_onto_the_players_spelling():
+    names = {team_name(e["team"]["name"]) for e in stub_api.RECORDED["tables"][0]["entries"]}
+    assert names == set(TEAMS)
+    assert team_name("Brighton & Hove Albion") == team_name("BHA") == "Brighton and Hove Albion"
+
+def test_unknown_team_fails_loudly():
+    with pytest.raises(ValueError, match="Unknown team 'Ipswich Town'"):
+        team_name("Ipswich Town")
+    with pytest.raises(ValueError, match="from the page"):
+        canonical_rows([{"Team": "Arsenal", "Next": "Ipswich Town"}])
+    # rows without a name are Standings.from_records' business
+    assert canonical_rows([{"Team": None, "Next": None}]) == [{"Team": None, "Next": None}]
+
+def test_saved_page_maps_badges_and_short_names():
+    with open(os.path.join(REPO, "benchmarks", "fixtures", "standings-2025-10.html"), encoding="utf-8") as f:
+        rows = canonical_rows(parse_standings(f.read()))
+    assert {r["Team"] for r in rows} == set(TEAMS)
+    assert {r["Next"] for r in rows if r["Next"]} <= set(TEAMS)
+
+def test_api_and_page_give_the_same_table_and_fingerprint():
+    with StubApi("ok") as stub:
+        api = api_source(stub.base)(10)
+        page = static_page_source(stub.tables_url)(10)
+    # both stub sources spell clubs like pulselive, not like players/*.json
+    assert "Brighton & Hove Albion" in {r["Team"] for r in stub_api.page_rows(stub.rows)}
+    assert api == page
+    assert all(api.team(r["Team"]).Next == r["Next"] for r in stub.rows)
+    assert standings_fingerprint(api, []) == standings_fingerprint(page, [])
+
+def test_api_source_rejects_an_unknown_team(monkeypatch):
+    entry = stub_api.RECORDED_ENTRIES["Burnley"]
+    monkeypatch.setitem(stub_api.RECORDED_ENTRIES, "Burnley", {**entry, "team": {**entry["team"], "name": "Burnley FC"}})
+    with StubApi("ok") as stub, pytest.raises(ValueError, match="Unknown team 'Burnley FC'"):
+        api_source(stub.base)(10)
@@ -0,0 +1,66 @@
+import itertools
+import random
+
+import pytest
+
+from modules.simulate.TitleRace import HOME_POINTS, AWAY_POINTS, SEASON_GAMES, solve_title_race
+
+def small_league(seed):
+    """A few teams, players and remaining fixtures, with no byes (Played + fixtures = a full season)."""
+    rnd = random.Random(seed)
+    teams = [f"T{i}" for i in range(rnd.randint(3, 6))]
+    fixtures = []
+    for _ in range(rnd.randint(1, 6)):
+        home, away = rnd.sample(teams, 2)
+        fixtures.append({"home": home, "away": away})
+    left = {t: sum(t in (f["home"], f["away"]) for f in fixtures) for t in teams}
+    rows = [{"Team": t, "Played": SEASON_GAMES - left[t], "Points": rnd.randint(0, 8)} for t in teams]
+    players = {f"P{p}": rnd.sample(teams, rnd.randint(1, min(3, len(teams)))) for p in range(rnd.randint(2, 5))}
+    return rows, players, fixtures
+
+def brute_force(rows, players, fixtures):
+    """Status of every player over all 3^fixtures outcomes."""
+    finals = []
+    for outcome in itertools.product(range(3), repeat=len(fixtures)):
+        points = {r["Team"]: r["Points"] for r in rows}
+        for f, o in zip(fixtures, outcome):
+            points[f["home"]] += HOME_POINTS[o]
+            points[f["away"]] += AWAY_POINTS[o]
+        finals.append({p: sum(points[t] for t in set(teams)) for p, teams in players.items()})
+
+    status = {}
+    for p in players:
+        ahead = [all(total[p] > total[q] for q in players if q != p) for total in finals]
+        level = [all(total[p] >= total[q] for q in players if q != p) for total in finals]
+        status[p] = "clinched" if all(ahead) else "alive" if any(level) else "eliminated"
+    return status
+
+@pytest.mark.parametrize("seed", range(300))
+def test_matches_brute_force(seed):
+    rows, players, fixtures = small_league(seed)
+    assert solve_title_race(rows, players, fixtures) == brute_force(rows, players, fixtures)
+
+def close_race(seed, n_players=200, rounds=2):
+    """Twenty teams within a few points of each other, a few rounds left: players the bounds cannot decide."""
+    rnd = random.Random(seed)
+    teams = [f"T{i:02d}" for i in range(20)]
+    rows = [{"Team": t, "Played": SEASON_GAMES - rounds, "Points": rnd.randint(40, 46)} for t in teams]
+    fixtures = []
+    for _ in range(rounds):
+        rnd.shuffle(teams)
+        fixtures += [{"home": teams[i], "away": teams[i + 1]} for i in range(0, 20, 2)]
+    players = {f"P{p}": rnd.sample(teams, 5) for p in range(n_players)}
+    return rows, players, fixtures
+
+def test_out_of_budget_is_undecided_never_guessed():
+    undecided = 0
+    for seed in range(3):
+        rows, players, fixtures = close_race(seed)
+        exact = solve_title_race(rows, players, fixtures)
+        assert "undecided" not in exact.values()
+        for player, status in solve_title_race(rows, players, fixtures, node_budget=0).items():
+            if status == "undecided":
+                undecided += 1
+            else:
+                assert status == exact[player]
+    assert undecided > 0